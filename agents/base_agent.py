@@ -1,23 +1,277 @@
 """Base agent class for all specialized agents."""
-import json
+import asyncio
+import bisect
+import functools
+import hashlib
 import logging
+import re
+import string
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Optional
 
+import anthropic
+import orjson
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 from config.settings import settings
-from models.agent_opinion import AgentOpinion, AgentType, Sentiment
+from models.agent_opinion import AgentOpinion, AgentType, RiskLevel, Sentiment
 
 logger = logging.getLogger(__name__)
 
+# Transient provider failures worth retrying; anything else surfaces.
+_RETRYABLE_ERRORS = (
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+)
+
+# One semaphore per event loop capping in-flight LLM requests, so gather
+# fan-outs stay under provider rate limits instead of triggering 429 storms.
+# Keyed weakly by loop: Streamlit re-runs create fresh loops.
+_LOOP_SEMAPHORES: "weakref.WeakKeyDictionary[Any, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+
+def _request_semaphore() -> asyncio.Semaphore:
+    """Get the in-flight request semaphore for the running loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _LOOP_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(settings.max_concurrency)
+        _LOOP_SEMAPHORES[loop] = semaphore
+    return semaphore
+
+# Process-wide LLM client pool. Sharing clients keeps the underlying HTTP
+# connection pool (keep-alive, TLS session) alive across agent instances
+# instead of re-handshaking per agent.
+_LLM_POOL: dict[tuple, Any] = {}
+
+# Process-wide LRU of exact prompt→response hits. Intraday re-runs and
+# what-if scenarios on the same ticker re-issue identical prompts; an exact
+# hash hit skips the LLM round-trip entirely.
+_RESPONSE_CACHE: OrderedDict[bytes, str] = OrderedDict()
+_RESPONSE_CACHE_MAX = 512
+
+# Static instruction blocks shared across calls. Keeping these byte-stable and
+# in the (cache_control-marked) system segment lets the Anthropic prompt cache
+# reuse the prefill instead of reprocessing it on every call.
+_COUNTER_RESPONSE_INSTRUCTIONS = """You are responding to a counter-argument raised against your analysis.
+
+Please provide:
+1. Your response to this counter-argument
+2. Whether you acknowledge any valid points
+3. If the counter-argument changes your assessment, provide an adjusted score (1-10)
+4. Any risks you now acknowledge that weren't in your original analysis
+
+Respond in JSON format:
+{
+    "response": "your detailed response",
+    "valid_points_acknowledged": ["list of valid points you acknowledge"],
+    "adjusted_score": null or number,
+    "newly_acknowledged_risks": ["list of risks"]
+}"""
+
+_REBUT_TEMPLATE = string.Template("""## 당신의 원래 분석
+- 점수: $score/10
+- 요약: $summary
+- 핵심 포인트: $key_points
+
+## Devil's Advocate의 도전
+$challenge
+
+### 도전 근거
+$evidence
+
+### 심각도: $severity""")
+
+_REBUT_INSTRUCTIONS = """당신은 투자위원회에서 자신의 분석을 방어해야 합니다.
+
+당신은 30년 경력의 전문 애널리스트입니다.
+도전에 대해 논리적으로 반박하거나, 타당한 지적이라면 솔직히 인정하세요.
+
+다음 JSON 형식으로 응답하세요:
+{
+    "defense": "당신의 방어 논리 (구체적이고 데이터 기반으로)",
+    "adjusted_score": null 또는 1-10 사이의 숫자 (도전이 타당하다면 조정),
+    "acknowledged_risks": ["인정하는 리스크 목록"],
+    "counter_evidence": ["당신의 입장을 지지하는 증거"],
+    "confidence_after_debate": 0-100 사이의 숫자,
+    "final_stance": "maintain" 또는 "partially_concede" 또는 "fully_concede"
+}"""
+
+
+@functools.lru_cache(maxsize=64)
+def _load_prompt_cached(prompt_file: Optional[str], agent_type_value: str) -> Optional[str]:
+    """Load a prompt file once per process, shared across agent instances.
+
+    Returns None when no prompt file exists so the caller can fall back to
+    the agent's default prompt.
+    """
+    # Read directly and catch the miss: one open() syscall instead of
+    # a stat() probe followed by open()
+    if prompt_file:
+        try:
+            return Path(prompt_file).read_text(encoding="utf-8")
+        except (FileNotFoundError, IsADirectoryError):
+            pass
+
+    try:
+        return (Path("prompts") / f"{agent_type_value}.md").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def _dumps(obj: Any, pretty: bool = False) -> str:
+    """Serialize to JSON with orjson (much faster than stdlib json on large contexts).
+
+    Compact by default: prompt JSON is consumed by the LLM, which charges
+    per token, and indentation is ~30% of the byte count on nested
+    structures. Pass pretty=True only for human-facing output.
+    """
+    option = orjson.OPT_INDENT_2 if pretty else 0
+    return orjson.dumps(obj, default=str, option=option).decode()
+
+
+def _round_floats(obj: Any, ndigits: int = 4) -> Any:
+    """Round floats recursively before prompt serialization.
+
+    yfinance payloads carry full-precision floats (15+ digits); four
+    decimals are more than the LLM can use, and the shorter literals
+    noticeably cut prompt tokens on numeric-heavy blocks.
+    """
+    if isinstance(obj, float):
+        return round(obj, ndigits)
+    if isinstance(obj, dict):
+        return {key: _round_floats(value, ndigits) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_round_floats(value, ndigits) for value in obj]
+    return obj
+
+
+_JSON_FENCE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+
+# Score→sentiment mapping as sorted thresholds; one C-level bisect replaces
+# the 5-way if/elif ladder. Boundaries match the original ladder exactly.
+_SENTIMENT_THRESHOLDS = (3.0, 4.5, 6.5, 8.0)
+_SENTIMENT_ORDER = (
+    Sentiment.VERY_BEARISH,
+    Sentiment.BEARISH,
+    Sentiment.NEUTRAL,
+    Sentiment.BULLISH,
+    Sentiment.VERY_BULLISH,
+)
+
+
+def _sentiment_for_score(score: float) -> Sentiment:
+    """Map a 1-10 score to a Sentiment."""
+    return _SENTIMENT_ORDER[bisect.bisect_right(_SENTIMENT_THRESHOLDS, score)]
+
+_CONTEXT_TEMPLATE = """Context:
+```json
+%s
+```
+
+%s"""
+
+
+def _extract_json(text: str) -> Any:
+    """Parse JSON from an LLM response.
+
+    Tries the whole response first (the common case), then a fenced
+    ```json block, then a bracket-depth scan for an embedded JSON body
+    with an unfenced preamble. Raises orjson.JSONDecodeError when none
+    of these yield valid JSON.
+    """
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        pass
+    match = _JSON_FENCE.search(text)
+    if match:
+        return orjson.loads(match.group(1))
+    stream = _JsonStreamFilter()
+    stream.feed(text)
+    if stream.done:
+        return orjson.loads(stream.text())
+    return orjson.loads(text)  # re-raise with the original payload
+
+
+class _JsonStreamFilter:
+    """Incrementally isolate the JSON body of a streamed LLM response.
+
+    Skips any preamble or ```json fence until the first `{`/`[`, then tracks
+    string/escape state and bracket depth chunk by chunk. The boundary is
+    known the moment the closing bracket arrives, so callers can stop
+    consuming the stream without waiting for trailing fence tokens or
+    re-scanning the full response afterwards.
+    """
+
+    __slots__ = ("_parts", "_depth", "_in_string", "_escaped", "_started", "done")
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._started = False
+        self.done = False
+
+    def feed(self, chunk: str) -> None:
+        """Consume one stream chunk; sets `done` once the JSON body closes."""
+        if self.done:
+            return
+        start = 0
+        if not self._started:
+            for i, ch in enumerate(chunk):
+                if ch in "{[":
+                    self._started = True
+                    start = i
+                    break
+            else:
+                return
+        for i in range(start, len(chunk)):
+            ch = chunk[i]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._parts.append(chunk[start:i + 1])
+                    self.done = True
+                    return
+        self._parts.append(chunk[start:])
+
+    def text(self) -> str:
+        """Return the JSON body collected so far."""
+        return "".join(self._parts)
+
 
 class AgentConfig(BaseModel):
     """Configuration for an agent."""
+    # Frozen: configs are read-only after construction, and immutability
+    # keeps them safely shareable across agents (and hashable for pooling)
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     agent_type: AgentType = Field(..., description="Type of agent")
     model_name: str = Field(
         default=settings.default_model,
@@ -31,6 +285,17 @@ class AgentConfig(BaseModel):
 class BaseAgent(ABC):
     """Base class for all analysis agents."""
 
+    # No per-instance __dict__ at this level: thousands of ticker-scoped
+    # agents are cheap to hold. Subclasses that add state get their own dict.
+    __slots__ = (
+        "config",
+        "tools",
+        "_llm",
+        "_system_prompt",
+        "_system_message",
+        "_system_message_cache",
+    )
+
     def __init__(
         self,
         config: AgentConfig,
@@ -45,7 +310,19 @@ class BaseAgent(ABC):
         self.config = config
         self.tools = tools or []
         self._llm: Optional[ChatAnthropic] = None
-        self._system_prompt: Optional[str] = None
+        # Warm the prompt here so the first invoke does no disk I/O, and
+        # build the SystemMessage once instead of per call
+        self._system_prompt: Optional[str] = self._load_system_prompt()
+        self._system_message = SystemMessage(
+            content=[
+                {
+                    "type": "text",
+                    "text": self._system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        )
+        self._system_message_cache: dict[str, SystemMessage] = {}
 
     @property
     def agent_type(self) -> AgentType:
@@ -54,16 +331,44 @@ class BaseAgent(ABC):
 
     @property
     def llm(self) -> ChatAnthropic:
-        """Get or create LLM instance."""
+        """Get or create LLM instance (shared across agents with the same config).
+
+        Connection reuse: langchain-anthropic caches the underlying httpx
+        AsyncClient per (base_url, timeout), so every instance built here —
+        regardless of temperature/max_tokens — rides one shared TCP+TLS
+        connection pool. Concurrent gather fan-outs therefore multiplex over
+        kept-alive connections instead of paying a handshake per call. Do not
+        pass per-agent base URLs or timeouts here without a reason: each
+        distinct combination opens a separate pool.
+        """
         if self._llm is None:
-            self._llm = ChatAnthropic(
-                model=self.config.model_name,
-                temperature=self.config.temperature,
-                max_tokens=self.config.max_tokens,
-                api_key=settings.anthropic_api_key,
+            key = (
+                self.config.model_name,
+                self.config.temperature,
+                self.config.max_tokens,
+                tuple(sorted(t.name for t in self.tools)),
             )
-            if self.tools:
-                self._llm = self._llm.bind_tools(self.tools)
+            llm = _LLM_POOL.get(key)
+            if llm is None:
+                llm = ChatAnthropic(
+                    model=self.config.model_name,
+                    temperature=self.config.temperature,
+                    max_tokens=self.config.max_tokens,
+                    api_key=settings.anthropic_api_key,
+                    default_headers={"anthropic-beta": "prompt-caching-2024-07-31"},
+                    # Uniform timeout keeps the client-cache key identical for
+                    # every agent, preserving the single shared connection
+                    # pool, while bounding hung requests to the configured cap
+                    default_request_timeout=settings.agent_timeout_seconds,
+                    # Retries are handled by the tenacity layer in
+                    # _ainvoke_resilient; SDK-internal retries would stack
+                    # multiplicatively with it
+                    max_retries=0,
+                )
+                if self.tools:
+                    llm = llm.bind_tools(self.tools)
+                _LLM_POOL[key] = llm
+            self._llm = llm
         return self._llm
 
     @property
@@ -75,19 +380,36 @@ class BaseAgent(ABC):
 
     def _load_system_prompt(self) -> str:
         """Load system prompt from file or return default."""
-        if self.config.prompt_file:
-            prompt_path = Path(self.config.prompt_file)
-            if prompt_path.exists():
-                return prompt_path.read_text(encoding="utf-8")
-
-        # Try loading from prompts directory
-        prompt_file = Path("prompts") / f"{self.config.agent_type.value}.md"
-        if prompt_file.exists():
-            return prompt_file.read_text(encoding="utf-8")
+        cached = _load_prompt_cached(
+            self.config.prompt_file,
+            self.config.agent_type.value,
+        )
+        if cached is not None:
+            return cached
 
         # Return default prompt
         return self._get_default_prompt()
 
+    @classmethod
+    async def prewarm(
+        cls,
+        agent_types: list[AgentType],
+        agents: Optional[list["BaseAgent"]] = None,
+    ) -> None:
+        """Warm the prompt-file cache off the event loop.
+
+        Call `await BaseAgent.prewarm([...])` at application startup so no
+        agent's first invoke blocks the loop on disk I/O. Passing `agents`
+        additionally builds their pooled LLM clients (and with them the
+        shared httpx connection pool) before the first real request.
+        """
+        await asyncio.gather(*(
+            asyncio.to_thread(_load_prompt_cached, None, agent_type.value)
+            for agent_type in agent_types
+        ))
+        for agent in agents or ():
+            agent.llm  # noqa: B018 - builds the pooled client as a side effect
+
     @abstractmethod
     def _get_default_prompt(self) -> str:
         """Get default system prompt for this agent type."""
@@ -105,32 +427,284 @@ class BaseAgent(ABC):
         """
         pass
 
+    async def analyze_batch(
+        self,
+        contexts: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Analyze several tickers concurrently with this agent.
+
+        Running a watchlist through one agent costs max() instead of sum()
+        of the per-ticker latencies: the gathered calls share the pooled
+        client connections and the per-loop concurrency semaphore already
+        bounds how many LLM requests are in flight.
+
+        Args:
+            contexts: Analysis contexts, one per ticker
+
+        Returns:
+            Analysis results in input order; a raised context yields the
+            standard {"error": ..., "analysis": None} shape instead
+        """
+        results = await asyncio.gather(
+            *(self.analyze(context) for context in contexts),
+            return_exceptions=True,
+        )
+        return [
+            result if not isinstance(result, BaseException)
+            else {"error": str(result), "analysis": None}
+            for result in results
+        ]
+
+    @staticmethod
+    async def _ainvoke_resilient(llm: Any, messages: list) -> Any:
+        """Invoke with bounded concurrency and jittered-backoff retry.
+
+        Only transient provider failures (rate limit, connection, 5xx) are
+        retried, so one flaky call re-submits itself without stalling its
+        gather siblings. The semaphore is acquired inside the retry loop:
+        a call sleeping through backoff does not hold an in-flight slot.
+        """
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+            wait=wait_exponential_jitter(initial=1, max=30),
+            stop=stop_after_attempt(4),
+            reraise=True,
+        ):
+            with attempt:
+                async with _request_semaphore():
+                    return await llm.ainvoke(messages)
+
+    def _llm_with_cap(self, max_tokens: Optional[int]):
+        """Return the pooled LLM, optionally bound to a per-call output cap.
+
+        A tight cap sized to the expected JSON schema cuts server decode
+        time linearly and guards against runaway prose.
+        """
+        if max_tokens is None:
+            return self.llm
+        return self.llm.bind(max_tokens=max_tokens)
+
     async def invoke(
         self,
         user_message: str,
         context: Optional[dict[str, Any]] = None,
+        instructions: Optional[str] = None,
+        max_tokens: Optional[int] = None,
     ) -> str:
         """Invoke the LLM with a message.
 
+        The system prompt (and optional static instructions) are sent as
+        cache_control-marked blocks so the provider can reuse the prefilled
+        prefix across calls; only the user message varies per call.
+
         Args:
             user_message: User message/query
             context: Optional additional context
+            instructions: Optional static instruction block appended to the
+                system prompt (should be identical across calls to cache well)
+            max_tokens: Optional per-call output-token cap overriding the
+                agent config default
 
         Returns:
             LLM response text
         """
+        human_content = (
+            user_message if not context
+            else self._build_user_message(user_message, context)
+        )
+
+        cache_key = hashlib.blake2b(
+            f"{self.agent_type.value}|{self.system_prompt}|{instructions or ''}|{max_tokens or 0}|{human_content}".encode(),
+            digest_size=16,
+        ).digest()
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None:
+            _RESPONSE_CACHE.move_to_end(cache_key)
+            return cached
+
         messages = [
-            SystemMessage(content=self.system_prompt),
-            HumanMessage(content=self._build_user_message(user_message, context)),
+            self._system_message_for(instructions),
+            HumanMessage(content=human_content),
         ]
 
         try:
-            response = await self.llm.ainvoke(messages)
-            return response.content
+            response = await self._ainvoke_resilient(
+                self._llm_with_cap(max_tokens), messages
+            )
         except Exception as e:
             logger.error(f"Error invoking LLM for {self.agent_type}: {e}")
             raise
 
+        _RESPONSE_CACHE[cache_key] = response.content
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.popitem(last=False)
+        return response.content
+
+    async def invoke_stream(
+        self,
+        user_message: str,
+        context: Optional[dict[str, Any]] = None,
+        instructions: Optional[str] = None,
+    ):
+        """Invoke the LLM and yield response text chunks as they arrive.
+
+        Cuts time-to-first-token for long responses; callers that need the
+        full text can join the chunks.
+
+        Args:
+            user_message: User message/query
+            context: Optional additional context
+            instructions: Optional static instruction block, as in `invoke`
+
+        Yields:
+            Response text chunks
+        """
+        messages = [
+            self._system_message_for(instructions),
+            HumanMessage(
+                content=user_message if not context
+                else self._build_user_message(user_message, context)
+            ),
+        ]
+
+        try:
+            async for chunk in self.llm.astream(messages):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            logger.error(f"Error streaming LLM for {self.agent_type}: {e}")
+            raise
+
+    async def invoke_json(
+        self,
+        user_message: str,
+        context: Optional[dict[str, Any]] = None,
+        instructions: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Stream the LLM response and parse its JSON body incrementally.
+
+        Overlaps network decode with parsing and stops reading as soon as
+        the top-level JSON object closes, instead of waiting for trailing
+        fence tokens and then re-scanning the full text.
+
+        Args:
+            user_message: User message/query
+            context: Optional additional context
+            instructions: Optional static instruction block, as in `invoke`
+
+        Returns:
+            Parsed JSON dict, or this agent's fallback shape on failure
+        """
+        json_filter = _JsonStreamFilter()
+        raw_chunks: list[str] = []
+        async for chunk in self.invoke_stream(user_message, context, instructions):
+            raw_chunks.append(chunk)
+            json_filter.feed(chunk)
+            if json_filter.done:
+                break
+
+        if json_filter.done:
+            try:
+                return orjson.loads(json_filter.text())
+            except orjson.JSONDecodeError:
+                pass
+        return self._parse_json_response("".join(raw_chunks))
+
+    async def invoke_batch(
+        self,
+        prompts: list[str],
+        instructions: Optional[str] = None,
+        return_exceptions: bool = False,
+        max_tokens: Optional[int] = None,
+    ) -> list:
+        """Submit several plain prompts as one batched LLM call.
+
+        All requests share one pooled client connection, so N round-trips
+        collapse into one multiplexed batch with bounded concurrency.
+
+        Args:
+            prompts: User prompts, one request each
+            instructions: Optional static instruction block, as in `invoke`
+            return_exceptions: When True, per-prompt failures are returned
+                as Exception objects in place of the response text
+            max_tokens: Optional per-call output-token cap, as in `invoke`
+
+        Returns:
+            Response texts (or Exceptions) in prompt order
+        """
+        system_message = self._system_message_for(instructions)
+        batched_messages = [
+            [system_message, HumanMessage(content=prompt)]
+            for prompt in prompts
+        ]
+
+        responses = await self._llm_with_cap(max_tokens).abatch(
+            batched_messages,
+            config={"max_concurrency": settings.max_concurrency},
+            return_exceptions=return_exceptions,
+        )
+        return [r if isinstance(r, Exception) else r.content for r in responses]
+
+    async def ainvoke_many(
+        self,
+        requests: list[tuple[str, Optional[dict[str, Any]]]],
+        instructions: Optional[str] = None,
+    ) -> list[str]:
+        """Invoke the LLM for several prompts in one batched call.
+
+        Turns N serial round-trips into one `.abatch` call with bounded
+        concurrency, letting sibling requests overlap on the wire and share
+        the cached prompt prefix.
+
+        Args:
+            requests: List of (user_message, context) pairs
+            instructions: Optional static instruction block, as in `invoke`
+
+        Returns:
+            LLM response texts, in request order
+        """
+        system_message = self._system_message_for(instructions)
+        batched_messages = [
+            [
+                system_message,
+                HumanMessage(
+                    content=message if not context
+                    else self._build_user_message(message, context)
+                ),
+            ]
+            for message, context in requests
+        ]
+
+        try:
+            responses = await self.llm.abatch(
+                batched_messages,
+                config={"max_concurrency": settings.max_concurrency},
+            )
+            return [r.content for r in responses]
+        except Exception as e:
+            logger.error(f"Error batch-invoking LLM for {self.agent_type}: {e}")
+            raise
+
+    def _system_message_for(self, instructions: Optional[str]) -> SystemMessage:
+        """Get the (cached) system message, optionally with a static instruction block."""
+        if not instructions:
+            return self._system_message
+
+        cached = self._system_message_cache.get(instructions)
+        if cached is None:
+            cached = SystemMessage(
+                content=self._system_message.content
+                + [
+                    {
+                        "type": "text",
+                        "text": instructions,
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ]
+            )
+            self._system_message_cache[instructions] = cached
+        return cached
+
     def _build_user_message(
         self,
         message: str,
@@ -148,13 +722,34 @@ class BaseAgent(ABC):
         if not context:
             return message
 
-        context_str = json.dumps(context, indent=2, default=str, ensure_ascii=False)
-        return f"""Context:
-```json
-{context_str}
-```
+        return _CONTEXT_TEMPLATE % (_dumps(context), message)
+
+    def _parse_json_response(self, response: str) -> dict[str, Any]:
+        """Parse JSON from an LLM response.
+
+        Falls back to a neutral opinion-shaped dict so the analysis
+        pipeline degrades gracefully on an unparseable response.
+        Subclasses override this when they need a different fallback shape.
+        """
+        try:
+            return _extract_json(response)
+        except orjson.JSONDecodeError:
+            return {
+                "score": 5,
+                "confidence": 50,
+                "sentiment": "neutral",
+                "summary": response[:200],
+                "key_points": [],
+                "concerns": [],
+            }
 
-{message}"""
+    def _map_sentiment(self, sentiment_str: Any) -> Sentiment:
+        """Map string sentiment to Sentiment enum."""
+        return Sentiment.from_str(sentiment_str)
+
+    def _map_risk_level(self, risk_str: Any) -> RiskLevel:
+        """Map string risk level to RiskLevel enum."""
+        return RiskLevel.from_str(risk_str)
 
     def create_opinion(
         self,
@@ -180,24 +775,12 @@ class BaseAgent(ABC):
         Returns:
             AgentOpinion instance
         """
-        # Determine sentiment from score
-        if score >= 8:
-            sentiment = Sentiment.VERY_BULLISH
-        elif score >= 6.5:
-            sentiment = Sentiment.BULLISH
-        elif score >= 4.5:
-            sentiment = Sentiment.NEUTRAL
-        elif score >= 3:
-            sentiment = Sentiment.BEARISH
-        else:
-            sentiment = Sentiment.VERY_BEARISH
-
         return AgentOpinion(
             agent_type=self.agent_type,
             ticker=ticker,
             score=score,
             confidence=confidence,
-            sentiment=sentiment,
+            sentiment=_sentiment_for_score(score),
             summary=summary,
             key_points=key_points,
             concerns=concerns,
@@ -218,32 +801,25 @@ class BaseAgent(ABC):
         Returns:
             Response with potential score adjustment
         """
-        prompt = f"""You are responding to a counter-argument raised against your analysis.
+        # Trivial challenges don't warrant an LLM round-trip
+        if len(counter_argument) < 80:
+            return {
+                "response": "Original analysis maintained — counter-argument too brief to change the assessment.",
+                "valid_points_acknowledged": [],
+                "adjusted_score": None,
+                "newly_acknowledged_risks": [],
+            }
 
-Original Analysis Summary:
-{json.dumps(original_analysis, indent=2, default=str, ensure_ascii=False)}
+        prompt = f"""Original Analysis Summary:
+{_dumps(original_analysis)}
 
 Counter-Argument:
-{counter_argument}
-
-Please provide:
-1. Your response to this counter-argument
-2. Whether you acknowledge any valid points
-3. If the counter-argument changes your assessment, provide an adjusted score (1-10)
-4. Any risks you now acknowledge that weren't in your original analysis
-
-Respond in JSON format:
-{{
-    "response": "your detailed response",
-    "valid_points_acknowledged": ["list of valid points you acknowledge"],
-    "adjusted_score": null or number,
-    "newly_acknowledged_risks": ["list of risks"]
-}}"""
+{counter_argument}"""
 
-        response = await self.invoke(prompt)
+        response = await self.invoke(prompt, instructions=_COUNTER_RESPONSE_INSTRUCTIONS)
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
             return {
                 "response": response,
                 "valid_points_acknowledged": [],
@@ -277,49 +853,31 @@ Respond in JSON format:
         evidence = context.get("challenge_evidence", [])
         severity = context.get("severity", "medium")
 
-        prompt = f"""당신은 투자위원회에서 자신의 분석을 방어해야 합니다.
-
-## 당신의 원래 분석
-- 점수: {original.get('score', 'N/A')}/10
-- 요약: {original.get('summary', 'N/A')}
-- 핵심 포인트: {original.get('key_points', [])}
-
-## Devil's Advocate의 도전
-{challenge}
-
-### 도전 근거
-{json.dumps(evidence, ensure_ascii=False) if evidence else "없음"}
-
-### 심각도: {severity}
-
----
-
-당신은 30년 경력의 전문 애널리스트입니다.
-이 도전에 대해 논리적으로 반박하거나, 타당한 지적이라면 솔직히 인정하세요.
+        # Low-severity challenges against high-confidence opinions don't
+        # warrant an LLM round-trip — maintain the original position
+        if severity == "low" and original.get("confidence", 0) >= 85:
+            return {
+                "defense": "원래 분석 유지 — 낮은 심각도의 도전이며 근거가 부족합니다.",
+                "adjusted_score": None,
+                "acknowledged_risks": [],
+                "counter_evidence": original.get("key_points", [])[:2],
+                "confidence": original.get("confidence", 85),
+                "stance": "maintain",
+            }
 
-다음 JSON 형식으로 응답하세요:
-{{
-    "defense": "당신의 방어 논리 (구체적이고 데이터 기반으로)",
-    "adjusted_score": null 또는 1-10 사이의 숫자 (도전이 타당하다면 조정),
-    "acknowledged_risks": ["인정하는 리스크 목록"],
-    "counter_evidence": ["당신의 입장을 지지하는 증거"],
-    "confidence_after_debate": 0-100 사이의 숫자,
-    "final_stance": "maintain" 또는 "partially_concede" 또는 "fully_concede"
-}}"""
+        prompt = _REBUT_TEMPLATE.substitute(
+            score=original.get("score", "N/A"),
+            summary=original.get("summary", "N/A"),
+            key_points=_dumps(original.get("key_points", [])),
+            challenge=challenge,
+            evidence=_dumps(evidence) if evidence else "없음",
+            severity=severity,
+        )
 
-        response = await self.invoke(prompt)
+        response = await self.invoke(prompt, instructions=_REBUT_INSTRUCTIONS)
         try:
             # JSON 블록 추출
-            if "```json" in response:
-                json_start = response.find("```json") + 7
-                json_end = response.find("```", json_start)
-                response = response[json_start:json_end].strip()
-            elif "```" in response:
-                json_start = response.find("```") + 3
-                json_end = response.find("```", json_start)
-                response = response[json_start:json_end].strip()
-
-            result = json.loads(response)
+            result = _extract_json(response)
             return {
                 "defense": result.get("defense", ""),
                 "adjusted_score": result.get("adjusted_score"),
@@ -328,7 +886,7 @@ Respond in JSON format:
                 "confidence": result.get("confidence_after_debate", 70),
                 "stance": result.get("final_stance", "maintain"),
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning(f"Failed to parse rebut response: {response[:100]}...")
             return {
                 "defense": response,
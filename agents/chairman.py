@@ -1,18 +1,19 @@
 """Chairman Agent - 투자위원회 의장."""
-import json
+import hashlib
 import logging
 from datetime import datetime
 from typing import Any, Optional
 
-from agents.base_agent import BaseAgent, AgentConfig
+import numpy as np
+import orjson
+
+from agents.base_agent import BaseAgent, AgentConfig, _dumps, _extract_json
 from models.agent_opinion import (
     AgentOpinion,
     AgentType,
     AgentVote,
     CommitteeDecision,
     DebateRound,
-    RiskLevel,
-    Sentiment,
 )
 
 logger = logging.getLogger(__name__)
@@ -21,6 +22,10 @@ logger = logging.getLogger(__name__)
 class ChairmanAgent(BaseAgent):
     """Chairman agent - orchestrates the investment committee."""
 
+    # Direct enum value→member lookup; avoids rebuilding a dict literal
+    # on every vote-creation call
+    _AGENT_TYPE_LOOKUP = AgentType._value2member_map_
+
     def __init__(self, config: Optional[AgentConfig] = None):
         """Initialize Chairman Agent."""
         if config is None:
@@ -29,6 +34,10 @@ class ChairmanAgent(BaseAgent):
                 prompt_file="prompts/chairman.md",
             )
         super().__init__(config)
+        # Pre-serialized prompt fragments keyed by (label, content hash).
+        # Opinions rarely change between the initial synthesis and the
+        # post-debate re-synthesis, so the second pass hits cache.
+        self._fragment_cache: dict[tuple[str, str], str] = {}
 
     def _get_default_prompt(self) -> str:
         """Get default system prompt."""
@@ -51,45 +60,23 @@ Provide balanced, well-reasoned investment recommendations based on all inputs."
         """
         ticker = context.get("ticker", "")
         company_name = context.get("company_name", ticker)
-        current_price = context.get("current_price", 0)
 
         # Collect all agent opinions
         agent_opinions = context.get("agent_opinions", {})
         debate_rounds = context.get("debate_rounds", [])
 
-        # Build synthesis prompt
-        prompt = f"""As Chairman, synthesize the following analyses for {ticker} ({company_name}):
-
-Current Price: {current_price}
-
-=== AGENT OPINIONS ===
-{json.dumps(agent_opinions, indent=2, default=str)}
+        # Normalize rounds once so downstream consumers see a homogeneous list
+        debate_rounds = self._normalize_rounds(debate_rounds)
 
-=== DEBATE ROUNDS ===
-{json.dumps(debate_rounds, indent=2, default=str)}
-
-Please provide the final committee decision in JSON format:
-{{
-    "weighted_average_score": <1-10>,
-    "consensus_level": <0-100>,
-    "final_sentiment": "<very_bullish|bullish|neutral|bearish|very_bearish>",
-    "recommendation": "<Strong Buy|Buy|Hold|Sell|Strong Sell>",
-    "executive_summary": "<2-3 sentence summary>",
-    "investment_thesis": "<brief investment thesis>",
-    "target_price_low": <number>,
-    "target_price_mid": <number>,
-    "target_price_high": <number>,
-    "risk_level": "<low|medium|high|critical>",
-    "key_strengths": ["<strength1>", "<strength2>"],
-    "key_risks": ["<risk1>", "<risk2>"],
-    "dissenting_opinions": ["<dissent1>", "<dissent2>"],
-    "action_items": ["<action1>", "<action2>"],
-    "monitoring_points": ["<point1>", "<point2>"],
-    "conviction_level": "<low|medium|high>"
-}}"""
+        prompt = self._build_synthesis_prompt(context)
 
         try:
-            response = await self.invoke(prompt)
+            # Stream the synthesis so callers get tokens while the model
+            # is still generating
+            chunks = []
+            async for chunk in self.invoke_stream(prompt):
+                chunks.append(chunk)
+            response = "".join(chunks)
             result = self._parse_json_response(response)
 
             # Create agent votes from opinions
@@ -117,7 +104,7 @@ Please provide the final committee decision in JSON format:
                 key_risks=result.get("key_risks", []),
                 action_items=result.get("action_items", []),
                 monitoring_points=result.get("monitoring_points", []),
-                debate_rounds=[DebateRound(**dr) if isinstance(dr, dict) else dr for dr in debate_rounds],
+                debate_rounds=debate_rounds,
                 dissenting_opinions=result.get("dissenting_opinions", []),
             )
 
@@ -146,51 +133,145 @@ Please provide the final committee decision in JSON format:
                 "decision": None,
             }
 
+    @staticmethod
+    def _normalize_rounds(rounds: list[Any]) -> list[DebateRound]:
+        """Convert any dict-shaped rounds to DebateRound in a single pass."""
+        return [DebateRound(**r) if type(r) is dict else r for r in rounds]
+
+    def _build_synthesis_prompt(self, context: dict[str, Any]) -> str:
+        """Build the synthesis prompt from per-opinion cached fragments.
+
+        Unchanged opinions are not re-serialized on re-synthesis.
+        """
+        ticker = context.get("ticker", "")
+        company_name = context.get("company_name", ticker)
+        current_price = context.get("current_price", 0)
+        agent_opinions = context.get("agent_opinions", {})
+        debate_rounds = context.get("debate_rounds", [])
+
+        opinion_block = "\n".join(
+            f"[{agent_type}]\n{self._json_fragment(agent_type, opinion)}"
+            for agent_type, opinion in agent_opinions.items()
+        )
+        debate_block = "\n".join(
+            f"[round {i + 1}]\n{self._json_fragment(f'debate:{i}', dr)}"
+            for i, dr in enumerate(debate_rounds)
+        )
+
+        return f"""As Chairman, synthesize the following analyses for {ticker} ({company_name}):
+
+Current Price: {current_price}
+
+=== AGENT OPINIONS ===
+{opinion_block}
+
+=== DEBATE ROUNDS ===
+{debate_block}
+
+Please provide the final committee decision in JSON format:
+{{
+    "weighted_average_score": <1-10>,
+    "consensus_level": <0-100>,
+    "final_sentiment": "<very_bullish|bullish|neutral|bearish|very_bearish>",
+    "recommendation": "<Strong Buy|Buy|Hold|Sell|Strong Sell>",
+    "executive_summary": "<2-3 sentence summary>",
+    "investment_thesis": "<brief investment thesis>",
+    "target_price_low": <number>,
+    "target_price_mid": <number>,
+    "target_price_high": <number>,
+    "risk_level": "<low|medium|high|critical>",
+    "key_strengths": ["<strength1>", "<strength2>"],
+    "key_risks": ["<risk1>", "<risk2>"],
+    "dissenting_opinions": ["<dissent1>", "<dissent2>"],
+    "action_items": ["<action1>", "<action2>"],
+    "monitoring_points": ["<point1>", "<point2>"],
+    "conviction_level": "<low|medium|high>"
+}}"""
+
+    async def analyze_stream(self, context: dict[str, Any]):
+        """Stream synthesis response chunks as the model generates them.
+
+        UI callers can show partial output immediately; `analyze` joins the
+        same stream into the final decision.
+
+        Args:
+            context: Analysis context with all agent results
+
+        Yields:
+            Response text chunks
+        """
+        prompt = self._build_synthesis_prompt(context)
+        async for chunk in self.invoke_stream(prompt):
+            yield chunk
+
+    def _json_fragment(self, label: str, obj: Any) -> str:
+        """Serialize obj as compact JSON, reusing the cached string when unchanged."""
+        raw = orjson.dumps(obj, default=str)
+        key = (label, hashlib.blake2b(raw, digest_size=16).hexdigest())
+        fragment = self._fragment_cache.get(key)
+        if fragment is None:
+            fragment = raw.decode()
+            self._fragment_cache[key] = fragment
+        return fragment
+
     def _create_votes_from_opinions(self, opinions: dict[str, Any]) -> list[AgentVote]:
         """Create AgentVote objects from agent opinions."""
         votes = []
         for agent_type_str, opinion_data in opinions.items():
+            if not (isinstance(opinion_data, dict) and "score" in opinion_data):
+                continue
+
+            agent_type = self._AGENT_TYPE_LOOKUP.get(agent_type_str)
+            if agent_type is None:
+                logger.warning(f"Could not create vote for {agent_type_str}: unknown agent type")
+                continue
+
             try:
-                if isinstance(opinion_data, dict) and "score" in opinion_data:
-                    vote = AgentVote(
-                        agent_type=AgentType(agent_type_str),
-                        score=opinion_data.get("score", 5),
-                        confidence=opinion_data.get("confidence", 70),
-                        sentiment=self._map_sentiment(opinion_data.get("sentiment", "neutral")),
-                        rationale=opinion_data.get("summary", ""),
-                    )
-                    votes.append(vote)
+                vote = AgentVote(
+                    agent_type=agent_type,
+                    score=opinion_data.get("score", 5),
+                    confidence=opinion_data.get("confidence", 70),
+                    sentiment=self._map_sentiment(opinion_data.get("sentiment", "neutral")),
+                    rationale=opinion_data.get("summary", ""),
+                )
+                votes.append(vote)
             except (ValueError, KeyError) as e:
                 logger.warning(f"Could not create vote for {agent_type_str}: {e}")
         return votes
 
+    @staticmethod
+    def _vote_arrays(votes: list[AgentVote]) -> tuple[np.ndarray, np.ndarray]:
+        """Extract score/confidence arrays from votes in a single pass."""
+        n = len(votes)
+        scores = np.fromiter((v.score for v in votes), dtype=np.float64, count=n)
+        confidences = np.fromiter((v.confidence for v in votes), dtype=np.float64, count=n)
+        return scores, confidences
+
     def _calculate_weighted_score(self, votes: list[AgentVote]) -> float:
         """Calculate confidence-weighted average score."""
         if not votes:
             return 5.0
 
-        total_weighted_score = sum(v.score * v.confidence for v in votes)
-        total_confidence = sum(v.confidence for v in votes)
+        scores, confidences = self._vote_arrays(votes)
+        total_confidence = confidences.sum()
 
         if total_confidence == 0:
-            return sum(v.score for v in votes) / len(votes)
+            return round(float(scores.mean()), 1)
 
-        return round(total_weighted_score / total_confidence, 1)
+        return round(float(scores @ confidences / total_confidence), 1)
 
     def _calculate_consensus(self, votes: list[AgentVote]) -> float:
         """Calculate consensus level based on score variance."""
         if not votes or len(votes) < 2:
             return 100.0
 
-        scores = [v.score for v in votes]
-        mean_score = sum(scores) / len(scores)
-        variance = sum((s - mean_score) ** 2 for s in scores) / len(scores)
+        scores, _ = self._vote_arrays(votes)
 
         # Convert variance to consensus percentage
         # Lower variance = higher consensus
         # Max variance for 1-10 scale is ~20, so normalize
         max_variance = 20
-        consensus = max(0, 100 - (variance / max_variance * 100))
+        consensus = max(0.0, 100.0 - float(scores.var()) / max_variance * 100.0)
 
         return round(consensus, 1)
 
@@ -211,10 +292,10 @@ Please provide the final committee decision in JSON format:
         prompt = f"""As Chairman, mediate the following debate:
 
 Counter-Arguments:
-{json.dumps(counter_arguments, indent=2)}
+{_dumps(counter_arguments)}
 
 Responses:
-{json.dumps(responses, indent=2)}
+{_dumps(responses)}
 
 Provide your mediation in JSON format:
 {{
@@ -241,44 +322,13 @@ Provide your mediation in JSON format:
     def _parse_json_response(self, response: str) -> dict[str, Any]:
         """Parse JSON from LLM response."""
         try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0]
-                return json.loads(json_str)
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0]
-                return json.loads(json_str)
-            else:
-                return {
-                    "weighted_average_score": 5,
-                    "consensus_level": 50,
-                    "final_sentiment": "neutral",
-                    "recommendation": "Hold",
-                    "executive_summary": response[:200],
-                }
-
-    def _map_sentiment(self, sentiment_str: str) -> Sentiment:
-        """Map string sentiment to Sentiment enum."""
-        if isinstance(sentiment_str, Sentiment):
-            return sentiment_str
-        mapping = {
-            "very_bullish": Sentiment.VERY_BULLISH,
-            "bullish": Sentiment.BULLISH,
-            "neutral": Sentiment.NEUTRAL,
-            "bearish": Sentiment.BEARISH,
-            "very_bearish": Sentiment.VERY_BEARISH,
-        }
-        return mapping.get(str(sentiment_str).lower(), Sentiment.NEUTRAL)
-
-    def _map_risk_level(self, risk_str: str) -> RiskLevel:
-        """Map string risk level to RiskLevel enum."""
-        if isinstance(risk_str, RiskLevel):
-            return risk_str
-        mapping = {
-            "low": RiskLevel.LOW,
-            "medium": RiskLevel.MEDIUM,
-            "high": RiskLevel.HIGH,
-            "critical": RiskLevel.CRITICAL,
-        }
-        return mapping.get(str(risk_str).lower(), RiskLevel.MEDIUM)
+            return _extract_json(response)
+        except orjson.JSONDecodeError:
+            return {
+                "weighted_average_score": 5,
+                "consensus_level": 50,
+                "final_sentiment": "neutral",
+                "recommendation": "Hold",
+                "executive_summary": response[:200],
+            }
+
@@ -1,10 +1,18 @@
 """Data Validator Agent - 자료 왜곡/편향 검토 에이전트."""
-import json
+import asyncio
+import functools
+import hashlib
 import logging
+import string
 from datetime import datetime
 from typing import Any, Optional
 
-from agents.base_agent import BaseAgent, AgentConfig
+import numpy as np
+import orjson
+from pydantic import TypeAdapter
+
+from agents.base_agent import BaseAgent, AgentConfig, _dumps, _extract_json
+from config.settings import settings
 from models.agent_opinion import AgentType, Sentiment
 from models.user_research import (
     BiasCheckResult,
@@ -17,6 +25,94 @@ from models.user_research import (
 
 logger = logging.getLogger(__name__)
 
+# 편향 검토 결과 목록을 C 레벨 한 번의 호출로 직렬화.
+# 결과마다 model_dump()를 따로 호출하는 것보다 파이썬 오버헤드가 적음.
+_BIAS_RESULTS_ADAPTER: TypeAdapter = TypeAdapter(list[BiasCheckResult])
+
+
+# 자료 본문 미리보기의 UTF-8 바이트 예산. 한글은 UTF-8에서 3바이트라
+# 문자 수 기준 슬라이스([:3000])는 실제 컨텍스트 예산을 최대 3배까지
+# 초과했음. 바이트 기준이면 언어와 무관하게 예산이 일정함.
+_CONTENT_PREVIEW_BYTES = 6000
+
+
+def _truncate_utf8(text: str, max_bytes: int = _CONTENT_PREVIEW_BYTES) -> str:
+    """UTF-8 바이트 예산에 맞게 문자열을 자름.
+
+    인코딩은 한 번만 수행하고, 예산 경계에서 잘린 멀티바이트 문자는
+    버립니다. 예산 이내면 원본을 그대로 반환합니다 (복사 없음).
+    """
+    encoded = text.encode()
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode(errors="ignore")
+
+
+# 편향 검토 프롬프트를 임포트 시 한 번만 파싱해 두고 자료별 필드만 치환.
+# f-string으로 매 호출 ~2KB 보일러플레이트를 재조립하지 않음.
+# 정적인 지시문/JSON 스키마를 앞에, 자료별 필드를 뒤에 배치해 배치 호출 시
+# 프롬프트 접두사가 바이트 단위로 동일하도록 함 (서버 측 prefix 캐시 활용).
+_BIAS_PROMPT_TEMPLATE = string.Template("""다음 투자 관련 자료를 비판적으로 검토하세요.
+
+다음을 분석하세요:
+1. 이 자료에 어떤 편향이 있는가?
+2. 인용된 데이터가 정확하고 최신인가?
+3. 논리적 비약이나 검증 불가한 주장이 있는가?
+4. 이해충돌 가능성이 있는가?
+5. 이 자료를 어떻게 활용해야 하는가?
+
+다음 JSON 형식으로 응답하세요:
+{
+    "detected_biases": ["bias_type1", "bias_type2"],
+    "bias_severity": "low" 또는 "medium" 또는 "high",
+    "bias_explanation": "편향에 대한 상세 설명",
+    "data_accuracy": 0-100 사이의 숫자,
+    "outdated_info": ["오래된 정보 1", "오래된 정보 2"],
+    "unverifiable_claims": ["검증 불가 주장 1"],
+    "reliability_score": 1-10 사이의 숫자,
+    "usage_recommendation": "이 자료 활용 방법 권장",
+    "caveats": ["주의사항 1", "주의사항 2"],
+    "ai_notes": "추가 분석 노트"
+}
+
+---
+
+## 현재 주식 정보 (비교용)
+$stock_json
+
+## 자료 정보
+- 제목: $title
+- 출처 유형: $type
+- 출처명: $source
+- 발행일: $publish_date
+- 저자: $author
+
+## 목표가/투자의견
+- 목표가: $target_price
+- 투자의견: $recommendation
+
+## 핵심 주장
+$key_claims_json
+
+## 인용 데이터
+$data_points_json
+
+## 자료 내용
+$content_preview""")
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_json_cached(response: str) -> dict[str, Any]:
+    """응답 문자열 기준으로 JSON 파싱 결과를 메모이즈.
+
+    동일한 자료/티커 재분석 시 같은 응답을 다시 파싱하지 않습니다.
+    반환된 dict는 읽기 전용으로 취급해야 합니다.
+    """
+    try:
+        return _extract_json(response)
+    except orjson.JSONDecodeError:
+        return {}
+
 
 class DataValidatorAgent(BaseAgent):
     """자료의 신뢰성과 편향을 검토하는 에이전트.
@@ -29,6 +125,12 @@ class DataValidatorAgent(BaseAgent):
     5. 정보 격차 식별
     """
 
+    # 응답 JSON 스키마 크기에 맞춘 출력 토큰 상한. 디코딩 시간은 출력
+    # 토큰 수에 선형이므로, 스키마보다 넉넉히 잡을 이유가 없음.
+    _BIAS_MAX_TOKENS = 800
+    _CROSS_VAL_MAX_TOKENS = 1024
+    _SYNTHESIS_MAX_TOKENS = 1024
+
     def __init__(self, config: Optional[AgentConfig] = None):
         """Initialize Data Validator Agent."""
         if config is None:
@@ -37,6 +139,8 @@ class DataValidatorAgent(BaseAgent):
                 temperature=0.3,
             )
         super().__init__(config)
+        # (문서, 주식 정보) 해시 → 검토 결과. 동일 자료 재제출 시 LLM 호출 생략.
+        self._bias_check_cache: dict[str, BiasCheckResult] = {}
 
     def _get_default_prompt(self) -> str:
         """Get default system prompt."""
@@ -82,30 +186,67 @@ class DataValidatorAgent(BaseAgent):
                 "message": "분석할 자료가 없습니다.",
             }
 
-        # 각 자료 개별 검토
-        bias_results = []
-        for doc in user_research.documents:
-            result = await self.check_document_bias(doc, stock_info)
-            bias_results.append(result)
-
-        # 자료 간 교차 검증
-        cross_validation = await self.cross_validate_documents(
-            user_research.documents,
-            stock_info,
+        # 자료 필드를 한 번만 읽어 뷰 테이블 구성 — 세 번의 LLM 패스가
+        # 같은 필드를 반복 직렬화하지 않도록 함
+        documents = user_research.documents
+        doc_views = self._build_doc_views(documents)
+
+        # 각 자료 개별 검토 — 프롬프트를 모두 만든 뒤 하나의 배치 호출로 제출하고,
+        # bias 결과에 의존하지 않는 교차 검증을 함께 겹쳐서 실행
+        stock_json = _dumps(stock_info) if stock_info else "정보 없음"
+        prompts = [
+            self._build_bias_prompt(view, stock_info, stock_json=stock_json)
+            for view in doc_views
+        ]
+
+        async def run_bias_checks() -> list[BiasCheckResult]:
+            responses = await self.invoke_batch(
+                prompts, return_exceptions=True, max_tokens=self._BIAS_MAX_TOKENS
+            )
+            # 일시적 오류로 실패한 자료만 한 번 더 작은 배치로 재제출.
+            # 성공한 자료들은 기다리지 않으므로 전체 소요 시간은
+            # O(재시도 횟수 × 지연)이 아니라 O(지연)에 가깝게 유지됨.
+            failed = [i for i, r in enumerate(responses) if isinstance(r, Exception)]
+            if failed:
+                logger.warning(f"편향 검토 {len(failed)}건 실패, 재제출합니다.")
+                retried = await self.invoke_batch(
+                    [prompts[i] for i in failed],
+                    return_exceptions=True,
+                    max_tokens=self._BIAS_MAX_TOKENS,
+                )
+                for i, response in zip(failed, retried):
+                    responses[i] = response
+            return [
+                self._bias_result_from_response(doc, response)
+                for doc, response in zip(documents, responses)
+            ]
+
+        bias_results, cross_validation = await asyncio.gather(
+            run_bias_checks(),
+            self.cross_validate_documents(documents, stock_info, doc_views=doc_views),
         )
 
+        # 신뢰도 점수/고편향 플래그를 한 번만 배열로 뽑아 종합 분석과
+        # 전체 신뢰도 계산이 각자 리스트를 다시 순회하지 않도록 함
+        scores, high_bias = self._reliability_arrays(bias_results)
+        avg_reliability = float(scores.mean()) if scores.size else 5.0
+
         # 종합 분석
         synthesis = await self.synthesize_research(
             user_research,
             bias_results,
             cross_validation,
+            doc_views=doc_views,
+            avg_reliability=avg_reliability,
         )
 
         return {
-            "bias_results": [r.model_dump() for r in bias_results],
+            "bias_results": _BIAS_RESULTS_ADAPTER.dump_python(bias_results),
             "cross_validation": cross_validation,
             "synthesis": synthesis.model_dump() if synthesis else None,
-            "overall_reliability": self._calculate_overall_reliability(bias_results),
+            "overall_reliability": self._calculate_overall_reliability(
+                bias_results, arrays=(scores, high_bias)
+            ),
         }
 
     async def check_document_bias(
@@ -122,56 +263,98 @@ class DataValidatorAgent(BaseAgent):
         Returns:
             편향 검토 결과
         """
-        prompt = f"""다음 투자 관련 자료를 비판적으로 검토하세요.
-
-## 자료 정보
-- 제목: {document.title}
-- 출처 유형: {document.source_type.value}
-- 출처명: {document.source_name}
-- 발행일: {document.publish_date.strftime('%Y-%m-%d') if document.publish_date else '불명'}
-- 저자: {document.author or '불명'}
+        cache_key = self._bias_cache_key(document, stock_info)
+        cached = self._bias_check_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-## 자료 내용
-{document.content[:3000]}
-
-## 핵심 주장
-{json.dumps(document.key_claims, ensure_ascii=False)}
-
-## 인용 데이터
-{json.dumps(document.data_points, ensure_ascii=False)}
-
-## 목표가/투자의견
-- 목표가: {document.target_price or '없음'}
-- 투자의견: {document.recommendation or '없음'}
+        view = self._build_doc_views([document])[0]
+        try:
+            response = await self.invoke(
+                self._build_bias_prompt(view, stock_info),
+                max_tokens=self._BIAS_MAX_TOKENS,
+            )
+        except Exception as e:
+            logger.error(f"Error checking document bias: {e}")
+            response = e
 
-## 현재 주식 정보 (비교용)
-{json.dumps(stock_info, ensure_ascii=False, indent=2) if stock_info else '정보 없음'}
+        result = self._bias_result_from_response(document, response)
+        if not isinstance(response, Exception):
+            self._bias_check_cache[cache_key] = result
+        return result
 
----
+    @staticmethod
+    def _build_doc_views(documents: list[ResearchDocument]) -> list[dict[str, Any]]:
+        """자료 필드를 한 번만 읽어 재사용 가능한 뷰 테이블 생성.
 
-다음을 분석하세요:
-1. 이 자료에 어떤 편향이 있는가?
-2. 인용된 데이터가 정확하고 최신인가?
-3. 논리적 비약이나 검증 불가한 주장이 있는가?
-4. 이해충돌 가능성이 있는가?
-5. 이 자료를 어떻게 활용해야 하는가?
+        편향 검토/교차 검증/종합 분석이 같은 필드를 각자 다시 직렬화하지
+        않도록, JSON 문자열까지 미리 만들어 둡니다.
+        """
+        return [
+            {
+                "id": doc.id,
+                "title": doc.title,
+                "source": doc.source_name,
+                "type": doc.source_type.value,
+                "publish_date": doc.publish_date.strftime("%Y-%m-%d") if doc.publish_date else "불명",
+                "author": doc.author or "불명",
+                "content_preview": _truncate_utf8(doc.content),
+                "key_claims": doc.key_claims,
+                "key_claims_json": _dumps(doc.key_claims),
+                "data_points_json": _dumps(doc.data_points),
+                "target_price": doc.target_price,
+                "recommendation": doc.recommendation,
+            }
+            for doc in documents
+        ]
+
+    @staticmethod
+    def _bias_cache_key(document: ResearchDocument, stock_info: dict[str, Any]) -> str:
+        """문서 내용과 주식 정보 기반의 캐시 키 생성."""
+        stock_json = orjson.dumps(stock_info, default=str, option=orjson.OPT_SORT_KEYS).decode() if stock_info else ""
+        return hashlib.blake2b(
+            f"{document.id}|{document.content}|{stock_json}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+    def _build_bias_prompt(
+        self,
+        view: dict[str, Any],
+        stock_info: dict[str, Any],
+        stock_json: Optional[str] = None,
+    ) -> str:
+        """편향 검토 프롬프트 생성 (미리 구성된 자료 뷰 사용).
 
-다음 JSON 형식으로 응답하세요:
-{{
-    "detected_biases": ["bias_type1", "bias_type2"],
-    "bias_severity": "low" 또는 "medium" 또는 "high",
-    "bias_explanation": "편향에 대한 상세 설명",
-    "data_accuracy": 0-100 사이의 숫자,
-    "outdated_info": ["오래된 정보 1", "오래된 정보 2"],
-    "unverifiable_claims": ["검증 불가 주장 1"],
-    "reliability_score": 1-10 사이의 숫자,
-    "usage_recommendation": "이 자료 활용 방법 권장",
-    "caveats": ["주의사항 1", "주의사항 2"],
-    "ai_notes": "추가 분석 노트"
-}}"""
+        배치 호출처럼 같은 stock_info로 여러 프롬프트를 만들 때는
+        `stock_json`을 미리 직렬화해 전달하면 자료 수만큼 재직렬화하지
+        않습니다.
+        """
+        if stock_json is None:
+            stock_json = _dumps(stock_info) if stock_info else "정보 없음"
+        return _BIAS_PROMPT_TEMPLATE.substitute(
+            title=view["title"],
+            type=view["type"],
+            source=view["source"],
+            publish_date=view["publish_date"],
+            author=view["author"],
+            content_preview=view["content_preview"],
+            key_claims_json=view["key_claims_json"],
+            data_points_json=view["data_points_json"],
+            target_price=view["target_price"] or "없음",
+            recommendation=view["recommendation"] or "없음",
+            stock_json=stock_json,
+        )
 
+    def _bias_result_from_response(
+        self,
+        document: ResearchDocument,
+        response: Any,
+    ) -> BiasCheckResult:
+        """LLM 응답(또는 실패한 Exception)을 BiasCheckResult로 변환."""
         try:
-            response = await self.invoke(prompt)
+            if isinstance(response, Exception):
+                raise response
+
             result = self._parse_json_response(response)
 
             # BiasType enum으로 변환
@@ -213,12 +396,14 @@ class DataValidatorAgent(BaseAgent):
         self,
         documents: list[ResearchDocument],
         stock_info: dict[str, Any],
+        doc_views: Optional[list[dict[str, Any]]] = None,
     ) -> dict[str, Any]:
         """자료 간 교차 검증.
 
         Args:
             documents: 자료 목록
             stock_info: 주식 정보
+            doc_views: 미리 구성된 자료 뷰 (없으면 새로 생성)
 
         Returns:
             교차 검증 결과
@@ -230,26 +415,43 @@ class DataValidatorAgent(BaseAgent):
                 "divergent_views": [],
             }
 
-        # 자료 요약 준비
-        doc_summaries = []
-        for doc in documents:
-            doc_summaries.append({
-                "id": doc.id,
-                "title": doc.title,
-                "source": doc.source_name,
-                "type": doc.source_type.value,
-                "key_claims": doc.key_claims,
-                "target_price": doc.target_price,
-                "recommendation": doc.recommendation,
-            })
+        if doc_views is None:
+            doc_views = self._build_doc_views(documents)
+
+        # 핵심 주장이 사실상 동일하고 목표가 편차도 미미하면 LLM이 말할 수
+        # 있는 게 없으므로, 결정적 합의 결과를 만들어 왕복을 통째로 생략
+        if self._documents_agree(doc_views):
+            return {
+                "contradictions": [],
+                "consensus_points": list(doc_views[0]["key_claims"]),
+                "divergent_views": [],
+                "reliability_notes": "자료들의 핵심 주장이 사실상 동일하여 LLM 교차 검증을 생략했습니다.",
+                "skipped_llm": True,
+                "target_price_range": self._target_price_range(doc_views),
+                "recommendation_distribution": self._recommendation_distribution(doc_views),
+            }
+
+        # 자료 요약 준비 (뷰에서 필요한 필드만 추림)
+        doc_summaries = [
+            {
+                "id": view["id"],
+                "title": view["title"],
+                "source": view["source"],
+                "type": view["type"],
+                "key_claims": view["key_claims"],
+                "target_price": view["target_price"],
+                "recommendation": view["recommendation"],
+            }
+            for view in doc_views
+        ]
 
         prompt = f"""다음 여러 투자 자료들을 교차 검증하세요.
 
 ## 자료 목록
-{json.dumps(doc_summaries, ensure_ascii=False, indent=2)}
+{_dumps(doc_summaries)}
 
 ## 현재 주가 정보
-{json.dumps(stock_info, ensure_ascii=False, indent=2) if stock_info else '정보 없음'}
+{_dumps(stock_info) if stock_info else '정보 없음'}
 
 ---
 
@@ -257,7 +459,6 @@ class DataValidatorAgent(BaseAgent):
 1. 자료들 사이에 모순되는 주장이 있는가?
 2. 자료들이 합의하는 점은 무엇인가?
 3. 견해가 갈리는 부분은 무엇인가?
-4. 목표가나 투자의견이 어떻게 분포되어 있는가?
 
 다음 JSON 형식으로 응답하세요:
 {{
@@ -278,22 +479,17 @@ class DataValidatorAgent(BaseAgent):
             "views": ["관점 A", "관점 B"]
         }}
     ],
-    "target_price_range": {{
-        "min": 최소 목표가 또는 null,
-        "max": 최대 목표가 또는 null,
-        "median": 중간값 또는 null
-    }},
-    "recommendation_distribution": {{
-        "bullish": 낙관적 자료 수,
-        "neutral": 중립 자료 수,
-        "bearish": 비관적 자료 수
-    }},
     "reliability_notes": "교차 검증 결과 종합 노트"
 }}"""
 
         try:
-            response = await self.invoke(prompt)
-            return self._parse_json_response(response)
+            response = await self.invoke(prompt, max_tokens=self._CROSS_VAL_MAX_TOKENS)
+            result = dict(self._parse_json_response(response))
+            # 목표가 분포/투자의견 분포는 산수일 뿐이므로 LLM에 맡기지 않고
+            # 직접 계산해서 결과에 합침 (토큰 절약 + 계산 오류 제거)
+            result["target_price_range"] = self._target_price_range(doc_views)
+            result["recommendation_distribution"] = self._recommendation_distribution(doc_views)
+            return result
         except Exception as e:
             logger.error(f"Error in cross validation: {e}")
             return {
@@ -303,11 +499,73 @@ class DataValidatorAgent(BaseAgent):
                 "error": str(e),
             }
 
+    @staticmethod
+    def _documents_agree(doc_views: list[dict[str, Any]]) -> bool:
+        """자료들이 사실상 같은 주장을 하는지 저비용으로 판정.
+
+        모든 쌍의 핵심 주장 토큰 집합 Jaccard 유사도가 0.9를 넘고
+        목표가 편차가 1% 미만이면 True. 자료 수가 적어(N≤수십) 쌍별
+        비교로 충분합니다.
+        """
+        token_sets = [
+            {token for claim in view["key_claims"] for token in claim.split()}
+            for view in doc_views
+        ]
+        if any(not tokens for tokens in token_sets):
+            return False
+
+        for i in range(len(token_sets)):
+            for j in range(i + 1, len(token_sets)):
+                union = token_sets[i] | token_sets[j]
+                if len(token_sets[i] & token_sets[j]) / len(union) <= 0.9:
+                    return False
+
+        prices = [v["target_price"] for v in doc_views if v["target_price"] is not None]
+        if len(prices) >= 2:
+            low, high = min(prices), max(prices)
+            if low <= 0 or (high - low) / low >= 0.01:
+                return False
+        return True
+
+    @staticmethod
+    def _target_price_range(doc_views: list[dict[str, Any]]) -> dict[str, Optional[float]]:
+        """목표가 분포(min/max/median)를 직접 계산."""
+        prices = np.fromiter(
+            (v["target_price"] for v in doc_views if v["target_price"] is not None),
+            dtype=np.float64,
+        )
+        if prices.size == 0:
+            return {"min": None, "max": None, "median": None}
+        return {
+            "min": float(prices.min()),
+            "max": float(prices.max()),
+            "median": float(np.median(prices)),
+        }
+
+    @staticmethod
+    def _recommendation_distribution(doc_views: list[dict[str, Any]]) -> dict[str, int]:
+        """투자의견 문자열을 낙관/중립/비관으로 분류해 집계."""
+        distribution = {"bullish": 0, "neutral": 0, "bearish": 0}
+        for view in doc_views:
+            recommendation = view["recommendation"]
+            if not recommendation:
+                continue
+            rec = recommendation.lower()
+            if any(k in rec for k in ("buy", "매수", "bullish", "overweight", "비중확대")):
+                distribution["bullish"] += 1
+            elif any(k in rec for k in ("sell", "매도", "bearish", "underweight", "비중축소")):
+                distribution["bearish"] += 1
+            else:
+                distribution["neutral"] += 1
+        return distribution
+
     async def synthesize_research(
         self,
         user_research: UserResearchInput,
         bias_results: list[BiasCheckResult],
         cross_validation: dict[str, Any],
+        doc_views: Optional[list[dict[str, Any]]] = None,
+        avg_reliability: Optional[float] = None,
     ) -> ResearchSynthesis:
         """자료 종합 분석.
 
@@ -315,43 +573,59 @@ class DataValidatorAgent(BaseAgent):
             user_research: 사용자 입력 자료
             bias_results: 편향 검토 결과들
             cross_validation: 교차 검증 결과
+            doc_views: 미리 구성된 자료 뷰 (없으면 새로 생성)
+            avg_reliability: 미리 계산한 평균 신뢰도 (없으면 새로 계산)
 
         Returns:
             종합 분석 결과
         """
+        if doc_views is None:
+            doc_views = self._build_doc_views(user_research.documents)
+
         # 유형별 자료 수 계산
         docs_by_type = {}
-        for doc in user_research.documents:
-            type_name = doc.source_type.value
+        for view in doc_views:
+            type_name = view["type"]
             docs_by_type[type_name] = docs_by_type.get(type_name, 0) + 1
 
-        # 평균 신뢰도 계산
-        avg_reliability = (
-            sum(r.reliability_score for r in bias_results) / len(bias_results)
-            if bias_results else 5.0
-        )
+        # 평균 신뢰도 계산 (호출자가 미리 계산해 넘기지 않은 경우)
+        if avg_reliability is None:
+            scores, _ = self._reliability_arrays(bias_results)
+            avg_reliability = float(scores.mean()) if scores.size else 5.0
+
+        # 자료가 하나뿐이면 자료 '간' 종합은 성립하지 않으므로 LLM 호출
+        # 없이 해당 자료의 주장을 그대로 반영한 결과를 돌려줌
+        if len(doc_views) < 2:
+            return ResearchSynthesis(
+                ticker=user_research.ticker,
+                total_documents=len(user_research.documents),
+                documents_by_type=docs_by_type,
+                average_reliability=avg_reliability,
+                consensus_points=list(doc_views[0]["key_claims"]) if doc_views else [],
+                information_gaps=["자료가 1개뿐이므로 교차 검증이 불가능합니다."],
+            )
 
         prompt = f"""다음 자료 분석 결과를 종합하여 에이전트들이 활용할 가이드를 작성하세요.
 
 ## 자료 현황
 - 총 자료 수: {len(user_research.documents)}
-- 유형별: {json.dumps(docs_by_type, ensure_ascii=False)}
+- 유형별: {_dumps(docs_by_type)}
 - 평균 신뢰도: {avg_reliability:.1f}/10
 
 ## 사용자 가설
 {user_research.user_hypothesis or '없음'}
 
 ## 사용자 우려사항
-{json.dumps(user_research.user_concerns, ensure_ascii=False)}
+{_dumps(user_research.user_concerns)}
 
 ## 사용자 질문
-{json.dumps(user_research.user_questions, ensure_ascii=False)}
+{_dumps(user_research.user_questions)}
 
 ## 편향 검토 요약
-{json.dumps([{{'title': r.document_title, 'biases': [b.value for b in r.detected_biases], 'reliability': r.reliability_score}} for r in bias_results], ensure_ascii=False, indent=2)}
+{_dumps([{'title': r.document_title, 'biases': [b.value for b in r.detected_biases], 'reliability': r.reliability_score} for r in bias_results])}
 
 ## 교차 검증 결과
-{json.dumps(cross_validation, ensure_ascii=False, indent=2)}
+{_dumps(cross_validation)}
 
 ---
 
@@ -369,7 +643,7 @@ class DataValidatorAgent(BaseAgent):
 }}"""
 
         try:
-            response = await self.invoke(prompt)
+            response = await self.invoke(prompt, max_tokens=self._SYNTHESIS_MAX_TOKENS)
             result = self._parse_json_response(response)
 
             return ResearchSynthesis(
@@ -398,27 +672,41 @@ class DataValidatorAgent(BaseAgent):
 
     def _parse_json_response(self, response: str) -> dict[str, Any]:
         """Parse JSON from LLM response."""
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0]
-                return json.loads(json_str)
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0]
-                return json.loads(json_str)
-            return {}
+        return _parse_json_cached(response)
+
+    @staticmethod
+    def _reliability_arrays(
+        bias_results: list[BiasCheckResult],
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """신뢰도 점수/고편향 여부 배열을 한 번의 순회로 추출."""
+        n = len(bias_results)
+        scores = np.fromiter(
+            (r.reliability_score for r in bias_results), dtype=np.float64, count=n
+        )
+        high_bias = np.fromiter(
+            (r.bias_severity == "high" for r in bias_results), dtype=bool, count=n
+        )
+        return scores, high_bias
 
     def _calculate_overall_reliability(
         self,
         bias_results: list[BiasCheckResult],
+        arrays: Optional[tuple[np.ndarray, np.ndarray]] = None,
     ) -> dict[str, Any]:
-        """전체 신뢰도 계산."""
+        """전체 신뢰도 계산.
+
+        Args:
+            bias_results: 편향 검토 결과들
+            arrays: `_reliability_arrays`로 미리 뽑은 배열 (없으면 새로 생성)
+        """
         if not bias_results:
             return {"score": 5.0, "level": "unknown"}
 
-        avg_score = sum(r.reliability_score for r in bias_results) / len(bias_results)
-        high_bias_count = sum(1 for r in bias_results if r.bias_severity == "high")
+        if arrays is None:
+            arrays = self._reliability_arrays(bias_results)
+        scores, high_bias = arrays
+        avg_score = float(scores.mean())
+        high_bias_count = int(high_bias.sum())
 
         # 높은 편향 자료가 많으면 전체 신뢰도 하락
         adjusted_score = avg_score - (high_bias_count * 0.5)
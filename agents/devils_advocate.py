@@ -1,10 +1,10 @@
 """Devil's Advocate Agent - 반대 논거 전문가."""
-import json
+import asyncio
 import logging
 from typing import Any, Optional
 
-from agents.base_agent import BaseAgent, AgentConfig
-from models.agent_opinion import AgentType, RiskLevel, Sentiment
+from agents.base_agent import BaseAgent, AgentConfig, _dumps
+from models.agent_opinion import AgentType
 from models.analysis_result import DevilsAdvocateAnalysis
 
 logger = logging.getLogger(__name__)
@@ -55,25 +55,10 @@ Be constructively critical, not just negative. Provide evidence-based counter-ar
         industry_analysis = context.get("industry_analysis", {})
         valuation_analysis = context.get("valuation_analysis", {})
 
-        # Build analysis prompt
-        prompt = f"""As Devil's Advocate, challenge the following investment analyses for {ticker}:
-
-Current Price: {current_price}
-
-=== MACRO ANALYSIS ===
-{json.dumps(macro_analysis, indent=2, default=str)}
-
-=== QUANT ANALYSIS ===
-{json.dumps(quant_analysis, indent=2, default=str)}
-
-=== QUALITATIVE ANALYSIS ===
-{json.dumps(qualitative_analysis, indent=2, default=str)}
-
-=== INDUSTRY ANALYSIS ===
-{json.dumps(industry_analysis, indent=2, default=str)}
-
-=== VALUATION ANALYSIS ===
-{json.dumps(valuation_analysis, indent=2, default=str)}
+        # Build analysis prompt. The static instructions and JSON schema come
+        # first, byte-identical across tickers, so inference backends can
+        # reuse the cached prompt prefix; ticker-specific analyses follow.
+        prompt = f"""As Devil's Advocate, challenge the investment analyses below.
 
 Provide your devil's advocate analysis in JSON format:
 {{
@@ -99,11 +84,31 @@ Provide your devil's advocate analysis in JSON format:
     "key_points": ["<key concern 1>", "<key concern 2>"],
     "concerns": ["<serious concern 1>", "<serious concern 2>"],
     "questions_to_answer": ["<question needing verification>"]
-}}"""
+}}
+
+---
+
+Ticker: {ticker}
+Current Price: {current_price}
+
+=== MACRO ANALYSIS ===
+{_dumps(macro_analysis)}
+
+=== QUANT ANALYSIS ===
+{_dumps(quant_analysis)}
+
+=== QUALITATIVE ANALYSIS ===
+{_dumps(qualitative_analysis)}
+
+=== INDUSTRY ANALYSIS ===
+{_dumps(industry_analysis)}
+
+=== VALUATION ANALYSIS ===
+{_dumps(valuation_analysis)}"""
 
         try:
-            response = await self.invoke(prompt)
-            result = self._parse_json_response(response)
+            # Stream the response and parse its JSON body incrementally
+            result = await self.invoke_json(prompt)
 
             # Create DevilsAdvocateAnalysis object
             analysis = DevilsAdvocateAnalysis(
@@ -165,7 +170,7 @@ Provide your devil's advocate analysis in JSON format:
 
 Agent: {agent_type}
 Claim: {original_claim}
-Supporting Evidence: {json.dumps(evidence or [])}
+Supporting Evidence: {_dumps(evidence or [])}
 
 Provide your counter-argument in JSON format:
 {{
@@ -187,38 +192,6 @@ Provide your counter-argument in JSON format:
                 "questions_raised": [],
             }
 
-    def _parse_json_response(self, response: str) -> dict[str, Any]:
-        """Parse JSON from LLM response."""
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0]
-                return json.loads(json_str)
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0]
-                return json.loads(json_str)
-            else:
-                return {
-                    "score": 5,
-                    "confidence": 50,
-                    "sentiment": "neutral",
-                    "summary": response[:200],
-                    "key_points": [],
-                    "concerns": [],
-                }
-
-    def _map_sentiment(self, sentiment_str: str) -> Sentiment:
-        """Map string sentiment to Sentiment enum."""
-        mapping = {
-            "very_bullish": Sentiment.VERY_BULLISH,
-            "bullish": Sentiment.BULLISH,
-            "neutral": Sentiment.NEUTRAL,
-            "bearish": Sentiment.BEARISH,
-            "very_bearish": Sentiment.VERY_BEARISH,
-        }
-        return mapping.get(sentiment_str.lower(), Sentiment.NEUTRAL)
-
     async def challenge(self, context: dict[str, Any]) -> dict[str, Any]:
         """토론에서 특정 에이전트의 분석에 도전합니다.
 
@@ -263,16 +236,16 @@ Provide your counter-argument in JSON format:
 - 신뢰도 수준: {user_research.get('reliability_level', 'unknown')}
 
 ### 자료 요약
-{json.dumps(user_research.get('documents', [])[:5], ensure_ascii=False, indent=2)}
+{_dumps(user_research.get('documents', [])[:5])}
 
 ### 사용자 가설
 {user_research.get('user_hypothesis', '없음')}
 
 ### 사용자 우려사항
-{json.dumps(user_research.get('user_concerns', []), ensure_ascii=False)}
+{_dumps(user_research.get('user_concerns', []))}
 
 ### ⚠️ 편향 경고 (높은 편향 자료)
-{json.dumps(user_research.get('bias_warnings', []), ensure_ascii=False, indent=2) if user_research.get('bias_warnings') else '없음'}
+{_dumps(user_research.get('bias_warnings', [])) if user_research.get('bias_warnings') else '없음'}
 """
 
         # 종합 분석 섹션
@@ -281,13 +254,13 @@ Provide your counter-argument in JSON format:
             synthesis_section = f"""
 ## 📊 자료 종합 분석
 ### 자료들이 동의하는 점
-{json.dumps(research_synthesis.get('consensus_points', []), ensure_ascii=False)}
+{_dumps(research_synthesis.get('consensus_points', []))}
 
 ### 자료 간 의견 차이
-{json.dumps(research_synthesis.get('divergent_points', []), ensure_ascii=False)}
+{_dumps(research_synthesis.get('divergent_points', []))}
 
 ### 정보 격차 (추가 조사 필요)
-{json.dumps(research_synthesis.get('information_gaps', []), ensure_ascii=False)}
+{_dumps(research_synthesis.get('information_gaps', []))}
 """
 
         prompt = f"""당신은 투자위원회의 Devil's Advocate입니다.
@@ -297,10 +270,10 @@ Provide your counter-argument in JSON format:
 - 에이전트: {target_agent}
 - 점수: {target_score}/10
 - 요약: {target_summary}
-- 핵심 포인트: {json.dumps(target_key_points, ensure_ascii=False)}
+- 핵심 포인트: {_dumps(target_key_points)}
 
 ## 주식 정보
-{json.dumps(stock_info, ensure_ascii=False, indent=2) if stock_info else "정보 없음"}
+{_dumps(stock_info) if stock_info else "정보 없음"}
 {user_research_section}
 {synthesis_section}
 ## 토론 라운드: {round_number}/3 (강도: {intensity})
@@ -353,6 +326,31 @@ Provide your counter-argument in JSON format:
                 "questions": [],
             }
 
+    async def challenge_many(self, contexts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """여러 에이전트에 대한 도전을 동시에 생성합니다.
+
+        토론 한 라운드에서 K개 에이전트를 순차적으로 도전하면 지연 시간이
+        K배가 되므로, 독립적인 도전들을 한 번에 실행합니다.
+
+        Args:
+            contexts: `challenge`에 전달할 컨텍스트 목록
+
+        Returns:
+            도전 결과 목록 (입력 순서 유지)
+        """
+        return list(await asyncio.gather(*(self.challenge(c) for c in contexts)))
+
+    async def rebut_defense_many(self, contexts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """여러 방어에 대한 재반박을 동시에 생성합니다.
+
+        Args:
+            contexts: `rebut_defense`에 전달할 컨텍스트 목록
+
+        Returns:
+            재반박 결과 목록 (입력 순서 유지)
+        """
+        return list(await asyncio.gather(*(self.rebut_defense(c) for c in contexts)))
+
     async def rebut_defense(self, context: dict[str, Any]) -> dict[str, Any]:
         """에이전트의 방어에 대해 재반박합니다.
 
@@ -383,7 +381,7 @@ Provide your counter-argument in JSON format:
 {defense}
 
 ## 인정된 리스크
-{json.dumps(acknowledged, ensure_ascii=False)}
+{_dumps(acknowledged)}
 
 ---
 
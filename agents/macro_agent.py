@@ -1,15 +1,66 @@
 """Macro Agent - 거시경제 전문가."""
-import json
+import asyncio
 import logging
+import string
 from typing import Any, Optional
 
-from agents.base_agent import BaseAgent, AgentConfig
-from models.agent_opinion import AgentType, Sentiment
+from agents.base_agent import BaseAgent, AgentConfig, _dumps
+from models.agent_opinion import AgentType
 from models.analysis_result import MacroAnalysis
 from tools.macro_data import get_interest_rates, get_economic_indicators, get_macro_environment_summary
 
 logger = logging.getLogger(__name__)
 
+# Static analysis prompt, precompiled once at import. The instructions and
+# JSON schema come first, byte-identical across tickers, so inference
+# backends can reuse the cached prompt prefix; ticker-specific data follows.
+_MACRO_PROMPT_TEMPLATE = string.Template(
+    """Analyze the macro environment impact on the stock below.
+
+Please provide a comprehensive macro analysis in JSON format following this structure:
+{
+    "score": <1-10>,
+    "confidence": <0-100>,
+    "sentiment": "<very_bullish|bullish|neutral|bearish|very_bearish>",
+    "summary": "<1-2 sentence summary>",
+    "interest_rate_analysis": {
+        "current_phase": "<description>",
+        "central_bank_stance": "<description>",
+        "yield_curve": "<description>",
+        "impact_on_stock": "<description>"
+    },
+    "liquidity_analysis": {
+        "assessment": "<description>",
+        "impact": "<description>"
+    },
+    "economic_cycle": {
+        "current_phase": "<description>",
+        "sector_positioning": "<description>"
+    },
+    "policy_factors": {
+        "fiscal_policy": "<description>",
+        "industry_policy": "<description>"
+    },
+    "geopolitical_risks": ["<risk1>", "<risk2>"],
+    "stock_specific_impact": {
+        "tailwinds": ["<tailwind1>", "<tailwind2>"],
+        "headwinds": ["<headwind1>", "<headwind2>"],
+        "overall_impact": "<description>"
+    },
+    "key_points": ["<point1>", "<point2>"],
+    "concerns": ["<concern1>", "<concern2>"]
+}
+
+---
+
+Ticker: $ticker
+Sector: $sector
+Industry: $industry
+
+Current Macro Environment:
+$macro_summary"""
+)
+
 
 class MacroAgent(BaseAgent):
     """Macro environment analysis agent."""
@@ -52,57 +103,21 @@ sentiment, and detailed analysis."""
         sector = stock_info.get("info", {}).get("sector", "Unknown")
         industry = stock_info.get("info", {}).get("industry", "Unknown")
 
-        # Get macro data
-        macro_summary = get_macro_environment_summary()
+        # Get macro data off the event loop: the fetch is blocking network
+        # I/O, and running it inline would serialize the sibling agents the
+        # orchestrator gathers concurrently with this one
+        macro_summary = await asyncio.to_thread(get_macro_environment_summary)
 
-        # Build analysis prompt
-        prompt = f"""Analyze the macro environment impact on the following stock:
-
-Ticker: {ticker}
-Sector: {sector}
-Industry: {industry}
-
-Current Macro Environment:
-{json.dumps(macro_summary, indent=2, default=str)}
-
-Please provide a comprehensive macro analysis in JSON format following this structure:
-{{
-    "score": <1-10>,
-    "confidence": <0-100>,
-    "sentiment": "<very_bullish|bullish|neutral|bearish|very_bearish>",
-    "summary": "<1-2 sentence summary>",
-    "interest_rate_analysis": {{
-        "current_phase": "<description>",
-        "central_bank_stance": "<description>",
-        "yield_curve": "<description>",
-        "impact_on_stock": "<description>"
-    }},
-    "liquidity_analysis": {{
-        "assessment": "<description>",
-        "impact": "<description>"
-    }},
-    "economic_cycle": {{
-        "current_phase": "<description>",
-        "sector_positioning": "<description>"
-    }},
-    "policy_factors": {{
-        "fiscal_policy": "<description>",
-        "industry_policy": "<description>"
-    }},
-    "geopolitical_risks": ["<risk1>", "<risk2>"],
-    "stock_specific_impact": {{
-        "tailwinds": ["<tailwind1>", "<tailwind2>"],
-        "headwinds": ["<headwind1>", "<headwind2>"],
-        "overall_impact": "<description>"
-    }},
-    "key_points": ["<point1>", "<point2>"],
-    "concerns": ["<concern1>", "<concern2>"]
-}}"""
+        prompt = _MACRO_PROMPT_TEMPLATE.substitute(
+            ticker=ticker,
+            sector=sector,
+            industry=industry,
+            macro_summary=_dumps(macro_summary),
+        )
 
         try:
-            response = await self.invoke(prompt)
-            # Parse JSON from response
-            result = self._parse_json_response(response)
+            # Stream the response and parse its JSON body incrementally
+            result = await self.invoke_json(prompt)
 
             # Create MacroAnalysis object
             analysis = MacroAnalysis(
@@ -147,38 +162,3 @@ Please provide a comprehensive macro analysis in JSON format following this stru
                 "error": str(e),
                 "analysis": None,
             }
-
-    def _parse_json_response(self, response: str) -> dict[str, Any]:
-        """Parse JSON from LLM response."""
-        try:
-            # Try direct JSON parse
-            return json.loads(response)
-        except json.JSONDecodeError:
-            # Try to extract JSON from markdown code block
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0]
-                return json.loads(json_str)
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0]
-                return json.loads(json_str)
-            else:
-                # Return default structure
-                return {
-                    "score": 5,
-                    "confidence": 50,
-                    "sentiment": "neutral",
-                    "summary": response[:200],
-                    "key_points": [],
-                    "concerns": [],
-                }
-
-    def _map_sentiment(self, sentiment_str: str) -> Sentiment:
-        """Map string sentiment to Sentiment enum."""
-        mapping = {
-            "very_bullish": Sentiment.VERY_BULLISH,
-            "bullish": Sentiment.BULLISH,
-            "neutral": Sentiment.NEUTRAL,
-            "bearish": Sentiment.BEARISH,
-            "very_bearish": Sentiment.VERY_BEARISH,
-        }
-        return mapping.get(sentiment_str.lower(), Sentiment.NEUTRAL)
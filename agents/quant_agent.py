@@ -1,10 +1,11 @@
 """Quant Agent - 재무분석 전문가."""
-import json
+import asyncio
 import logging
+import string
 from typing import Any, Optional
 
-from agents.base_agent import BaseAgent, AgentConfig
-from models.agent_opinion import AgentType, RiskLevel, Sentiment
+from agents.base_agent import BaseAgent, AgentConfig, _dumps, _round_floats
+from models.agent_opinion import AgentType
 from models.analysis_result import QuantAnalysis
 from core.financial_analysis import FinancialAnalyzer
 from core.roic_wacc import calculate_value_creation
@@ -12,6 +13,45 @@ from core.quality_metrics import EarningsQualityAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Static analysis prompt, precompiled once at import. The instructions and
+# JSON schema come first, byte-identical across tickers, so inference
+# backends can reuse the cached prompt prefix; ticker-specific data follows.
+_QUANT_PROMPT_TEMPLATE = string.Template(
+    """Analyze the financial data for the stock below.
+
+Please provide a comprehensive quantitative analysis in JSON format:
+{
+    "score": <1-10>,
+    "confidence": <0-100>,
+    "sentiment": "<very_bullish|bullish|neutral|bearish|very_bearish>",
+    "summary": "<1-2 sentence summary>",
+    "value_creation_assessment": "<description>",
+    "earnings_quality_score": <1-10>,
+    "earnings_manipulation_risk": "<low|medium|high|critical>",
+    "fcf_trend": "<growing|stable|declining>",
+    "cash_conversion_assessment": "<description>",
+    "working_capital_trend": "<improving|stable|deteriorating>",
+    "capital_allocation_assessment": "<description>",
+    "leverage_assessment": "<conservative|moderate|elevated|high>",
+    "key_points": ["<point1>", "<point2>"],
+    "concerns": ["<concern1>", "<concern2>"],
+    "quality_flags": ["<flag1>", "<flag2>"]
+}
+
+---
+
+Ticker: $ticker
+
+Financial Analysis:
+$financial_data
+
+Value Creation Metrics:
+$value_creation
+
+Earnings Quality Analysis:
+$earnings_quality"""
+)
+
 
 class QuantAgent(BaseAgent):
     """Quantitative financial analysis agent."""
@@ -53,50 +93,35 @@ sentiment, and detailed analysis."""
         ticker = context.get("ticker", "")
 
         try:
-            # Get comprehensive financial analysis
-            analyzer = FinancialAnalyzer(ticker)
-            financial_data = analyzer.get_comprehensive_analysis()
-
-            # Get value creation metrics
-            value_creation = calculate_value_creation(ticker)
-
-            # Get earnings quality
-            quality_analyzer = EarningsQualityAnalyzer(ticker)
-            earnings_quality = quality_analyzer.get_comprehensive_quality_analysis()
-
-            # Build analysis prompt
-            prompt = f"""Analyze the financial data for {ticker}:
+            # The three data pulls are independent blocking network/CPU work;
+            # run them in worker threads concurrently so they neither stall
+            # each other nor the event loop the sibling agents run on
+            financial_data, value_creation, earnings_quality = await asyncio.gather(
+                asyncio.to_thread(
+                    lambda: FinancialAnalyzer(ticker).get_comprehensive_analysis()
+                ),
+                asyncio.to_thread(calculate_value_creation, ticker),
+                asyncio.to_thread(
+                    lambda: EarningsQualityAnalyzer(ticker).get_comprehensive_quality_analysis()
+                ),
+            )
 
-Financial Analysis:
-{json.dumps(financial_data, indent=2, default=str)}
+            prompt = _QUANT_PROMPT_TEMPLATE.substitute(
+                ticker=ticker,
+                financial_data=_dumps(_round_floats(financial_data)),
+                value_creation=_dumps(_round_floats(value_creation)),
+                earnings_quality=_dumps(_round_floats(earnings_quality)),
+            )
 
-Value Creation Metrics:
-{json.dumps(value_creation, indent=2, default=str)}
+            # Stream the response and parse its JSON body incrementally
+            result = await self.invoke_json(prompt)
 
-Earnings Quality Analysis:
-{json.dumps(earnings_quality, indent=2, default=str)}
-
-Please provide a comprehensive quantitative analysis in JSON format:
-{{
-    "score": <1-10>,
-    "confidence": <0-100>,
-    "sentiment": "<very_bullish|bullish|neutral|bearish|very_bearish>",
-    "summary": "<1-2 sentence summary>",
-    "value_creation_assessment": "<description>",
-    "earnings_quality_score": <1-10>,
-    "earnings_manipulation_risk": "<low|medium|high|critical>",
-    "fcf_trend": "<growing|stable|declining>",
-    "cash_conversion_assessment": "<description>",
-    "working_capital_trend": "<improving|stable|deteriorating>",
-    "capital_allocation_assessment": "<description>",
-    "leverage_assessment": "<conservative|moderate|elevated|high>",
-    "key_points": ["<point1>", "<point2>"],
-    "concerns": ["<concern1>", "<concern2>"],
-    "quality_flags": ["<flag1>", "<flag2>"]
-}}"""
-
-            response = await self.invoke(prompt)
-            result = self._parse_json_response(response)
+            # Extract nested sections once instead of re-walking the same
+            # dicts per field below (`or {}` also tolerates explicit None)
+            cash_flow = financial_data.get("cash_flow") or {}
+            cf0 = (cash_flow.get("history") or [{}])[0]
+            wc0 = ((earnings_quality.get("working_capital_analysis") or {}).get("history") or [{}])[0]
+            leverage_metrics = (financial_data.get("leverage") or {}).get("metrics") or {}
 
             # Create QuantAnalysis object
             analysis = QuantAnalysis(
@@ -108,26 +133,26 @@ Please provide a comprehensive quantitative analysis in JSON format:
                 roic_wacc_spread=value_creation.get("spread"),
                 eva=value_creation.get("eva"),
                 value_creation_assessment=result.get("value_creation_assessment", ""),
-                ocf_to_operating_income=financial_data.get("cash_flow", {}).get("history", [{}])[0].get("operating_cf"),
+                ocf_to_operating_income=cf0.get("operating_cf"),
                 fcf_trend=result.get("fcf_trend", "stable"),
-                fcf_margin=financial_data.get("cash_flow", {}).get("fcf_yield"),
+                fcf_margin=cash_flow.get("fcf_yield"),
                 cash_conversion_assessment=result.get("cash_conversion_assessment", ""),
-                accrual_ratio=earnings_quality.get("accrual_analysis", {}).get("accrual_ratio"),
+                accrual_ratio=(earnings_quality.get("accrual_analysis") or {}).get("accrual_ratio"),
                 earnings_quality_score=result.get("earnings_quality_score", 5),
                 earnings_manipulation_risk=self._map_risk_level(result.get("earnings_manipulation_risk", "low")),
                 quality_flags=result.get("quality_flags", []),
-                capex_to_depreciation=earnings_quality.get("capex_analysis", {}).get("avg_capex_to_depreciation"),
+                capex_to_depreciation=(earnings_quality.get("capex_analysis") or {}).get("avg_capex_to_depreciation"),
                 capital_allocation_assessment=result.get("capital_allocation_assessment", ""),
-                days_sales_outstanding=earnings_quality.get("working_capital_analysis", {}).get("history", [{}])[0].get("dso"),
-                days_inventory_outstanding=earnings_quality.get("working_capital_analysis", {}).get("history", [{}])[0].get("dio"),
-                days_payable_outstanding=earnings_quality.get("working_capital_analysis", {}).get("history", [{}])[0].get("dpo"),
-                cash_conversion_cycle=earnings_quality.get("working_capital_analysis", {}).get("history", [{}])[0].get("cash_conversion_cycle"),
+                days_sales_outstanding=wc0.get("dso"),
+                days_inventory_outstanding=wc0.get("dio"),
+                days_payable_outstanding=wc0.get("dpo"),
+                cash_conversion_cycle=wc0.get("cash_conversion_cycle"),
                 working_capital_trend=result.get("working_capital_trend", "stable"),
-                debt_to_equity=financial_data.get("leverage", {}).get("metrics", {}).get("debt_to_equity"),
-                interest_coverage=financial_data.get("leverage", {}).get("metrics", {}).get("interest_coverage"),
-                current_ratio=financial_data.get("leverage", {}).get("metrics", {}).get("current_ratio"),
+                debt_to_equity=leverage_metrics.get("debt_to_equity"),
+                interest_coverage=leverage_metrics.get("interest_coverage"),
+                current_ratio=leverage_metrics.get("current_ratio"),
                 leverage_assessment=result.get("leverage_assessment", "moderate"),
-                key_metrics=financial_data.get("profitability", {}).get("current_metrics", {}),
+                key_metrics=(financial_data.get("profitability") or {}).get("current_metrics") or {},
             )
 
             return {
@@ -154,45 +179,3 @@ Please provide a comprehensive quantitative analysis in JSON format:
                 "error": str(e),
                 "analysis": None,
             }
-
-    def _parse_json_response(self, response: str) -> dict[str, Any]:
-        """Parse JSON from LLM response."""
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0]
-                return json.loads(json_str)
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0]
-                return json.loads(json_str)
-            else:
-                return {
-                    "score": 5,
-                    "confidence": 50,
-                    "sentiment": "neutral",
-                    "summary": response[:200],
-                    "key_points": [],
-                    "concerns": [],
-                }
-
-    def _map_sentiment(self, sentiment_str: str) -> Sentiment:
-        """Map string sentiment to Sentiment enum."""
-        mapping = {
-            "very_bullish": Sentiment.VERY_BULLISH,
-            "bullish": Sentiment.BULLISH,
-            "neutral": Sentiment.NEUTRAL,
-            "bearish": Sentiment.BEARISH,
-            "very_bearish": Sentiment.VERY_BEARISH,
-        }
-        return mapping.get(sentiment_str.lower(), Sentiment.NEUTRAL)
-
-    def _map_risk_level(self, risk_str: str) -> RiskLevel:
-        """Map string risk level to RiskLevel enum."""
-        mapping = {
-            "low": RiskLevel.LOW,
-            "medium": RiskLevel.MEDIUM,
-            "high": RiskLevel.HIGH,
-            "critical": RiskLevel.CRITICAL,
-        }
-        return mapping.get(risk_str.lower(), RiskLevel.MEDIUM)
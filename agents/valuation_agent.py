@@ -1,16 +1,75 @@
 """Valuation Agent - 밸류에이션 전문가."""
-import json
+import asyncio
 import logging
+import string
 from typing import Any, Optional
 
-from agents.base_agent import BaseAgent, AgentConfig
-from models.agent_opinion import AgentType, Sentiment
+from agents.base_agent import BaseAgent, AgentConfig, _dumps, _round_floats
+from models.agent_opinion import AgentType
 from models.analysis_result import ValuationAnalysis, ValuationScenario
 from core.valuation_models import get_comprehensive_valuation
 from tools.stock_price import get_stock_info
 
 logger = logging.getLogger(__name__)
 
+# Static analysis prompt, precompiled once at import. The instructions and
+# JSON schema come first, byte-identical across tickers, so inference
+# backends can reuse the cached prompt prefix; ticker-specific data follows.
+_VALUATION_PROMPT_TEMPLATE = string.Template(
+    """Analyze the valuation for the stock below.
+
+Please provide a comprehensive valuation analysis in JSON format:
+{
+    "score": <1-10>,
+    "confidence": <0-100>,
+    "sentiment": "<very_bullish|bullish|neutral|bearish|very_bearish>",
+    "summary": "<1-2 sentence summary>",
+    "current_vs_historical": "<below_average|near_average|above_average>",
+    "bear_case": {
+        "probability": 20,
+        "target_price": <number>,
+        "key_assumptions": ["<assumption1>", "<assumption2>"],
+        "upside_downside": <percentage>
+    },
+    "base_case": {
+        "probability": 60,
+        "target_price": <number>,
+        "key_assumptions": ["<assumption1>", "<assumption2>"],
+        "upside_downside": <percentage>
+    },
+    "bull_case": {
+        "probability": 20,
+        "target_price": <number>,
+        "key_assumptions": ["<assumption1>", "<assumption2>"],
+        "upside_downside": <percentage>
+    },
+    "methodology_weights": {
+        "dcf": <0-100>,
+        "per": <0-100>,
+        "pbr": <0-100>,
+        "ev_ebitda": <0-100>
+    },
+    "margin_of_safety": <percentage or null>,
+    "key_points": ["<point1>", "<point2>"],
+    "concerns": ["<concern1>", "<concern2>"],
+    "catalysts": ["<catalyst1>", "<catalyst2>"]
+}
+
+---
+
+Ticker: $ticker
+Current Price: $current_price $currency
+
+Valuation Data:
+$valuation_data
+
+Quant Analysis Context:
+$quant_analysis
+
+Industry Analysis Context:
+$industry_analysis"""
+)
+
 
 class ValuationAgent(BaseAgent):
     """Valuation analysis agent."""
@@ -49,83 +108,53 @@ sentiment, target prices, and detailed methodology."""
         ticker = context.get("ticker", "")
 
         try:
-            # Get comprehensive valuation
-            valuation_data = get_comprehensive_valuation(ticker)
-
-            # Get stock info for current price
-            stock_info = get_stock_info.invoke({"ticker": ticker})
+            # Both data pulls are blocking network I/O; fetch them in worker
+            # threads concurrently instead of serializing on the event loop
+            valuation_data, stock_info = await asyncio.gather(
+                asyncio.to_thread(get_comprehensive_valuation, ticker),
+                asyncio.to_thread(get_stock_info.invoke, {"ticker": ticker}),
+            )
             current_price = stock_info.get("current_price") or valuation_data.get("current_price")
+            if not current_price:
+                # Without a price, every target/upside computation below is
+                # meaningless; fail loudly instead of valuing against 0
+                logger.error(f"No current price available for {ticker}; skipping valuation")
+                return {
+                    "error": f"No current price available for {ticker}",
+                    "analysis": None,
+                }
+            current_price = float(current_price)
             currency = stock_info.get("info", {}).get("currency", "USD") if isinstance(stock_info.get("info"), dict) else "USD"
 
             # Get other agent analyses from context
             quant_analysis = context.get("quant_analysis", {})
             industry_analysis = context.get("industry_analysis", {})
 
-            # Build analysis prompt
-            prompt = f"""Analyze the valuation for {ticker}:
-
-Current Price: {current_price} {currency}
-
-Valuation Data:
-{json.dumps(valuation_data, indent=2, default=str)}
-
-Quant Analysis Context:
-{json.dumps(quant_analysis, indent=2, default=str)}
-
-Industry Analysis Context:
-{json.dumps(industry_analysis, indent=2, default=str)}
-
-Please provide a comprehensive valuation analysis in JSON format:
-{{
-    "score": <1-10>,
-    "confidence": <0-100>,
-    "sentiment": "<very_bullish|bullish|neutral|bearish|very_bearish>",
-    "summary": "<1-2 sentence summary>",
-    "current_vs_historical": "<below_average|near_average|above_average>",
-    "bear_case": {{
-        "probability": 20,
-        "target_price": <number>,
-        "key_assumptions": ["<assumption1>", "<assumption2>"],
-        "upside_downside": <percentage>
-    }},
-    "base_case": {{
-        "probability": 60,
-        "target_price": <number>,
-        "key_assumptions": ["<assumption1>", "<assumption2>"],
-        "upside_downside": <percentage>
-    }},
-    "bull_case": {{
-        "probability": 20,
-        "target_price": <number>,
-        "key_assumptions": ["<assumption1>", "<assumption2>"],
-        "upside_downside": <percentage>
-    }},
-    "methodology_weights": {{
-        "dcf": <0-100>,
-        "per": <0-100>,
-        "pbr": <0-100>,
-        "ev_ebitda": <0-100>
-    }},
-    "margin_of_safety": <percentage or null>,
-    "key_points": ["<point1>", "<point2>"],
-    "concerns": ["<concern1>", "<concern2>"],
-    "catalysts": ["<catalyst1>", "<catalyst2>"]
-}}"""
+            prompt = _VALUATION_PROMPT_TEMPLATE.substitute(
+                ticker=ticker,
+                current_price=current_price,
+                currency=currency,
+                valuation_data=_dumps(_round_floats(valuation_data)),
+                quant_analysis=_dumps(_round_floats(quant_analysis)),
+                industry_analysis=_dumps(_round_floats(industry_analysis)),
+            )
 
-            response = await self.invoke(prompt)
-            result = self._parse_json_response(response)
+            # Stream the response and parse its JSON body incrementally
+            result = await self.invoke_json(prompt)
 
-            # Extract target prices
-            dcf_data = valuation_data.get("dcf_valuation", {}).get("base_case", {})
-            target_range = valuation_data.get("target_price_range", {})
+            # Extract nested sections once instead of re-walking the same
+            # dicts per field below (`or {}` also tolerates explicit None)
+            dcf_data = (valuation_data.get("dcf_valuation") or {}).get("base_case") or {}
+            target_range = valuation_data.get("target_price_range") or {}
+            current_multiples = (valuation_data.get("relative_valuation") or {}).get("current_multiples") or {}
 
             target_low = result.get("bear_case", {}).get("target_price") or target_range.get("low")
             target_mid = result.get("base_case", {}).get("target_price") or target_range.get("mid")
             target_high = result.get("bull_case", {}).get("target_price") or target_range.get("high")
 
-            # Calculate expected return
+            # Calculate expected return (current_price is guaranteed non-zero)
             expected_return = 0
-            if current_price and target_mid:
+            if target_mid:
                 expected_return = ((target_mid - current_price) / current_price) * 100
 
             # Create scenario objects
@@ -158,13 +187,13 @@ Please provide a comprehensive valuation analysis in JSON format:
                 score=result.get("score", 5),
                 sentiment=self._map_sentiment(result.get("sentiment", "neutral")),
                 summary=result.get("summary", ""),
-                current_price=current_price or 0,
+                current_price=current_price,
                 currency=currency,
                 dcf_value=dcf_data.get("intrinsic_value"),
                 dcf_assumptions=dcf_data.get("assumptions", {}),
-                peer_pe_average=valuation_data.get("relative_valuation", {}).get("current_multiples", {}).get("pe_ratio"),
-                peer_pb_average=valuation_data.get("relative_valuation", {}).get("current_multiples", {}).get("pb_ratio"),
-                peer_ev_ebitda_average=valuation_data.get("relative_valuation", {}).get("current_multiples", {}).get("ev_ebitda"),
+                peer_pe_average=current_multiples.get("pe_ratio"),
+                peer_pb_average=current_multiples.get("pb_ratio"),
+                peer_ev_ebitda_average=current_multiples.get("ev_ebitda"),
                 current_vs_historical=result.get("current_vs_historical", "near_average"),
                 bear_case=bear_case,
                 base_case=base_case,
@@ -200,35 +229,3 @@ Please provide a comprehensive valuation analysis in JSON format:
                 "error": str(e),
                 "analysis": None,
             }
-
-    def _parse_json_response(self, response: str) -> dict[str, Any]:
-        """Parse JSON from LLM response."""
-        try:
-            return json.loads(response)
-        except json.JSONDecodeError:
-            if "```json" in response:
-                json_str = response.split("```json")[1].split("```")[0]
-                return json.loads(json_str)
-            elif "```" in response:
-                json_str = response.split("```")[1].split("```")[0]
-                return json.loads(json_str)
-            else:
-                return {
-                    "score": 5,
-                    "confidence": 50,
-                    "sentiment": "neutral",
-                    "summary": response[:200],
-                    "key_points": [],
-                    "concerns": [],
-                }
-
-    def _map_sentiment(self, sentiment_str: str) -> Sentiment:
-        """Map string sentiment to Sentiment enum."""
-        mapping = {
-            "very_bullish": Sentiment.VERY_BULLISH,
-            "bullish": Sentiment.BULLISH,
-            "neutral": Sentiment.NEUTRAL,
-            "bearish": Sentiment.BEARISH,
-            "very_bearish": Sentiment.VERY_BEARISH,
-        }
-        return mapping.get(sentiment_str.lower(), Sentiment.NEUTRAL)
@@ -3,7 +3,10 @@
 AI 투자위원회와 인간 투자자의 치열한 분석 대결을 위한
 Streamlit UI 컴포넌트입니다.
 """
+import os
 import streamlit as st
+from bisect import bisect_left
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -23,15 +26,125 @@ from models.battle_game import (
 )
 
 
-def render_battle_arena_header():
-    """대결 아레나 헤더 렌더링."""
-    st.markdown("""
+# 매 rerun마다 함수 안에서 dict 리터럴을 다시 만들지 않도록
+# 표시용 상수는 모듈 수준에 한 번만 정의합니다.
+_BATTLE_TYPE_ICONS = {"standard": "⚖️", "speed": "⚡", "deep_dive": "🔬", "contrarian": "🔄"}
+_EXPERIENCE_LABELS = {
+    "beginner": "🌱 초보 (1년 미만)", "intermediate": "🌿 중급 (1-5년)",
+    "expert": "🌳 전문가 (5-10년)", "professional": "🏆 프로 (10년+)",
+}
+_RECOMMENDATION_LABELS = {
+    "Strong Buy": "🚀 적극 매수", "Buy": "📈 매수",
+    "Hold": "⏸️ 보유", "Sell": "📉 매도", "Strong Sell": "🔻 적극 매도",
+}
+_RECOMMENDATION_COLOR = {
+    "Strong Buy": "green", "Buy": "lightgreen",
+    "Hold": "gray", "Sell": "orange", "Strong Sell": "red",
+}
+# AI 추천은 한국어로 올 수도 있으므로 영문 표준형으로 정규화한 뒤
+# _RECOMMENDATION_COLOR 하나로 색을 조회합니다 (색 맵 중복 제거).
+_NORMALIZE_REC = {
+    "적극 매수": "Strong Buy", "매수": "Buy", "보유": "Hold",
+    "매도": "Sell", "적극 매도": "Strong Sell",
+}
+_WINNER_TEXT = {"ai": "🤖 AI 위원회 승리!", "draw": "🤝 무승부!"}
+_WINNER_COLOR = {"human": "#4CAF50", "ai": "#E91E63", "draw": "#FFC107"}
+_PERIOD_LABELS = {"weekly": "이번 주", "monthly": "이번 달", "all-time": "전체"}
+_TIMER_THRESHOLDS = (5, 10)
+_TIMER_COLORS = ("red", "orange", "green")
+_MEDAL_MAP = {1: "🥇", 2: "🥈", 3: "🥉"}
+
+
+# selectbox/radio의 format_func로 쓸 모듈 수준 함수들.
+# 인라인 lambda는 rerun마다 클로저를 새로 만들므로 한 번만 정의합니다.
+def _format_experience(value: str) -> str:
+    return _EXPERIENCE_LABELS.get(value, value)
+
+
+def _format_recommendation(value: str) -> str:
+    return _RECOMMENDATION_LABELS.get(value, value)
+
+
+def _format_period(value: str) -> str:
+    return _PERIOD_LABELS.get(value, value)
+
+# 정적 HTML 블록과 포맷 템플릿. 매 rerun마다 멀티라인 f-string을
+# 다시 파싱/조립하지 않도록 모듈 수준에 한 번만 만들어 둡니다.
+_HEADER_HTML = """
     <div style="text-align: center; padding: 20px; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); border-radius: 15px; margin-bottom: 20px;">
         <h1 style="color: #e94560; margin: 0;">⚔️ AI vs HUMAN ⚔️</h1>
         <h2 style="color: #0f3460; margin: 5px 0;">투자 분석 대결</h2>
         <p style="color: #aaa; margin: 0;">인공지능 투자위원회 vs 인간 투자자의 분석 대결</p>
     </div>
-    """, unsafe_allow_html=True)
+    """
+_VS_HTML = """
+        <div style="text-align: center; padding: 20px;">
+            <h1>VS</h1>
+        </div>
+        """
+_AI_CARD_HTML = """
+        <div style="text-align: center; padding: 20px; background: #5f1e3a; border-radius: 15px;">
+            <h2>🤖 AI 위원회</h2>
+            <p>인공지능 투자위원회</p>
+        </div>
+        """
+_HUMAN_CARD_TPL = """
+        <div style="text-align: center; padding: 20px; background: #1e3a5f; border-radius: 15px;">
+            <h2>🧠 {name}</h2>
+            <p>인간 분석가</p>
+        </div>
+        """
+_WINNER_TPL = """
+    <div style="text-align: center; padding: 30px; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); border-radius: 20px; border: 3px solid {color};">
+        <h1 style="color: {color};">{text}</h1>
+        <h2>점수: 🧠 {human_score} vs 🤖 {ai_score}</h2>
+    </div>
+    """
+_VOTE_BAR_TPL = """
+    <div style="display: flex; height: 30px; border-radius: 15px; overflow: hidden;">
+        <div style="width: {human_pct}%; background: #1e3a5f;"></div>
+        <div style="width: {ai_pct}%; background: #5f1e3a;"></div>
+    </div>
+    <p style="text-align: center; color: #888;">{total}명 투표</p>
+    """
+_PROFILE_TPL = """
+    <div style="text-align: center; padding: 20px; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); border-radius: 15px; border: 2px solid {color};">
+        <h1>{icon} {tier}</h1>
+        <h2>{username}</h2>
+        <p>순위: #{rank}</p>
+    </div>
+    """
+
+
+_ALERT_COLORS = {
+    "green": ("rgba(40, 167, 69, 0.15)", "#28a745"),
+    "red": ("rgba(220, 53, 69, 0.15)", "#dc3545"),
+}
+
+
+def _render_alert_list(items: list[str], color: str):
+    """번호 매긴 항목들을 알림 스타일 div 하나로 묶어 렌더링.
+
+    항목마다 st.success/st.error를 호출하면 항목 수만큼 프런트엔드
+    메시지가 발생하므로 HTML을 합쳐 st.markdown 한 번으로 그립니다.
+    """
+    background, border = _ALERT_COLORS[color]
+    blocks = "".join(
+        f'<div style="background: {background}; border-left: 4px solid {border}; '
+        f'border-radius: 4px; padding: 8px 12px; margin-bottom: 6px;">{i}. {item}</div>'
+        for i, item in enumerate(items, 1)
+    )
+    st.markdown(blocks, unsafe_allow_html=True)
+
+
+def _count_nonempty(text: str) -> int:
+    """줄바꿈으로 구분된 텍스트의 비어 있지 않은 줄 수를 셉니다."""
+    return sum(1 for line in text.split("\n") if line.strip())
+
+
+def render_battle_arena_header():
+    """대결 아레나 헤더 렌더링."""
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 
 def render_battle_type_selector() -> str:
@@ -43,7 +156,7 @@ def render_battle_type_selector() -> str:
 
     for i, (type_key, type_info) in enumerate(BATTLE_TYPES.items()):
         with cols[i]:
-            icon = {"standard": "⚖️", "speed": "⚡", "deep_dive": "🔬", "contrarian": "🔄"}.get(type_key, "🎯")
+            icon = _BATTLE_TYPE_ICONS.get(type_key, "🎯")
             time_text = f"{type_info['time_limit']}분" if type_info['time_limit'] else "무제한"
 
             if st.button(
@@ -83,121 +196,140 @@ def render_ticker_selection() -> Optional[str]:
     return ticker if ticker else None
 
 
-def render_human_analysis_form(ticker: str) -> Optional[HumanAnalysis]:
-    """인간 분석 입력 폼."""
-    st.markdown("### 🧠 당신의 분석을 입력하세요")
-    st.markdown("AI와 대결하기 위해 아래 분석을 완성하세요.")
-
-    # 타이머 표시
-    if "battle_start_time" not in st.session_state:
-        st.session_state.battle_start_time = datetime.now()
+@st.fragment(run_every="30s")
+def _render_timer(time_limit: int):
+    """남은 시간 배너 렌더링.
 
+    프래그먼트로 분리해 타이머 갱신 시 배너만 다시 그리고,
+    폼의 나머지 위젯들은 재렌더링되지 않도록 합니다.
+    """
     elapsed = (datetime.now() - st.session_state.battle_start_time).seconds // 60
-    battle_type = st.session_state.get("battle_type", "standard")
-    time_limit = BATTLE_TYPES[battle_type]["time_limit"]
-
-    if time_limit:
-        remaining = max(0, time_limit - elapsed)
-        color = "green" if remaining > 10 else "orange" if remaining > 5 else "red"
-        st.markdown(f"""
-        <div style="text-align: center; padding: 10px; background: #1a1a2e; border-radius: 10px; margin-bottom: 20px;">
-            <h3 style="color: {color}; margin: 0;">⏱️ 남은 시간: {remaining}분</h3>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # 기본 정보
-    col1, col2 = st.columns(2)
-
-    with col1:
-        analyst_name = st.text_input("분석자 이름", key="analyst_name", placeholder="닉네임")
-        experience = st.selectbox(
-            "투자 경험",
-            options=["beginner", "intermediate", "expert", "professional"],
-            format_func=lambda x: {"beginner": "🌱 초보 (1년 미만)", "intermediate": "🌿 중급 (1-5년)",
-                                   "expert": "🌳 전문가 (5-10년)", "professional": "🏆 프로 (10년+)"}.get(x, x),
-            key="experience"
-        )
-
-    with col2:
-        recommendation = st.selectbox(
-            "투자 의견",
-            options=["Strong Buy", "Buy", "Hold", "Sell", "Strong Sell"],
-            format_func=lambda x: {"Strong Buy": "🚀 적극 매수", "Buy": "📈 매수",
-                                   "Hold": "⏸️ 보유", "Sell": "📉 매도", "Strong Sell": "🔻 적극 매도"}.get(x, x),
-            key="recommendation"
-        )
-        target_price = st.number_input("목표 주가", min_value=0.0, key="target_price")
-
-    col3, col4 = st.columns(2)
-
-    with col3:
-        confidence = st.slider("확신도", 1, 10, 5, key="confidence")
+    remaining = max(0, time_limit - elapsed)
+    # 남은 시간 구간(≤5 빨강, ≤10 주황, 초과 초록)을 bisect로 선택
+    color = _TIMER_COLORS[bisect_left(_TIMER_THRESHOLDS, remaining)]
+    st.markdown(f"""
+    <div style="text-align: center; padding: 10px; background: #1a1a2e; border-radius: 10px; margin-bottom: 20px;">
+        <h3 style="color: {color}; margin: 0;">⏱️ 남은 시간: {remaining}분</h3>
+    </div>
+    """, unsafe_allow_html=True)
 
-    with col4:
-        time_horizon = st.selectbox(
-            "투자 기간",
-            options=["1개월", "3개월", "6개월", "1년", "1년 이상"],
-            key="time_horizon"
-        )
 
-    # 분석 근거
-    st.markdown("#### 📝 분석 근거")
+def render_human_analysis_form(ticker: str, time_limit: Optional[int] = None) -> Optional[HumanAnalysis]:
+    """인간 분석 입력 폼.
 
-    bull_thesis = st.text_area(
-        "매수 근거 (줄바꿈으로 구분, 최소 3개)",
-        key="bull_thesis",
-        height=100,
-        placeholder="1. 첫 번째 매수 근거\n2. 두 번째 매수 근거\n3. 세 번째 매수 근거"
-    )
+    time_limit은 호출부에서 조회한 값을 넘겨받아 폼이 rerun될 때마다
+    BATTLE_TYPES를 다시 조회하지 않습니다. 생략하면 세션의 대결
+    유형으로 직접 조회합니다.
+    """
+    st.markdown("### 🧠 당신의 분석을 입력하세요")
+    st.markdown("AI와 대결하기 위해 아래 분석을 완성하세요.")
 
-    bear_thesis = st.text_area(
-        "매도/리스크 근거 (줄바꿈으로 구분, 최소 3개)",
-        key="bear_thesis",
-        height=100,
-        placeholder="1. 첫 번째 리스크\n2. 두 번째 리스크\n3. 세 번째 리스크"
-    )
+    # 타이머 표시
+    st.session_state.setdefault("battle_start_time", datetime.now())
 
-    col5, col6 = st.columns(2)
+    if time_limit is None:
+        battle_type = st.session_state.get("battle_type", "standard")
+        time_limit = BATTLE_TYPES[battle_type]["time_limit"]
 
-    with col5:
-        catalysts = st.text_area(
-            "핵심 촉매/이벤트",
-            key="catalysts",
-            height=80,
-            placeholder="주가 상승을 이끌 핵심 이벤트들"
+    if time_limit:
+        _render_timer(time_limit)
+
+    # st.form으로 묶어 입력 위젯 변경이 rerun을 일으키지 않고,
+    # 제출 버튼을 눌렀을 때만 한 번에 스크립트가 재실행되게 합니다.
+    # 타이머 프래그먼트는 폼 밖에 두어 계속 갱신됩니다.
+    with st.form("human_analysis_form"):
+        # 기본 정보
+        col1, col2 = st.columns(2)
+
+        with col1:
+            analyst_name = st.text_input("분석자 이름", key="analyst_name", placeholder="닉네임")
+            experience = st.selectbox(
+                "투자 경험",
+                options=["beginner", "intermediate", "expert", "professional"],
+                format_func=_format_experience,
+                key="experience"
+            )
+
+        with col2:
+            recommendation = st.selectbox(
+                "투자 의견",
+                options=["Strong Buy", "Buy", "Hold", "Sell", "Strong Sell"],
+                format_func=_format_recommendation,
+                key="recommendation"
+            )
+            target_price = st.number_input("목표 주가", min_value=0.0, key="target_price")
+
+        col3, col4 = st.columns(2)
+
+        with col3:
+            confidence = st.slider("확신도", 1, 10, 5, key="confidence")
+
+        with col4:
+            time_horizon = st.selectbox(
+                "투자 기간",
+                options=["1개월", "3개월", "6개월", "1년", "1년 이상"],
+                key="time_horizon"
+            )
+
+        # 분석 근거: expander로 묶어 접혀 있는 동안에는 내부 텍스트영역
+        # DOM 렌더링을 지연시킬 수 있게 합니다.
+        with st.expander("📝 분석 근거 입력", expanded=True):
+            bull_thesis = st.text_area(
+                "매수 근거 (줄바꿈으로 구분, 최소 3개)",
+                key="bull_thesis",
+                height=100,
+                placeholder="1. 첫 번째 매수 근거\n2. 두 번째 매수 근거\n3. 세 번째 매수 근거"
+            )
+
+            bear_thesis = st.text_area(
+                "매도/리스크 근거 (줄바꿈으로 구분, 최소 3개)",
+                key="bear_thesis",
+                height=100,
+                placeholder="1. 첫 번째 리스크\n2. 두 번째 리스크\n3. 세 번째 리스크"
+            )
+
+            col5, col6 = st.columns(2)
+
+            with col5:
+                catalysts = st.text_area(
+                    "핵심 촉매/이벤트",
+                    key="catalysts",
+                    height=80,
+                    placeholder="주가 상승을 이끌 핵심 이벤트들"
+                )
+
+            with col6:
+                risks = st.text_area(
+                    "주요 리스크",
+                    key="risks",
+                    height=80,
+                    placeholder="투자 리스크 요인들"
+                )
+
+        analysis_summary = st.text_area(
+            "분석 요약 (200자 이상)",
+            key="analysis_summary",
+            height=150,
+            placeholder="전체 분석 내용을 요약해주세요..."
         )
 
-    with col6:
-        risks = st.text_area(
-            "주요 리스크",
-            key="risks",
-            height=80,
-            placeholder="투자 리스크 요인들"
+        submitted = st.form_submit_button(
+            "⚔️ AI와 대결 시작!", type="primary", use_container_width=True
         )
 
-    analysis_summary = st.text_area(
-        "분석 요약 (200자 이상)",
-        key="analysis_summary",
-        height=150,
-        placeholder="전체 분석 내용을 요약해주세요..."
-    )
-
-    # 제출 버튼
-    if st.button("⚔️ AI와 대결 시작!", type="primary", use_container_width=True):
-        # 유효성 검사
-        bull_list = [b.strip() for b in bull_thesis.split("\n") if b.strip()]
-        bear_list = [b.strip() for b in bear_thesis.split("\n") if b.strip()]
-
+    if submitted:
+        # 유효성 검사: 리스트를 실제로 만들기 전에 개수만 먼저 세서
+        # 거부 경로에서는 strip된 문자열 리스트를 할당하지 않습니다.
         if not analyst_name:
             st.error("분석자 이름을 입력해주세요.")
             return None
         if target_price <= 0:
             st.error("목표 주가를 입력해주세요.")
             return None
-        if len(bull_list) < 3:
+        if _count_nonempty(bull_thesis) < 3:
             st.error("매수 근거를 최소 3개 이상 입력해주세요.")
             return None
-        if len(bear_list) < 3:
+        if _count_nonempty(bear_thesis) < 3:
             st.error("매도/리스크 근거를 최소 3개 이상 입력해주세요.")
             return None
         if len(analysis_summary) < 200:
@@ -213,8 +345,8 @@ def render_human_analysis_form(ticker: str) -> Optional[HumanAnalysis]:
             target_price=target_price,
             confidence_score=confidence,
             time_horizon=time_horizon,
-            bull_thesis=bull_list,
-            bear_thesis=bear_list,
+            bull_thesis=[b.strip() for b in bull_thesis.split("\n") if b.strip()],
+            bear_thesis=[b.strip() for b in bear_thesis.split("\n") if b.strip()],
             key_catalysts=[c.strip() for c in catalysts.split("\n") if c.strip()],
             key_risks=[r.strip() for r in risks.split("\n") if r.strip()],
             analysis_summary=analysis_summary,
@@ -224,55 +356,17 @@ def render_human_analysis_form(ticker: str) -> Optional[HumanAnalysis]:
     return None
 
 
-def render_battle_comparison(battle: InvestmentBattle):
-    """AI vs Human 분석 비교 렌더링."""
-    st.markdown("## ⚔️ 분석 대결 비교")
-
-    human = battle.human_analysis
-    ai = battle.ai_analysis
-
-    if not human or not ai:
-        st.warning("대결 데이터가 완전하지 않습니다.")
-        return
-
-    # 헤더
-    col1, col2, col3 = st.columns([2, 1, 2])
-
-    with col1:
-        st.markdown(f"""
-        <div style="text-align: center; padding: 20px; background: #1e3a5f; border-radius: 15px;">
-            <h2>🧠 {human.analyst_name}</h2>
-            <p>인간 분석가</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        st.markdown("""
-        <div style="text-align: center; padding: 20px;">
-            <h1>VS</h1>
-        </div>
-        """, unsafe_allow_html=True)
-
-    with col3:
-        st.markdown("""
-        <div style="text-align: center; padding: 20px; background: #5f1e3a; border-radius: 15px;">
-            <h2>🤖 AI 위원회</h2>
-            <p>인공지능 투자위원회</p>
-        </div>
-        """, unsafe_allow_html=True)
-
-    st.markdown("---")
-
-    # 투자의견 비교
+# 비교 뷰의 각 섹션은 독립적인 프래그먼트로 분리해, 한 섹션만 바뀌어도
+# (예: 관전자 투표 클릭) 나머지 섹션의 columns/DOM을 다시 만들지 않습니다.
+@st.fragment
+def _render_recommendation_panel(human: HumanAnalysis, ai: AIAnalysisSummary):
+    """투자의견 비교 패널."""
     st.markdown("### 📊 투자의견 비교")
 
     col1, col2 = st.columns(2)
 
     with col1:
-        recommendation_color = {
-            "Strong Buy": "green", "Buy": "lightgreen",
-            "Hold": "gray", "Sell": "orange", "Strong Sell": "red"
-        }.get(human.recommendation, "gray")
+        recommendation_color = _RECOMMENDATION_COLOR.get(human.recommendation, "gray")
 
         st.markdown(f"""
         <div style="text-align: center; padding: 15px; background: #1a1a2e; border-radius: 10px; border: 2px solid {recommendation_color};">
@@ -284,12 +378,8 @@ def render_battle_comparison(battle: InvestmentBattle):
         """, unsafe_allow_html=True)
 
     with col2:
-        ai_rec_color = {
-            "Strong Buy": "green", "Buy": "lightgreen", "적극 매수": "green", "매수": "lightgreen",
-            "Hold": "gray", "보유": "gray",
-            "Sell": "orange", "매도": "orange",
-            "Strong Sell": "red", "적극 매도": "red"
-        }.get(ai.recommendation, "gray")
+        ai_rec = _NORMALIZE_REC.get(ai.recommendation, ai.recommendation)
+        ai_rec_color = _RECOMMENDATION_COLOR.get(ai_rec, "gray")
 
         st.markdown(f"""
         <div style="text-align: center; padding: 15px; background: #1a1a2e; border-radius: 10px; border: 2px solid {ai_rec_color};">
@@ -311,37 +401,42 @@ def render_battle_comparison(battle: InvestmentBattle):
     else:
         st.info(f"🤝 목표가 차이: {price_diff_pct:.1f}% - 비교적 유사한 의견")
 
-    # 매수 근거 비교
+
+@st.fragment
+def _render_thesis_panel(human: HumanAnalysis, ai: AIAnalysisSummary):
+    """매수 근거 비교 패널."""
     st.markdown("### 📈 매수 근거")
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("**🧠 인간 분석가**")
-        for i, thesis in enumerate(human.bull_thesis, 1):
-            st.success(f"{i}. {thesis}")
+        _render_alert_list(human.bull_thesis, "green")
 
     with col2:
         st.markdown("**🤖 AI 위원회**")
-        for i, thesis in enumerate(ai.bull_thesis, 1):
-            st.success(f"{i}. {thesis}")
+        _render_alert_list(ai.bull_thesis, "green")
 
-    # 리스크 비교
+
+@st.fragment
+def _render_risk_panel(human: HumanAnalysis, ai: AIAnalysisSummary):
+    """리스크 요인 비교 패널."""
     st.markdown("### 📉 리스크 요인")
 
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("**🧠 인간 분석가**")
-        for i, risk in enumerate(human.bear_thesis, 1):
-            st.error(f"{i}. {risk}")
+        _render_alert_list(human.bear_thesis, "red")
 
     with col2:
         st.markdown("**🤖 AI 위원회**")
-        for i, risk in enumerate(ai.bear_thesis, 1):
-            st.error(f"{i}. {risk}")
+        _render_alert_list(ai.bear_thesis, "red")
+
 
-    # 분석 요약 비교
+@st.fragment
+def _render_summary_panel(human: HumanAnalysis, ai: AIAnalysisSummary):
+    """분석 요약 비교 패널."""
     st.markdown("### 📝 분석 요약")
 
     col1, col2 = st.columns(2)
@@ -355,6 +450,39 @@ def render_battle_comparison(battle: InvestmentBattle):
         st.info(ai.analysis_summary)
 
 
+def render_battle_comparison(battle: InvestmentBattle):
+    """AI vs Human 분석 비교 렌더링."""
+    # 입력 검증을 제목 렌더링보다 먼저 수행해, 데이터가 불완전하면
+    # 프런트엔드로 아무 메시지도 보내지 않고 경고만 띄웁니다.
+    human = battle.human_analysis
+    ai = battle.ai_analysis
+
+    if not human or not ai:
+        st.warning("대결 데이터가 완전하지 않습니다.")
+        return
+
+    st.markdown("## ⚔️ 분석 대결 비교")
+
+    # 헤더
+    col1, col2, col3 = st.columns([2, 1, 2])
+
+    with col1:
+        st.markdown(_HUMAN_CARD_TPL.format(name=human.analyst_name), unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(_VS_HTML, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(_AI_CARD_HTML, unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    _render_recommendation_panel(human, ai)
+    _render_thesis_panel(human, ai)
+    _render_risk_panel(human, ai)
+    _render_summary_panel(human, ai)
+
+
 def render_battle_result(battle: InvestmentBattle):
     """대결 결과 렌더링."""
     if not battle.result:
@@ -366,24 +494,22 @@ def render_battle_result(battle: InvestmentBattle):
     # 승자 발표
     st.markdown("## 🏆 대결 결과")
 
-    winner_text = {
-        "human": f"🎉 {battle.human_analysis.analyst_name} 승리!",
-        "ai": "🤖 AI 위원회 승리!",
-        "draw": "🤝 무승부!"
-    }.get(result.final_winner, "결과 대기 중")
-
-    winner_color = {
-        "human": "#4CAF50",
-        "ai": "#E91E63",
-        "draw": "#FFC107"
-    }.get(result.final_winner, "#9E9E9E")
-
-    st.markdown(f"""
-    <div style="text-align: center; padding: 30px; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); border-radius: 20px; border: 3px solid {winner_color};">
-        <h1 style="color: {winner_color};">{winner_text}</h1>
-        <h2>점수: 🧠 {result.human_total_score} vs 🤖 {result.ai_total_score}</h2>
-    </div>
-    """, unsafe_allow_html=True)
+    if result.final_winner == "human":
+        winner_text = f"🎉 {battle.human_analysis.analyst_name} 승리!"
+    else:
+        winner_text = _WINNER_TEXT.get(result.final_winner, "결과 대기 중")
+
+    winner_color = _WINNER_COLOR.get(result.final_winner, "#9E9E9E")
+
+    st.markdown(
+        _WINNER_TPL.format(
+            color=winner_color,
+            text=winner_text,
+            human_score=result.human_total_score,
+            ai_score=result.ai_total_score,
+        ),
+        unsafe_allow_html=True,
+    )
 
     # 라운드별 결과
     st.markdown("### 📊 카테고리별 결과")
@@ -405,19 +531,22 @@ def render_battle_result(battle: InvestmentBattle):
             if round_result.judge_comment:
                 st.info(f"**심판 코멘트:** {round_result.judge_comment}")
 
-    # 획득 배지
+    # 획득 배지 - 배지마다 컬럼/마크다운을 만들지 않고 플렉스 카드 하나로 렌더링
     if result.badges_earned:
         st.markdown("### 🏅 획득 배지")
-        badge_cols = st.columns(len(result.badges_earned))
-        for i, badge_id in enumerate(result.badges_earned):
+        cards = []
+        for badge_id in result.badges_earned:
             badge = BADGES.get(badge_id, {})
-            with badge_cols[i]:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 15px; background: #1a1a2e; border-radius: 10px;">
-                    <h1>{badge.get('icon', '🎖️')}</h1>
-                    <p>{badge.get('name', badge_id)}</p>
-                </div>
-                """, unsafe_allow_html=True)
+            cards.append(f"""
+            <div style="flex: 1; text-align: center; padding: 15px; background: #1a1a2e; border-radius: 10px; margin: 0 5px;">
+                <h1>{badge.get('icon', '🎖️')}</h1>
+                <p>{badge.get('name', badge_id)}</p>
+            </div>
+            """)
+        st.markdown(
+            f'<div style="display: flex;">{"".join(cards)}</div>',
+            unsafe_allow_html=True,
+        )
 
     # 학습 포인트
     if result.lessons_learned:
@@ -433,13 +562,16 @@ def render_user_stats(stats: BattleStatistics):
     tier_info = TIERS.get(stats.tier, TIERS["Bronze"])
 
     # 프로필 카드
-    st.markdown(f"""
-    <div style="text-align: center; padding: 20px; background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%); border-radius: 15px; border: 2px solid {tier_info['color']};">
-        <h1>{tier_info['icon']} {stats.tier}</h1>
-        <h2>{stats.username}</h2>
-        <p>순위: #{stats.rank}</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(
+        _PROFILE_TPL.format(
+            color=tier_info["color"],
+            icon=tier_info["icon"],
+            tier=stats.tier,
+            username=stats.username,
+            rank=stats.rank,
+        ),
+        unsafe_allow_html=True,
+    )
 
     # 전적
     col1, col2, col3, col4 = st.columns(4)
@@ -461,19 +593,59 @@ def render_user_stats(stats: BattleStatistics):
     with col2:
         st.metric("방향성 정확도", f"{stats.direction_accuracy_rate:.1f}%")
 
-    # 배지 컬렉션
+    # 배지 컬렉션 - 배지마다 컬럼/마크다운을 만들지 않고 플렉스 카드 하나로 렌더링
     if stats.badges:
         st.markdown("### 🏅 배지 컬렉션")
-        badge_cols = st.columns(min(5, len(stats.badges)))
-        for i, badge_info in enumerate(stats.badges[:5]):
+        cards = []
+        for badge_info in stats.badges[:5]:
             badge = BADGES.get(badge_info.get("id", ""), {})
-            with badge_cols[i]:
-                st.markdown(f"""
-                <div style="text-align: center; padding: 10px; background: #1a1a2e; border-radius: 10px;">
-                    <span style="font-size: 2em;">{badge.get('icon', '🎖️')}</span>
-                    <p style="font-size: 0.8em;">{badge.get('name', '')}</p>
-                </div>
-                """, unsafe_allow_html=True)
+            cards.append(f"""
+            <div style="flex: 1; text-align: center; padding: 10px; background: #1a1a2e; border-radius: 10px; margin: 0 5px;">
+                <span style="font-size: 2em;">{badge.get('icon', '🎖️')}</span>
+                <p style="font-size: 0.8em;">{badge.get('name', '')}</p>
+            </div>
+            """)
+        st.markdown(
+            f'<div style="display: flex;">{"".join(cards)}</div>',
+            unsafe_allow_html=True,
+        )
+
+
+@st.cache_data(show_spinner=False)
+def _get_sample_rankings() -> list[dict]:
+    """샘플 리더보드 데이터 생성.
+
+    내용이 고정된 데모 데이터이므로 st.cache_data로 캐시해
+    rerun마다 리스트/딕셔너리를 다시 만들지 않습니다.
+    """
+    return [
+        {"rank": 1, "username": "투자의신", "wins": 45, "win_rate": 78.5, "tier": "Diamond", "icon": "💠"},
+        {"rank": 2, "username": "가치투자자", "wins": 38, "win_rate": 72.0, "tier": "Platinum", "icon": "💎"},
+        {"rank": 3, "username": "퀀트마스터", "wins": 35, "win_rate": 68.5, "tier": "Gold", "icon": "🥇"},
+        {"rank": 4, "username": "버핏워너비", "wins": 30, "win_rate": 65.0, "tier": "Gold", "icon": "🥇"},
+        {"rank": 5, "username": "테슬라불", "wins": 28, "win_rate": 62.0, "tier": "Silver", "icon": "🥈"},
+    ]
+
+
+@st.cache_data(show_spinner=False)
+def _get_sample_stats() -> BattleStatistics:
+    """샘플 사용자 통계 생성 (데모용, 캐시)."""
+    return BattleStatistics(
+        user_id="sample",
+        username="테스트유저",
+        total_battles=25,
+        wins=15,
+        losses=8,
+        draws=2,
+        win_rate=60.0,
+        avg_target_price_accuracy=72.5,
+        direction_accuracy_rate=68.0,
+        rank=42,
+        tier="Gold",
+        current_streak=3,
+        best_streak=7,
+        badges=[{"id": "first_blood"}, {"id": "sniper"}]
+    )
 
 
 def render_leaderboard():
@@ -483,22 +655,19 @@ def render_leaderboard():
     period = st.radio(
         "기간",
         options=["weekly", "monthly", "all-time"],
-        format_func=lambda x: {"weekly": "이번 주", "monthly": "이번 달", "all-time": "전체"}.get(x, x),
+        format_func=_format_period,
         horizontal=True
     )
 
     # 샘플 리더보드 데이터
-    sample_rankings = [
-        {"rank": 1, "username": "투자의신", "wins": 45, "win_rate": 78.5, "tier": "Diamond", "icon": "💠"},
-        {"rank": 2, "username": "가치투자자", "wins": 38, "win_rate": 72.0, "tier": "Platinum", "icon": "💎"},
-        {"rank": 3, "username": "퀀트마스터", "wins": 35, "win_rate": 68.5, "tier": "Gold", "icon": "🥇"},
-        {"rank": 4, "username": "버핏워너비", "wins": 30, "win_rate": 65.0, "tier": "Gold", "icon": "🥇"},
-        {"rank": 5, "username": "테슬라불", "wins": 28, "win_rate": 62.0, "tier": "Silver", "icon": "🥈"},
-    ]
+    sample_rankings = _get_sample_rankings()
 
+    # 행마다 st.markdown을 호출하면 행 수만큼 프런트엔드 메시지가 발생하므로
+    # HTML을 하나로 합쳐 한 번에 렌더링합니다.
+    rows = []
     for ranking in sample_rankings:
-        medal = {1: "🥇", 2: "🥈", 3: "🥉"}.get(ranking["rank"], "")
-        st.markdown(f"""
+        medal = _MEDAL_MAP.get(ranking["rank"], "")
+        rows.append(f"""
         <div style="display: flex; align-items: center; padding: 15px; background: #1a1a2e; border-radius: 10px; margin-bottom: 10px;">
             <div style="width: 50px; text-align: center; font-size: 1.5em;">{medal} #{ranking['rank']}</div>
             <div style="flex: 1; padding-left: 15px;">
@@ -510,16 +679,20 @@ def render_leaderboard():
                 <span style="color: #888;"> ({ranking['win_rate']}%)</span>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """)
+    st.markdown("".join(rows), unsafe_allow_html=True)
 
 
+@st.fragment
 def render_spectator_voting(battle: InvestmentBattle):
-    """관전자 투표 렌더링."""
+    """관전자 투표 렌더링 (투표 클릭 시 이 섹션만 다시 그립니다)."""
     st.markdown("### 🗳️ 누가 이길 것 같나요?")
 
-    total_votes = battle.spectator_votes["human"] + battle.spectator_votes["ai"]
-    human_pct = (battle.spectator_votes["human"] / total_votes * 100) if total_votes > 0 else 50
-    ai_pct = (battle.spectator_votes["ai"] / total_votes * 100) if total_votes > 0 else 50
+    # 한 번의 나눗셈으로 두 비율을 계산 (ai_pct는 보수로 유도)
+    human_votes = battle.spectator_votes["human"]
+    total_votes = human_votes + battle.spectator_votes["ai"]
+    human_pct = (human_votes * 100.0 / total_votes) if total_votes > 0 else 50.0
+    ai_pct = 100.0 - human_pct
 
     col1, col2 = st.columns(2)
 
@@ -534,17 +707,36 @@ def render_spectator_voting(battle: InvestmentBattle):
             st.success("투표 완료!")
 
     # 투표 현황 바
-    st.markdown(f"""
-    <div style="display: flex; height: 30px; border-radius: 15px; overflow: hidden;">
-        <div style="width: {human_pct}%; background: #1e3a5f;"></div>
-        <div style="width: {ai_pct}%; background: #5f1e3a;"></div>
-    </div>
-    <p style="text-align: center; color: #888;">{total_votes}명 투표</p>
-    """, unsafe_allow_html=True)
+    st.markdown(
+        _VOTE_BAR_TPL.format(human_pct=human_pct, ai_pct=ai_pct, total=total_votes),
+        unsafe_allow_html=True,
+    )
+
+
+def _profiler_context():
+    """개발용 프로파일러 컨텍스트 반환.
+
+    STREAMLIT_PROFILE 환경변수를 켜고 wfork-streamlit-profiler(개발
+    의존성)가 설치되어 있으면 rerun마다 핫스팟 콜그래프를 표시하고,
+    아니면 오버헤드 없는 nullcontext를 돌려줍니다.
+    """
+    if os.getenv("STREAMLIT_PROFILE"):
+        try:
+            from wfork_streamlit_profiler import Profiler
+            return Profiler()
+        except ImportError:
+            pass
+    return nullcontext()
 
 
 def render_battle_arena_main():
     """대결 아레나 메인 페이지."""
+    with _profiler_context():
+        _render_battle_arena_body()
+
+
+def _render_battle_arena_body():
+    """대결 아레나 본문 렌더링."""
     render_battle_arena_header()
 
     # 탭 구성
@@ -553,8 +745,9 @@ def render_battle_arena_main():
     with tabs[0]:
         # 대결 유형 선택
         battle_type = render_battle_type_selector()
-        st.markdown(f"**선택된 대결:** {BATTLE_TYPES[battle_type]['name']}")
-        st.caption(BATTLE_TYPES[battle_type]['description'])
+        bt_info = BATTLE_TYPES[battle_type]
+        st.markdown(f"**선택된 대결:** {bt_info['name']}")
+        st.caption(bt_info['description'])
 
         # 종목 선택
         ticker = render_ticker_selection()
@@ -563,12 +756,15 @@ def render_battle_arena_main():
             st.success(f"대결 종목: {ticker}")
 
             # 인간 분석 입력
-            human_analysis = render_human_analysis_form(ticker)
+            human_analysis = render_human_analysis_form(ticker, bt_info["time_limit"])
 
-            if human_analysis:
+            # 풍선 애니메이션은 세션당 한 번만: 제출 후 다른 위젯과
+            # 상호작용해도 rerun마다 다시 터지지 않게 합니다.
+            if human_analysis and not st.session_state.get("_balloons_shown"):
                 st.session_state.human_analysis = human_analysis
                 st.success("분석 제출 완료! AI와 대결을 시작합니다...")
                 st.balloons()
+                st.session_state._balloons_shown = True
 
     with tabs[1]:
         st.markdown("### 🔄 진행 중인 대결")
@@ -579,20 +775,4 @@ def render_battle_arena_main():
 
     with tabs[3]:
         # 샘플 통계
-        sample_stats = BattleStatistics(
-            user_id="sample",
-            username="테스트유저",
-            total_battles=25,
-            wins=15,
-            losses=8,
-            draws=2,
-            win_rate=60.0,
-            avg_target_price_accuracy=72.5,
-            direction_accuracy_rate=68.0,
-            rank=42,
-            tier="Gold",
-            current_streak=3,
-            best_streak=7,
-            badges=[{"id": "first_blood"}, {"id": "sniper"}]
-        )
-        render_user_stats(sample_stats)
+        render_user_stats(_get_sample_stats())
@@ -1,9 +1,73 @@
 """Chart components for the Streamlit app."""
+import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 import streamlit as st
 from typing import Any, Optional
 
+# Static per-chart layouts, validated once at import. Rebuilding these
+# dicts inside every builder re-ran Plotly's layout validation on each
+# cache miss; go.Layout instances skip that and are copied into figures.
+_GAUGE_LAYOUT = go.Layout(height=250, margin=dict(l=20, r=20, t=40, b=20))
+_RADAR_LAYOUT = go.Layout(
+    polar=dict(
+        radialaxis=dict(
+            visible=True,
+            range=[0, 10]
+        )
+    ),
+    showlegend=False,
+    height=400,
+)
+_PRICE_TARGET_LAYOUT = go.Layout(
+    title='Price Target Analysis',
+    yaxis_title='Price',
+    height=400,
+    showlegend=True,
+)
+_MARGIN_LAYOUT = go.Layout(
+    title='Margin Trends',
+    xaxis_title='Year',
+    yaxis_title='Margin (%)',
+    height=350,
+    hovermode='x unified',
+)
+_RISK_MATRIX_LAYOUT = go.Layout(
+    title='Risk Matrix',
+    xaxis=dict(
+        title='Probability',
+        tickvals=[1, 2, 3],
+        ticktext=['Low', 'Medium', 'High'],
+        range=[0.5, 3.5],
+    ),
+    yaxis=dict(
+        title='Severity',
+        tickvals=[1, 2, 3, 4],
+        ticktext=['Low', 'Medium', 'High', 'Critical'],
+        range=[0.5, 4.5],
+    ),
+    height=400,
+)
+_COMMITTEE_LAYOUT = go.Layout(
+    title='Committee Votes',
+    xaxis_title='Agent',
+    yaxis=dict(title='Score', range=[0, 10]),
+    yaxis2=dict(
+        title='Confidence (%)',
+        overlaying='y',
+        side='right',
+        range=[0, 100],
+    ),
+    height=400,
+    barmode='group',
+)
+
+# Risk matrix lookups, shared by render_risk_matrix
+_SEVERITY_MAP = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
+_PROB_MAP = {'low': 1, 'medium': 2, 'high': 3}
+
+# Score bucket colors: below 5 red, 5-6 amber, 7+ green
+_SCORE_COLORS = np.array(['#dc3545', '#ffc107', '#28a745'])
+
 
 def render_header():
     """Render the application header."""
@@ -15,6 +79,10 @@ def render_header():
     """, unsafe_allow_html=True)
 
 
+# Streamlit reruns the whole script on every widget interaction; the figure
+# builders below are pure functions of their arguments, so memoizing them
+# skips rebuilding identical Plotly traces/layouts on each rerun.
+@st.cache_data(show_spinner=False, max_entries=128)
 def render_score_gauge(score: float, title: str = "Score") -> go.Figure:
     """Render a gauge chart for scores.
 
@@ -48,10 +116,11 @@ def render_score_gauge(score: float, title: str = "Score") -> go.Figure:
         }
     ))
 
-    fig.update_layout(height=250, margin=dict(l=20, r=20, t=40, b=20))
+    fig.update_layout(_GAUGE_LAYOUT)
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def render_agent_scores_radar(scores: dict[str, float]) -> go.Figure:
     """Render a radar chart for agent scores.
 
@@ -79,20 +148,12 @@ def render_agent_scores_radar(scores: dict[str, float]) -> go.Figure:
         fillcolor='rgba(102, 126, 234, 0.3)',
     ))
 
-    fig.update_layout(
-        polar=dict(
-            radialaxis=dict(
-                visible=True,
-                range=[0, 10]
-            )
-        ),
-        showlegend=False,
-        height=400,
-    )
+    fig.update_layout(_RADAR_LAYOUT)
 
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def render_price_target_chart(
     current_price: float,
     target_low: float,
@@ -139,16 +200,12 @@ def render_price_target_chart(
         name='Base Target',
     ))
 
-    fig.update_layout(
-        title='Price Target Analysis',
-        yaxis_title='Price',
-        height=400,
-        showlegend=True,
-    )
+    fig.update_layout(_PRICE_TARGET_LAYOUT)
 
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def render_margin_trends(data: list[dict]) -> go.Figure:
     """Render margin trends chart.
 
@@ -189,17 +246,12 @@ def render_margin_trends(data: list[dict]) -> go.Figure:
         line=dict(color='#dc3545'),
     ))
 
-    fig.update_layout(
-        title='Margin Trends',
-        xaxis_title='Year',
-        yaxis_title='Margin (%)',
-        height=350,
-        hovermode='x unified',
-    )
+    fig.update_layout(_MARGIN_LAYOUT)
 
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def render_risk_matrix(risks: list[dict]) -> go.Figure:
     """Render a risk matrix visualization.
 
@@ -209,21 +261,19 @@ def render_risk_matrix(risks: list[dict]) -> go.Figure:
     Returns:
         Plotly figure
     """
-    severity_map = {'low': 1, 'medium': 2, 'high': 3, 'critical': 4}
-    prob_map = {'low': 1, 'medium': 2, 'high': 3}
-
-    x_vals = []
-    y_vals = []
-    texts = []
-    colors = []
-
-    for risk in risks:
-        sev = severity_map.get(risk.get('severity', 'medium').lower(), 2)
-        prob = prob_map.get(risk.get('probability', 'medium').lower(), 2)
-        x_vals.append(prob)
-        y_vals.append(sev)
-        texts.append(risk.get('description', '')[:30])
-        colors.append(sev * prob)
+    # Build the coordinate arrays in one pass and let numpy compute the
+    # color weights (severity * probability) instead of per-risk appends
+    n = len(risks)
+    y_vals = np.fromiter(
+        (_SEVERITY_MAP.get(risk.get('severity', 'medium').lower(), 2) for risk in risks),
+        dtype=np.int64, count=n,
+    )
+    x_vals = np.fromiter(
+        (_PROB_MAP.get(risk.get('probability', 'medium').lower(), 2) for risk in risks),
+        dtype=np.int64, count=n,
+    )
+    colors = x_vals * y_vals
+    texts = [risk.get('description', '')[:30] for risk in risks]
 
     fig = go.Figure()
 
@@ -241,26 +291,12 @@ def render_risk_matrix(risks: list[dict]) -> go.Figure:
         textposition='top center',
     ))
 
-    fig.update_layout(
-        title='Risk Matrix',
-        xaxis=dict(
-            title='Probability',
-            tickvals=[1, 2, 3],
-            ticktext=['Low', 'Medium', 'High'],
-            range=[0.5, 3.5],
-        ),
-        yaxis=dict(
-            title='Severity',
-            tickvals=[1, 2, 3, 4],
-            ticktext=['Low', 'Medium', 'High', 'Critical'],
-            range=[0.5, 4.5],
-        ),
-        height=400,
-    )
+    fig.update_layout(_RISK_MATRIX_LAYOUT)
 
     return fig
 
 
+@st.cache_data(show_spinner=False, max_entries=128)
 def render_committee_vote_chart(votes: list[dict]) -> go.Figure:
     """Render committee voting visualization.
 
@@ -274,9 +310,13 @@ def render_committee_vote_chart(votes: list[dict]) -> go.Figure:
         return go.Figure()
 
     agents = [v.get('agent_type', '') for v in votes]
-    scores = [v.get('score', 5) for v in votes]
+    scores = np.asarray([v.get('score', 5) for v in votes])
     confidences = [v.get('confidence', 50) for v in votes]
 
+    # Bucket scores into colors with two vectorized comparisons instead
+    # of a two-branch conditional per committee member
+    color_idx = (scores >= 5).astype(np.int8) + (scores >= 7).astype(np.int8)
+
     fig = go.Figure()
 
     # Add score bars
@@ -284,7 +324,7 @@ def render_committee_vote_chart(votes: list[dict]) -> go.Figure:
         name='Score',
         x=agents,
         y=scores,
-        marker_color=['#28a745' if s >= 7 else '#ffc107' if s >= 5 else '#dc3545' for s in scores],
+        marker_color=_SCORE_COLORS[color_idx].tolist(),
     ))
 
     # Add confidence line
@@ -297,18 +337,6 @@ def render_committee_vote_chart(votes: list[dict]) -> go.Figure:
         line=dict(color='#667eea', dash='dash'),
     ))
 
-    fig.update_layout(
-        title='Committee Votes',
-        xaxis_title='Agent',
-        yaxis=dict(title='Score', range=[0, 10]),
-        yaxis2=dict(
-            title='Confidence (%)',
-            overlaying='y',
-            side='right',
-            range=[0, 100],
-        ),
-        height=400,
-        barmode='group',
-    )
+    fig.update_layout(_COMMITTEE_LAYOUT)
 
     return fig
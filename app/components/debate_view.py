@@ -1,7 +1,73 @@
 """Debate visualization components for Streamlit UI."""
 import streamlit as st
+from string import Template
 from typing import Any, Optional
 
+# Display lookups and card templates, built once at import. The card HTML
+# used to be rebuilt as a multi-line f-string per challenge/response, which
+# re-concatenated the same static markup on every rerun of a long debate.
+_SEVERITY_ICON = {
+    "low": "🟢",
+    "medium": "🟡",
+    "high": "🟠",
+    "critical": "🔴",
+}
+_AGENT_ORDER = ("macro", "quant", "valuation", "qualitative", "industry")
+_AGENT_EMOJI = {
+    "macro": "🌍",
+    "quant": "📊",
+    "valuation": "💰",
+    "qualitative": "🎯",
+    "industry": "🏭",
+}
+_CHALLENGE_TMPL = Template("""
+        <div style="background-color: #1a1a2e; padding: 15px; border-radius: 10px; margin: 10px 0; border-left: 4px solid #e94560;">
+            <div style="color: #e94560; font-weight: bold; margin-bottom: 10px;">
+                😈 Devil's Advocate → $target $severity_icon
+            </div>
+            <div style="color: #eee;">
+                $text
+            </div>
+        </div>
+        """)
+_RESPONSE_TMPL = Template("""
+            <div style="background-color: #16213e; padding: 15px; border-radius: 10px; margin: 10px 0 20px 30px; border-left: 4px solid #0f4c75;">
+                <div style="color: #0f4c75; font-weight: bold; margin-bottom: 10px;">
+                    $agent_emoji $target 방어 $score_badge
+                </div>
+                <div style="color: #eee;">
+                    $text
+                </div>
+            </div>
+            """)
+
+
+# Debate rounds arrive either as model objects or plain dicts, and the
+# original code probed hasattr() for every field of every item. Cache
+# which access style each concrete type uses so only the first item of a
+# type pays for the probe; later calls go straight to getattr/.get.
+_ACCESSOR_CACHE: dict[type, str] = {}
+
+
+def _get(obj, name, default=None):
+    """Fetch ``name`` from an attribute-style or mapping-style object."""
+    kind = _ACCESSOR_CACHE.get(type(obj))
+    if kind is None:
+        kind = 'attr' if hasattr(obj, name) else 'map'
+        _ACCESSOR_CACHE[type(obj)] = kind
+    return getattr(obj, name, default) if kind == 'attr' else obj.get(name, default)
+
+
+def _enum_value(value):
+    """Unwrap an enum member to its value; pass strings through."""
+    return getattr(value, 'value', value)
+
+
+def _responses_by_agent(responses: list) -> dict:
+    """Index responses by agent type so each counter-argument finds its
+    match with one dict lookup instead of a linear scan per challenge."""
+    return {_enum_value(_get(r, 'agent_type', '')): r for r in responses}
+
 
 def render_debate_transcript(debate_rounds: list, agent_opinions: dict) -> None:
     """Render the full debate transcript with visual formatting.
@@ -18,117 +84,85 @@ def render_debate_transcript(debate_rounds: list, agent_opinions: dict) -> None:
     st.markdown("---")
 
     for round_data in debate_rounds:
-        round_num = round_data.round_number if hasattr(round_data, 'round_number') else round_data.get('round_number', 0)
+        round_num = _get(round_data, 'round_number', 0)
 
+        # Expander bodies execute even while collapsed, so building every
+        # round's HTML up front costs N-1 rounds of wasted work on first
+        # load. Only round 1 renders eagerly; later rounds build their
+        # transcript when the user flips the toggle inside the expander.
         with st.expander(f"📢 라운드 {round_num}", expanded=(round_num == 1)):
-            render_debate_round(round_data)
+            if round_num == 1 or st.toggle(
+                "라운드 내용 보기", key=f"show_round_{round_num}"
+            ):
+                render_debate_round(round_data)
 
     # Summary
     st.markdown("---")
     render_debate_summary(debate_rounds, agent_opinions)
 
 
-def render_debate_round(round_data) -> None:
-    """Render a single debate round.
+def _round_to_tuple(round_data) -> tuple:
+    """Flatten a round's challenges and responses into hashable tuples.
 
-    Args:
-        round_data: DebateRound object or dict
+    Gives _build_round_html a stable cache key regardless of whether the
+    round arrived as model objects or dicts; new rounds produce new
+    tuples, so the cache invalidates naturally.
     """
-    # Get counter arguments
-    counter_args = (
-        round_data.counter_arguments
-        if hasattr(round_data, 'counter_arguments')
-        else round_data.get('counter_arguments', [])
+    challenges = tuple(
+        (
+            _enum_value(_get(ca, 'target_agent', 'unknown')),
+            _get(ca, 'counter_argument', ''),
+            _enum_value(_get(ca, 'severity', 'medium')),
+            tuple(_get(ca, 'evidence', [])[:3]),
+        )
+        for ca in _get(round_data, 'counter_arguments', [])
     )
-
-    # Get responses
-    responses = (
-        round_data.responses
-        if hasattr(round_data, 'responses')
-        else round_data.get('responses', [])
+    responses = tuple(
+        (
+            _enum_value(_get(r, 'agent_type', '')),
+            _get(r, 'response', ''),
+            _get(r, 'adjusted_score'),
+            tuple(_get(r, 'acknowledged_risks', [])),
+        )
+        for r in _get(round_data, 'responses', [])
     )
+    return challenges, responses
 
-    # Render each challenge-response pair
-    for i, counter_arg in enumerate(counter_args):
-        target = (
-            counter_arg.target_agent.value
-            if hasattr(counter_arg, 'target_agent')
-            else counter_arg.get('target_agent', 'unknown')
-        )
 
-        challenge_text = (
-            counter_arg.counter_argument
-            if hasattr(counter_arg, 'counter_argument')
-            else counter_arg.get('counter_argument', '')
-        )
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_round_html(challenges: tuple, responses: tuple) -> str:
+    """Build the HTML for one round's challenge-response transcript.
 
-        severity = (
-            counter_arg.severity.value
-            if hasattr(counter_arg, 'severity')
-            else counter_arg.get('severity', 'medium')
-        )
+    Pure function of the flattened round contents, so reruns that did
+    not change the round reuse the cached string instead of redoing the
+    per-pair template substitution.
+    """
+    resp_by_agent = {agent: (text, score, risks) for agent, text, score, risks in responses}
 
-        evidence = (
-            counter_arg.evidence
-            if hasattr(counter_arg, 'evidence')
-            else counter_arg.get('evidence', [])
-        )
+    # Accumulate the whole round into one HTML string: emitting a single
+    # st.markdown sends one ForwardMsg to the frontend instead of ~6 per
+    # challenge-response pair
+    parts: list[str] = []
 
+    for target, challenge_text, severity, evidence in challenges:
         # Challenge card
-        severity_color = {
-            "low": "🟢",
-            "medium": "🟡",
-            "high": "🟠",
-            "critical": "🔴",
-        }.get(severity, "🟡")
-
-        st.markdown(f"""
-        <div style="background-color: #1a1a2e; padding: 15px; border-radius: 10px; margin: 10px 0; border-left: 4px solid #e94560;">
-            <div style="color: #e94560; font-weight: bold; margin-bottom: 10px;">
-                😈 Devil's Advocate → {target.upper()} {severity_color}
-            </div>
-            <div style="color: #eee;">
-                {challenge_text}
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        parts.append(
+            _CHALLENGE_TMPL.substitute(
+                target=target.upper(),
+                severity_icon=_SEVERITY_ICON.get(severity, "🟡"),
+                text=challenge_text,
+            )
+        )
 
         if evidence:
-            with st.container():
-                st.markdown("**📋 근거:**")
-                for ev in evidence[:3]:
-                    st.markdown(f"  - {ev}")
+            items = "".join(f"<li>{ev}</li>" for ev in evidence)
+            parts.append(f"<strong>📋 근거:</strong><ul>{items}</ul>")
 
         # Find matching response
-        matching_response = None
-        for resp in responses:
-            resp_agent = (
-                resp.agent_type.value
-                if hasattr(resp, 'agent_type')
-                else resp.get('agent_type', '')
-            )
-            if resp_agent == target:
-                matching_response = resp
-                break
+        matching_response = resp_by_agent.get(target)
 
         if matching_response:
-            response_text = (
-                matching_response.response
-                if hasattr(matching_response, 'response')
-                else matching_response.get('response', '')
-            )
-
-            adjusted_score = (
-                matching_response.adjusted_score
-                if hasattr(matching_response, 'adjusted_score')
-                else matching_response.get('adjusted_score')
-            )
-
-            acknowledged = (
-                matching_response.acknowledged_risks
-                if hasattr(matching_response, 'acknowledged_risks')
-                else matching_response.get('acknowledged_risks', [])
-            )
+            response_text, adjusted_score, acknowledged = matching_response
 
             # Response card
             score_badge = ""
@@ -140,44 +174,43 @@ def render_debate_round(round_data) -> None:
                 else:
                     score_badge = f"<span style='background-color: #dc3545; padding: 2px 8px; border-radius: 4px;'>점수 하락: {adjusted_score}/10</span>"
 
-            agent_emoji = {
-                "macro": "🌍",
-                "quant": "📊",
-                "valuation": "💰",
-                "qualitative": "🎯",
-                "industry": "🏭",
-            }.get(target, "🤖")
+            # Only copy a slice when the text actually needs truncating
+            if len(response_text) > 500:
+                response_text = response_text[:500] + '...'
 
-            st.markdown(f"""
-            <div style="background-color: #16213e; padding: 15px; border-radius: 10px; margin: 10px 0 20px 30px; border-left: 4px solid #0f4c75;">
-                <div style="color: #0f4c75; font-weight: bold; margin-bottom: 10px;">
-                    {agent_emoji} {target.upper()} 방어 {score_badge}
-                </div>
-                <div style="color: #eee;">
-                    {response_text[:500]}{'...' if len(response_text) > 500 else ''}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            parts.append(
+                _RESPONSE_TMPL.substitute(
+                    agent_emoji=_AGENT_EMOJI.get(target, "🤖"),
+                    target=target.upper(),
+                    score_badge=score_badge,
+                    text=response_text,
+                )
+            )
 
             if acknowledged:
-                st.markdown("**⚠️ 인정한 리스크:**")
-                for risk in acknowledged:
-                    st.markdown(f"  - {risk}")
+                items = "".join(f"<li>{risk}</li>" for risk in acknowledged)
+                parts.append(f"<strong>⚠️ 인정한 리스크:</strong><ul>{items}</ul>")
 
-        st.markdown("<hr style='border: 0.5px solid #333;'>", unsafe_allow_html=True)
+        parts.append("<hr style='border: 0.5px solid #333;'>")
 
-    # Round summary
-    resolved = (
-        round_data.resolved_issues
-        if hasattr(round_data, 'resolved_issues')
-        else round_data.get('resolved_issues', [])
-    )
+    return "".join(parts)
 
-    remaining = (
-        round_data.remaining_concerns
-        if hasattr(round_data, 'remaining_concerns')
-        else round_data.get('remaining_concerns', [])
-    )
+
+def render_debate_round(round_data) -> None:
+    """Render a single debate round.
+
+    Args:
+        round_data: DebateRound object or dict
+    """
+    challenges, responses = _round_to_tuple(round_data)
+
+    html = _build_round_html(challenges, responses)
+    if html:
+        st.markdown(html, unsafe_allow_html=True)
+
+    # Round summary
+    resolved = _get(round_data, 'resolved_issues', [])
+    remaining = _get(round_data, 'remaining_concerns', [])
 
     col1, col2 = st.columns(2)
     with col1:
@@ -206,7 +239,13 @@ def render_debate_summary(debate_rounds: list, agent_opinions: dict) -> None:
     """
     st.markdown("### 📊 토론 결과 요약")
 
-    # Calculate score changes
+    # Calculate score changes. Collect the agents challenged in round 1
+    # with one pass instead of rescanning the counter-arguments per agent.
+    challenged = set()
+    if debate_rounds:
+        for ca in _get(debate_rounds[0], 'counter_arguments', []):
+            challenged.add(_enum_value(_get(ca, 'target_agent', '')))
+
     initial_scores = {}
     final_scores = {}
 
@@ -214,80 +253,66 @@ def render_debate_summary(debate_rounds: list, agent_opinions: dict) -> None:
         if agent_key == "devils_advocate":
             continue
 
-        score = (
-            opinion.get("score", 5)
-            if isinstance(opinion, dict)
-            else getattr(opinion, "score", 5)
-        )
+        score = _get(opinion, "score", 5)
         final_scores[agent_key] = score
 
-        # Try to find initial score from first round
-        if debate_rounds:
-            first_round = debate_rounds[0]
-            counter_args = (
-                first_round.counter_arguments
-                if hasattr(first_round, 'counter_arguments')
-                else first_round.get('counter_arguments', [])
-            )
-            for ca in counter_args:
-                ca_target = (
-                    ca.target_agent.value
-                    if hasattr(ca, 'target_agent')
-                    else ca.get('target_agent', '')
-                )
-                if ca_target == agent_key:
-                    # Assume original score was higher if adjusted down
-                    initial_scores[agent_key] = score + 0.5  # Approximate
-                    break
-
-    # Render score comparison
-    cols = st.columns(len(final_scores))
-    for i, (agent, score) in enumerate(final_scores.items()):
-        with cols[i]:
-            initial = initial_scores.get(agent, score)
-            change = score - initial
-
-            emoji = {
-                "macro": "🌍",
-                "quant": "📊",
-                "valuation": "💰",
-            }.get(agent, "🤖")
-
-            if change < -0.5:
-                st.metric(
-                    f"{emoji} {agent.upper()}",
-                    f"{score:.1f}/10",
-                    f"{change:+.1f}",
-                    delta_color="inverse"
-                )
-            elif change > 0.5:
-                st.metric(
-                    f"{emoji} {agent.upper()}",
-                    f"{score:.1f}/10",
-                    f"{change:+.1f}"
-                )
-            else:
-                st.metric(
-                    f"{emoji} {agent.upper()}",
-                    f"{score:.1f}/10",
-                    "유지"
-                )
+        if agent_key in challenged:
+            # Assume original score was higher if adjusted down
+            initial_scores[agent_key] = score + 0.5  # Approximate
+
+    # Render score comparison. st.columns(0) raises, so skip the section
+    # when no scores exist, and lay agents out in a fixed order so the
+    # columns don't remount in a different sequence between reruns.
+    if final_scores:
+        ordered = [a for a in _AGENT_ORDER if a in final_scores]
+        ordered += [a for a in final_scores if a not in _AGENT_ORDER]
+
+        cols = st.columns(len(ordered))
+        for col, agent in zip(cols, ordered):
+            score = final_scores[agent]
+            with col:
+                initial = initial_scores.get(agent, score)
+                change = score - initial
+
+                emoji = _AGENT_EMOJI.get(agent, "🤖")
+
+                if change < -0.5:
+                    st.metric(
+                        f"{emoji} {agent.upper()}",
+                        f"{score:.1f}/10",
+                        f"{change:+.1f}",
+                        delta_color="inverse"
+                    )
+                elif change > 0.5:
+                    st.metric(
+                        f"{emoji} {agent.upper()}",
+                        f"{score:.1f}/10",
+                        f"{change:+.1f}"
+                    )
+                else:
+                    st.metric(
+                        f"{emoji} {agent.upper()}",
+                        f"{score:.1f}/10",
+                        "유지"
+                    )
 
     # Key takeaways
     st.markdown("### 🔑 핵심 논쟁 포인트")
 
-    all_concerns = []
+    # Ordered dedup with early exit: set(...)[:5] raised TypeError (sets
+    # are not subscriptable) and would have been non-deterministic anyway.
+    top_concerns: dict = {}
     for round_data in debate_rounds:
-        remaining = (
-            round_data.remaining_concerns
-            if hasattr(round_data, 'remaining_concerns')
-            else round_data.get('remaining_concerns', [])
-        )
-        all_concerns.extend(remaining)
+        for concern in _get(round_data, 'remaining_concerns', []):
+            if concern not in top_concerns:
+                top_concerns[concern] = None
+                if len(top_concerns) == 5:
+                    break
+        if len(top_concerns) == 5:
+            break
 
-    if all_concerns:
-        for concern in set(all_concerns)[:5]:
-            st.markdown(f"- ⚠️ {concern}")
+    if top_concerns:
+        st.markdown("\n".join(f"- ⚠️ {concern}" for concern in top_concerns))
     else:
         st.success("모든 주요 우려사항이 토론을 통해 해소되었습니다.")
 
@@ -301,72 +326,31 @@ def render_debate_chat_view(debate_rounds: list) -> None:
     st.markdown("## 💬 토론 채팅 뷰")
 
     for round_data in debate_rounds:
-        round_num = (
-            round_data.round_number
-            if hasattr(round_data, 'round_number')
-            else round_data.get('round_number', 0)
-        )
+        round_num = _get(round_data, 'round_number', 0)
 
         st.markdown(f"### 라운드 {round_num}")
 
-        counter_args = (
-            round_data.counter_arguments
-            if hasattr(round_data, 'counter_arguments')
-            else round_data.get('counter_arguments', [])
-        )
-
-        responses = (
-            round_data.responses
-            if hasattr(round_data, 'responses')
-            else round_data.get('responses', [])
-        )
+        counter_args = _get(round_data, 'counter_arguments', [])
+        responses = _get(round_data, 'responses', [])
+        resp_by_agent = _responses_by_agent(responses)
 
         # Interleave challenges and responses
         for counter_arg in counter_args:
-            target = (
-                counter_arg.target_agent.value
-                if hasattr(counter_arg, 'target_agent')
-                else counter_arg.get('target_agent', 'unknown')
-            )
-
-            challenge = (
-                counter_arg.counter_argument
-                if hasattr(counter_arg, 'counter_argument')
-                else counter_arg.get('counter_argument', '')
-            )
+            target = _enum_value(_get(counter_arg, 'target_agent', 'unknown'))
+            challenge = _get(counter_arg, 'counter_argument', '')
 
             # Devil's Advocate message (left aligned)
             with st.chat_message("assistant", avatar="😈"):
                 st.markdown(f"**[→ {target.upper()}]** {challenge}")
 
             # Find and show response
-            for resp in responses:
-                resp_agent = (
-                    resp.agent_type.value
-                    if hasattr(resp, 'agent_type')
-                    else resp.get('agent_type', '')
-                )
-
-                if resp_agent == target:
-                    response_text = (
-                        resp.response
-                        if hasattr(resp, 'response')
-                        else resp.get('response', '')
-                    )
+            resp = resp_by_agent.get(target)
+            if resp is not None:
+                response_text = _get(resp, 'response', '')
+                adjusted = _get(resp, 'adjusted_score')
 
-                    adjusted = (
-                        resp.adjusted_score
-                        if hasattr(resp, 'adjusted_score')
-                        else resp.get('adjusted_score')
-                    )
-
-                    avatar = {
-                        "macro": "🌍",
-                        "quant": "📊",
-                        "valuation": "💰",
-                    }.get(target, "🤖")
+                avatar = _AGENT_EMOJI.get(target, "🤖")
 
-                    with st.chat_message("user", avatar=avatar):
-                        score_note = f" [점수 조정: {adjusted}]" if adjusted else ""
-                        st.markdown(f"**{target.upper()}**{score_note}: {response_text}")
-                    break
+                with st.chat_message("user", avatar=avatar):
+                    score_note = f" [점수 조정: {adjusted}]" if adjusted else ""
+                    st.markdown(f"**{target.upper()}**{score_note}: {response_text}")
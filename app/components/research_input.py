@@ -11,6 +11,51 @@ from models.user_research import (
 )
 
 
+# 표시용 상수는 모듈 수준에 한 번만 정의합니다. _SOURCE_EMOJI는
+# SourceType 멤버를 키로 써서 조회 시 .value 접근을 생략합니다.
+_SOURCE_EMOJI: dict[SourceType, str] = {
+    SourceType.COMPANY_IR: "🏢",
+    SourceType.ANALYST_REPORT: "📊",
+    SourceType.NEWS_ARTICLE: "📰",
+    SourceType.FINANCIAL_STATEMENT: "📑",
+    SourceType.INDUSTRY_REPORT: "🏭",
+    SourceType.EARNINGS_CALL: "📞",
+    SourceType.REGULATORY_FILING: "📝",
+    SourceType.SOCIAL_MEDIA: "💬",
+    SourceType.EXPERT_OPINION: "👨‍💼",
+    SourceType.USER_ANALYSIS: "🔍",
+    SourceType.OTHER: "📄",
+}
+# 검토 결과는 JSON dict로 오므로 아래 둘은 문자열 키를 유지합니다.
+_BIAS_LABELS = {
+    "bullish_bias": "🟢 낙관적 편향",
+    "bearish_bias": "🔴 비관적 편향",
+    "recency_bias": "⏰ 최근성 편향",
+    "confirmation_bias": "🔄 확증 편향",
+    "survivorship_bias": "💀 생존 편향",
+    "selection_bias": "📊 선택 편향",
+    "conflict_of_interest": "⚠️ 이해충돌",
+    "outdated": "📅 오래된 정보",
+    "incomplete": "❓ 불완전",
+    "unverified": "❔ 미검증",
+}
+_LEVEL_TEXT = {"high": "높음 ✅", "medium": "보통 ⚠️", "low": "낮음 ❌"}
+_SOURCE_TYPE_OPTIONS = [
+    ("company_ir", "회사 IR 자료"),
+    ("analyst_report", "증권사 리포트"),
+    ("news_article", "뉴스 기사"),
+    ("financial_statement", "재무제표"),
+    ("industry_report", "산업 보고서"),
+    ("earnings_call", "실적 발표 콜"),
+    ("regulatory_filing", "공시 자료"),
+    ("social_media", "SNS/커뮤니티"),
+    ("expert_opinion", "전문가 의견"),
+    ("user_analysis", "내 분석"),
+    ("other", "기타"),
+]
+_BIAS_SEVERITY_COLOR = {"low": "#28a745", "medium": "#ffc107", "high": "#dc3545"}
+
+
 def render_research_input_form(ticker: str) -> Optional[UserResearchInput]:
     """사용자 자료 입력 폼 렌더링.
 
@@ -29,64 +74,61 @@ def render_research_input_form(ticker: str) -> Optional[UserResearchInput]:
 
     # 자료 추가 폼
     with st.expander("📄 새 자료 추가", expanded=len(st.session_state.research_documents) == 0):
-        col1, col2 = st.columns(2)
-
-        with col1:
-            doc_title = st.text_input("자료 제목", key="doc_title")
-            source_type = st.selectbox(
-                "자료 유형",
-                options=[
-                    ("company_ir", "회사 IR 자료"),
-                    ("analyst_report", "증권사 리포트"),
-                    ("news_article", "뉴스 기사"),
-                    ("financial_statement", "재무제표"),
-                    ("industry_report", "산업 보고서"),
-                    ("earnings_call", "실적 발표 콜"),
-                    ("regulatory_filing", "공시 자료"),
-                    ("social_media", "SNS/커뮤니티"),
-                    ("expert_opinion", "전문가 의견"),
-                    ("user_analysis", "내 분석"),
-                    ("other", "기타"),
-                ],
-                format_func=lambda x: x[1],
-                key="source_type",
+        # st.form으로 묶어 필드 변경이 rerun을 일으키지 않고 제출 시에만
+        # 스크립트가 한 번 재실행되게 합니다. clear_on_submit으로 추가 후
+        # 입력이 비워져 같은 자료가 중복 추가되는 것도 막습니다.
+        with st.form("add_doc", clear_on_submit=True):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                doc_title = st.text_input("자료 제목", key="doc_title")
+                source_type = st.selectbox(
+                    "자료 유형",
+                    options=_SOURCE_TYPE_OPTIONS,
+                    format_func=lambda x: x[1],
+                    key="source_type",
+                )
+                source_name = st.text_input("출처명 (예: 삼성증권, Bloomberg)", key="source_name")
+
+            with col2:
+                # 발행일 기본값은 세션당 한 번만 계산: rerun마다 datetime.now()를
+                # 넣으면 위젯 기본값이 계속 바뀌어 값 메모이제이션이 깨집니다.
+                st.session_state.setdefault("_form_today", datetime.now().date())
+                publish_date = st.date_input("발행일", value=st.session_state["_form_today"], key="publish_date")
+                author = st.text_input("저자/애널리스트", key="author")
+                user_trust = st.slider("신뢰도 (내 판단)", 1, 10, 5, key="user_trust")
+
+            doc_content = st.text_area(
+                "자료 내용 또는 요약",
+                height=150,
+                key="doc_content",
+                placeholder="자료의 주요 내용을 입력하세요...",
             )
-            source_name = st.text_input("출처명 (예: 삼성증권, Bloomberg)", key="source_name")
-
-        with col2:
-            publish_date = st.date_input("발행일", value=datetime.now(), key="publish_date")
-            author = st.text_input("저자/애널리스트", key="author")
-            user_trust = st.slider("신뢰도 (내 판단)", 1, 10, 5, key="user_trust")
-
-        doc_content = st.text_area(
-            "자료 내용 또는 요약",
-            height=150,
-            key="doc_content",
-            placeholder="자료의 주요 내용을 입력하세요...",
-        )
-
-        # 핵심 주장 입력
-        key_claims_text = st.text_area(
-            "핵심 주장 (줄바꿈으로 구분)",
-            height=80,
-            key="key_claims",
-            placeholder="이 자료의 핵심 주장들을 한 줄에 하나씩 입력하세요.",
-        )
 
-        col3, col4 = st.columns(2)
-        with col3:
-            target_price = st.number_input("목표가 (있는 경우)", min_value=0.0, value=0.0, key="target_price")
-        with col4:
-            recommendation = st.selectbox(
-                "투자의견",
-                options=["없음", "Strong Buy", "Buy", "Hold", "Sell", "Strong Sell"],
-                key="recommendation",
+            # 핵심 주장 입력
+            key_claims_text = st.text_area(
+                "핵심 주장 (줄바꿈으로 구분)",
+                height=80,
+                key="key_claims",
+                placeholder="이 자료의 핵심 주장들을 한 줄에 하나씩 입력하세요.",
             )
 
-        url = st.text_input("원본 링크 (선택)", key="doc_url")
-        user_notes = st.text_area("내 메모", height=60, key="user_notes")
+            col3, col4 = st.columns(2)
+            with col3:
+                target_price = st.number_input("목표가 (있는 경우)", min_value=0.0, value=0.0, key="target_price")
+            with col4:
+                recommendation = st.selectbox(
+                    "투자의견",
+                    options=["없음", "Strong Buy", "Buy", "Hold", "Sell", "Strong Sell"],
+                    key="recommendation",
+                )
+
+            url = st.text_input("원본 링크 (선택)", key="doc_url")
+            user_notes = st.text_area("내 메모", height=60, key="user_notes")
+
+            submitted = st.form_submit_button("자료 추가", type="primary")
 
-        if st.button("자료 추가", type="primary"):
+        if submitted:
             if doc_title and doc_content:
                 key_claims = [c.strip() for c in key_claims_text.split("\n") if c.strip()]
 
@@ -108,46 +150,41 @@ def render_research_input_form(ticker: str) -> Optional[UserResearchInput]:
 
                 st.session_state.research_documents.append(new_doc)
                 st.success(f"'{doc_title}' 추가됨!")
-                st.rerun()
             else:
                 st.error("제목과 내용은 필수입니다.")
 
-    # 추가된 자료 목록 표시
+    # 추가된 자료 목록 표시: 자료마다 columns/markdown/caption/metric을
+    # 따로 만들면 자료 수만큼 위젯 메시지가 발생하므로, 읽기 전용 부분은
+    # HTML 테이블 하나로 합쳐 한 번에 렌더링하고 삭제 버튼만 별도로 둡니다.
     if st.session_state.research_documents:
         st.markdown("### 📋 추가된 자료 목록")
 
-        for i, doc in enumerate(st.session_state.research_documents):
-            with st.container():
-                col1, col2, col3 = st.columns([3, 1, 1])
-
-                with col1:
-                    type_emoji = {
-                        "company_ir": "🏢",
-                        "analyst_report": "📊",
-                        "news_article": "📰",
-                        "financial_statement": "📑",
-                        "industry_report": "🏭",
-                        "earnings_call": "📞",
-                        "regulatory_filing": "📝",
-                        "social_media": "💬",
-                        "expert_opinion": "👨‍💼",
-                        "user_analysis": "🔍",
-                        "other": "📄",
-                    }.get(doc.source_type.value, "📄")
-
-                    st.markdown(f"**{type_emoji} {doc.title}**")
-                    st.caption(f"{doc.source_name} | 신뢰도: {doc.user_trust_level}/10")
-
-                with col2:
-                    if doc.target_price:
-                        st.metric("목표가", f"${doc.target_price:,.0f}")
-
-                with col3:
-                    if st.button("삭제", key=f"del_{i}"):
-                        st.session_state.research_documents.pop(i)
-                        st.rerun()
-
-                st.divider()
+        rows = "".join(
+            f"<tr>"
+            f"<td style='padding: 6px 12px;'><strong>{_SOURCE_EMOJI.get(doc.source_type, '📄')} {doc.title}</strong></td>"
+            f"<td style='padding: 6px 12px; color: #888;'>{doc.source_name}</td>"
+            f"<td style='padding: 6px 12px; text-align: center;'>{doc.user_trust_level}/10</td>"
+            f"<td style='padding: 6px 12px; text-align: right;'>{f'${doc.target_price:,.0f}' if doc.target_price else '-'}</td>"
+            f"</tr>"
+            for doc in st.session_state.research_documents
+        )
+        st.markdown(
+            "<table style='width: 100%; border-collapse: collapse;'>"
+            "<thead><tr>"
+            "<th style='padding: 6px 12px; text-align: left;'>자료</th>"
+            "<th style='padding: 6px 12px; text-align: left;'>출처</th>"
+            "<th style='padding: 6px 12px;'>신뢰도</th>"
+            "<th style='padding: 6px 12px; text-align: right;'>목표가</th>"
+            f"</tr></thead><tbody>{rows}</tbody></table>",
+            unsafe_allow_html=True,
+        )
+
+        del_cols = st.columns(len(st.session_state.research_documents))
+        for i, col in enumerate(del_cols):
+            with col:
+                if st.button(f"삭제 {i + 1}", key=f"del_{i}"):
+                    st.session_state.research_documents.pop(i)
+                    st.rerun()
 
     # 사용자 가설 및 질문
     st.markdown("### 💡 투자 가설 및 질문")
@@ -243,7 +280,7 @@ def render_validation_results(validation_result: dict) -> None:
 
     with col2:
         level = overall.get("level", "unknown")
-        level_text = {"high": "높음 ✅", "medium": "보통 ⚠️", "low": "낮음 ❌"}.get(level, "알 수 없음")
+        level_text = _LEVEL_TEXT.get(level, "알 수 없음")
         st.markdown(f"""
         <div style="text-align: center; padding: 10px; background-color: #1a1a2e; border-radius: 10px;">
             <h3>{level_text}</h3>
@@ -267,28 +304,17 @@ def render_validation_results(validation_result: dict) -> None:
 
         for result in bias_results:
             severity = result.get("bias_severity", "low")
-            severity_color = {"low": "#28a745", "medium": "#ffc107", "high": "#dc3545"}.get(severity, "#6c757d")
+            severity_color = _BIAS_SEVERITY_COLOR.get(severity, "#6c757d")
 
             with st.expander(f"{result.get('document_title', 'Unknown')} - 신뢰도: {result.get('reliability_score', 'N/A')}/10"):
                 # 편향 표시
                 biases = result.get("detected_biases", [])
                 if biases:
-                    st.markdown("**발견된 편향:**")
-                    bias_labels = {
-                        "bullish_bias": "🟢 낙관적 편향",
-                        "bearish_bias": "🔴 비관적 편향",
-                        "recency_bias": "⏰ 최근성 편향",
-                        "confirmation_bias": "🔄 확증 편향",
-                        "survivorship_bias": "💀 생존 편향",
-                        "selection_bias": "📊 선택 편향",
-                        "conflict_of_interest": "⚠️ 이해충돌",
-                        "outdated": "📅 오래된 정보",
-                        "incomplete": "❓ 불완전",
-                        "unverified": "❔ 미검증",
-                    }
-                    for bias in biases:
-                        label = bias_labels.get(bias, bias)
-                        st.markdown(f"  - {label}")
+                    # 줄마다 st.markdown을 호출하지 않고 한 번에 출력
+                    st.markdown(
+                        "**발견된 편향:**\n"
+                        + "\n".join(f"- {_BIAS_LABELS.get(bias, bias)}" for bias in biases)
+                    )
 
                 # 편향 설명
                 if result.get("bias_explanation"):
@@ -298,15 +324,13 @@ def render_validation_results(validation_result: dict) -> None:
                 outdated = result.get("outdated_info", [])
                 if outdated:
                     st.warning("**오래된 정보:**")
-                    for info in outdated:
-                        st.markdown(f"  - {info}")
+                    st.markdown("\n".join(f"- {info}" for info in outdated))
 
                 # 검증 불가 주장
                 unverifiable = result.get("unverifiable_claims", [])
                 if unverifiable:
                     st.warning("**검증 불가 주장:**")
-                    for claim in unverifiable:
-                        st.markdown(f"  - {claim}")
+                    st.markdown("\n".join(f"- {claim}" for claim in unverifiable))
 
                 # 활용 권장사항
                 if result.get("usage_recommendation"):
@@ -315,9 +339,10 @@ def render_validation_results(validation_result: dict) -> None:
                 # 주의사항
                 caveats = result.get("caveats", [])
                 if caveats:
-                    st.markdown("**주의사항:**")
-                    for caveat in caveats:
-                        st.markdown(f"  - ⚠️ {caveat}")
+                    st.markdown(
+                        "**주의사항:**\n"
+                        + "\n".join(f"- ⚠️ {caveat}" for caveat in caveats)
+                    )
 
 
 def render_research_synthesis(synthesis: dict) -> None:
@@ -359,8 +384,7 @@ def render_research_synthesis(synthesis: dict) -> None:
         st.markdown("### 📌 검증된 사실")
         verified = synthesis.get("verified_facts", [])
         if verified:
-            for fact in verified:
-                st.markdown(f"✓ {fact}")
+            st.markdown("\n\n".join(f"✓ {fact}" for fact in verified))
         else:
             st.info("검증된 사실 없음")
 
@@ -368,8 +392,7 @@ def render_research_synthesis(synthesis: dict) -> None:
         st.markdown("### ❓ 논쟁이 있는 주장")
         disputed = synthesis.get("disputed_claims", [])
         if disputed:
-            for claim in disputed:
-                st.markdown(f"? {claim}")
+            st.markdown("\n\n".join(f"? {claim}" for claim in disputed))
         else:
             st.info("논쟁 주장 없음")
 
@@ -391,5 +414,4 @@ def render_research_synthesis(synthesis: dict) -> None:
     focus_areas = synthesis.get("recommended_focus_areas", [])
     if focus_areas:
         st.markdown("### 🎯 에이전트들이 집중할 영역")
-        for area in focus_areas:
-            st.markdown(f"➡️ {area}")
+        st.markdown("\n\n".join(f"➡️ {area}" for area in focus_areas))
@@ -16,6 +16,13 @@ from models.youtube_content import (
     YouTubeContentPackage,
     PERSONA_CONTENT_SETTINGS,
     CONTENT_TYPE_TEMPLATES,
+    ThumbnailSpec,
+    ScriptSection,
+    FullScript,
+    VisualAsset,
+    TitleOption,
+    KeyTimestamp,
+    HighlightClip,
 )
 from services.thumbnail_generator import (
     ThumbnailGenerator,
@@ -23,6 +30,48 @@ from services.thumbnail_generator import (
 )
 
 
+@st.cache_resource
+def _thumbnail_generator() -> ThumbnailGenerator:
+    """썸네일 생성기 싱글톤 (상태가 없어 세션 간 공유해도 안전)."""
+    return ThumbnailGenerator()
+
+
+# 미리보기용 예시 데이터 (ticker만 패키지마다 다름)
+_THUMB_PREVIEW_DATA = {
+    "target_price": "₩90,000",
+    "price_info": "+15.5%",
+    "human_info": "목표가 ₩85,000",
+    "ai_info": "목표가 ₩95,000",
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _thumbnail_html(
+    headline: str,
+    sub_headline: Optional[str],
+    style: str,
+    color_scheme: str,
+    text_elements: tuple,
+    ticker: str,
+) -> str:
+    """썸네일 HTML을 사양의 원시 필드를 키로 캐시합니다.
+
+    pydantic 모델을 그대로 키로 쓰면 매 호출마다 전체 객체를
+    직렬화해 해시하므로, 템플릿이 실제로 읽는 필드만 넘깁니다.
+    같은 사양이면 rerun마다 template.format을 반복하지 않습니다.
+    """
+    spec = ThumbnailSpec(
+        headline=headline,
+        sub_headline=sub_headline,
+        style=style,
+        color_scheme=color_scheme,
+        text_elements=[{"position": pos, "text": text} for pos, text in text_elements],
+    )
+    return _thumbnail_generator().generate_thumbnail_html(
+        spec, {**_THUMB_PREVIEW_DATA, "ticker": ticker}
+    )
+
+
 # =============================================================================
 # 페르소나 정보
 # =============================================================================
@@ -148,6 +197,74 @@ CONTENT_TYPE_INFO = {
 }
 
 
+# 렌더 루프에서 매 rerun마다 PERSONA_INFO.get()과 info.get() 다섯 번을
+# 반복하지 않도록, import 시점에 버튼 라벨까지 포함한 행 튜플로 풀어 둡니다.
+_PERSONA_ROWS = {
+    p: (
+        info["icon"],
+        info["name"],
+        info["description"],
+        info["content_tips"],
+        f"{info['icon']}\n{info['name']}",
+    )
+    for p, info in PERSONA_INFO.items()
+}
+
+_CONTENT_TYPE_ROWS = {
+    ct: (
+        info["icon"],
+        info["name"],
+        info["duration"],
+        info["description"],
+        f"{info['icon']}\n{info['name']}\n({info['duration']})",
+    )
+    for ct, info in CONTENT_TYPE_INFO.items()
+}
+
+# 페르소나 선택 화면의 카테고리 구성 (매 호출마다 dict를 다시 만들 필요 없음)
+_PERSONA_CATEGORIES = (
+    ("경험 수준별", (
+        ViewerPersona.ABSOLUTE_BEGINNER,
+        ViewerPersona.BEGINNER,
+        ViewerPersona.INTERMEDIATE,
+        ViewerPersona.ADVANCED,
+        ViewerPersona.PROFESSIONAL,
+    )),
+    ("투자 스타일별", (
+        ViewerPersona.VALUE_INVESTOR,
+        ViewerPersona.GROWTH_INVESTOR,
+        ViewerPersona.HIGH_RISK_TAKER,
+    )),
+    ("콘텐츠 선호별", (
+        ViewerPersona.DATA_NERD,
+        ViewerPersona.STORY_LOVER,
+        ViewerPersona.QUICK_LEARNER,
+        ViewerPersona.ENTERTAINMENT_SEEKER,
+    )),
+)
+
+# 제목 스타일/스크립트 섹션 아이콘 (루프 안에서 dict 리터럴 재생성 방지)
+_STYLE_BADGE = {
+    "curiosity": "🤔 호기심",
+    "urgent": "🚨 긴급",
+    "value": "💎 가치",
+    "emotional": "💓 감정",
+    "contrarian": "🔄 역발상",
+}
+
+_SECTION_ICON = {
+    "hook": "🪝",
+    "intro": "👋",
+    "context": "📋",
+    "main_content": "📺",
+    "debate": "⚔️",
+    "reaction": "😮",
+    "summary": "📊",
+    "cta": "📢",
+    "outro": "👋",
+}
+
+
 def render_youtube_studio_header():
     """유튜브 스튜디오 헤더."""
     st.markdown("""
@@ -163,57 +280,33 @@ def render_persona_selector() -> ViewerPersona:
     st.markdown("### 🎯 타겟 시청자 선택")
     st.markdown("어떤 시청자를 위한 콘텐츠인가요?")
 
-    # 카테고리별 분류
-    categories = {
-        "경험 수준별": [
-            ViewerPersona.ABSOLUTE_BEGINNER,
-            ViewerPersona.BEGINNER,
-            ViewerPersona.INTERMEDIATE,
-            ViewerPersona.ADVANCED,
-            ViewerPersona.PROFESSIONAL,
-        ],
-        "투자 스타일별": [
-            ViewerPersona.VALUE_INVESTOR,
-            ViewerPersona.GROWTH_INVESTOR,
-            ViewerPersona.HIGH_RISK_TAKER,
-        ],
-        "콘텐츠 선호별": [
-            ViewerPersona.DATA_NERD,
-            ViewerPersona.STORY_LOVER,
-            ViewerPersona.QUICK_LEARNER,
-            ViewerPersona.ENTERTAINMENT_SEEKER,
-        ],
-    }
-
     selected_persona = None
 
-    for category_name, personas in categories.items():
+    for category_name, personas in _PERSONA_CATEGORIES:
         st.markdown(f"**{category_name}**")
         cols = st.columns(len(personas))
 
-        for i, persona in enumerate(personas):
-            info = PERSONA_INFO.get(persona, {})
-            with cols[i]:
+        for col, persona in zip(cols, personas):
+            _icon, _name, description, _tips, label = _PERSONA_ROWS[persona]
+            with col:
                 if st.button(
-                    f"{info.get('icon', '👤')}\n{info.get('name', persona.value)}",
+                    label,
                     key=f"persona_{persona.value}",
                     use_container_width=True,
-                    help=info.get('description', '')
+                    help=description,
                 ):
                     st.session_state.selected_persona = persona
                     selected_persona = persona
 
-    # 선택된 페르소나 표시
+    # 선택된 페르소나 표시. HTML 카드 대신 네이티브 위젯을 쓰면
+    # rerun마다 react-markdown이 파싱할 raw HTML 블록이 하나 줄어듭니다.
     current_persona = st.session_state.get('selected_persona', ViewerPersona.INTERMEDIATE)
-    info = PERSONA_INFO.get(current_persona, {})
+    icon, name, description, content_tips, _label = _PERSONA_ROWS[current_persona]
 
-    st.markdown(f"""
-    <div style="padding: 15px; background: #1a1a2e; border-radius: 10px; margin-top: 15px;">
-        <h4 style="color: #4fc3f7; margin: 0;">{info.get('icon', '')} 선택된 타겟: {info.get('name', '')}</h4>
-        <p style="color: #ffffff88; margin: 5px 0 0 0;">{info.get('description', '')}</p>
-        <p style="color: #ffd700; margin: 5px 0 0 0;">💡 {info.get('content_tips', '')}</p>
-    </div>
-    """, unsafe_allow_html=True)
+    with st.container(border=True):
+        st.markdown(f"#### {icon} 선택된 타겟: {name}")
+        st.caption(description)
+        st.markdown(f":orange[💡 {content_tips}]")
 
     return current_persona
 
@@ -225,15 +318,12 @@ def render_content_type_selector() -> ContentType:
     cols = st.columns(3)
     selected_type = None
 
-    content_types = list(CONTENT_TYPE_INFO.keys())
-
-    for i, content_type in enumerate(content_types):
-        info = CONTENT_TYPE_INFO.get(content_type, {})
-        col_idx = i % 3
+    for i, (content_type, row) in enumerate(_CONTENT_TYPE_ROWS.items()):
+        _icon, _name, _duration, _description, label = row
 
-        with cols[col_idx]:
+        with cols[i % 3]:
             if st.button(
-                f"{info.get('icon', '📺')}\n{info.get('name', '')}\n({info.get('duration', '')})",
+                label,
                 key=f"content_type_{content_type.value}",
                 use_container_width=True,
             ):
@@ -241,9 +331,9 @@ def render_content_type_selector() -> ContentType:
                 selected_type = content_type
 
     current_type = st.session_state.get('selected_content_type', ContentType.AI_BATTLE_FULL)
-    info = CONTENT_TYPE_INFO.get(current_type, {})
+    _icon, name, _duration, description, _label = _CONTENT_TYPE_ROWS[current_type]
 
-    st.info(f"**{info.get('name', '')}**: {info.get('description', '')}")
+    st.info(f"**{name}**: {description}")
 
     return current_type
 
@@ -252,28 +342,17 @@ def render_content_package_preview(package: YouTubeContentPackage):
     """콘텐츠 패키지 미리보기."""
     st.markdown("## 🎬 생성된 콘텐츠 패키지")
 
-    # 탭 구성
-    tabs = st.tabs(["📝 제목/썸네일", "📜 스크립트", "🎨 시각자료", "📊 SEO", "📤 내보내기"])
-
-    # 제목/썸네일 탭
-    with tabs[0]:
-        render_title_thumbnail_tab(package)
-
-    # 스크립트 탭
-    with tabs[1]:
-        render_script_tab(package)
-
-    # 시각자료 탭
-    with tabs[2]:
-        render_visual_assets_tab(package)
-
-    # SEO 탭
-    with tabs[3]:
-        render_seo_tab(package)
-
-    # 내보내기 탭
-    with tabs[4]:
-        render_export_tab(package)
+    # st.tabs는 보이지 않는 탭의 본문까지 전부 실행하므로, radio로 활성
+    # 섹션 하나만 골라 해당 렌더 함수만 호출합니다. 썸네일 iframe과
+    # base64 HTML 생성이 안 보이는 탭에서 반복되는 것을 막습니다.
+    selected = st.radio(
+        "미리보기 섹션",
+        options=list(_PREVIEW_SECTIONS),
+        horizontal=True,
+        key="active_preview_tab",
+        label_visibility="collapsed",
+    )
+    _PREVIEW_SECTIONS[selected](package)
 
 
 def render_title_thumbnail_tab(package: YouTubeContentPackage):
@@ -281,38 +360,29 @@ def render_title_thumbnail_tab(package: YouTubeContentPackage):
     st.markdown("### 🏷️ 제목 옵션 (A/B 테스트용)")
 
     for i, title_opt in enumerate(package.title_options, 1):
-        style_badge = {
-            "curiosity": "🤔 호기심",
-            "urgent": "🚨 긴급",
-            "value": "💎 가치",
-            "emotional": "💓 감정",
-            "contrarian": "🔄 역발상",
-        }.get(title_opt.get('style', ''), '📺')
-
-        st.markdown(f"""
-        <div style="padding: 15px; background: #1a1a2e; border-radius: 10px; margin-bottom: 10px;">
-            <span style="background: #4fc3f7; color: #000; padding: 3px 8px; border-radius: 5px; font-size: 12px;">{style_badge}</span>
-            <h3 style="color: #ffffff; margin: 10px 0 5px 0;">{title_opt.get('title', '')}</h3>
-            <p style="color: #ffffff66; margin: 0; font-size: 14px;">후킹 포인트: {title_opt.get('hook_element', '')}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        style_badge = _STYLE_BADGE.get(title_opt.style, '📺')
 
-    st.markdown("### 🖼️ 썸네일 미리보기")
+        with st.container(border=True):
+            st.caption(style_badge)
+            st.subheader(title_opt.title)
+            st.caption(f"후킹 포인트: {title_opt.hook_element}")
 
-    thumbnail_generator = ThumbnailGenerator()
+    st.markdown("### 🖼️ 썸네일 미리보기")
 
     for i, spec in enumerate(package.thumbnail_specs, 1):
         with st.expander(f"썸네일 옵션 {i}: {spec.style} 스타일"):
-            # 썸네일 HTML 생성 및 표시
-            additional_data = {
-                "ticker": package.ticker,
-                "target_price": "₩90,000",  # 예시
-                "price_info": "+15.5%",
-                "human_info": "목표가 ₩85,000",
-                "ai_info": "목표가 ₩95,000",
-            }
-
-            html = thumbnail_generator.generate_thumbnail_html(spec, additional_data)
+            # 썸네일 HTML 생성 및 표시 (사양이 같으면 캐시 재사용)
+            html = _thumbnail_html(
+                spec.headline,
+                spec.sub_headline,
+                spec.style,
+                spec.color_scheme,
+                tuple(
+                    (te.get("position", ""), te.get("text", ""))
+                    for te in spec.text_elements
+                ),
+                package.ticker,
+            )
 
             # 스케일 다운하여 표시 (iframe으로 렌더링)
             scaled_html = f"""
@@ -354,29 +424,19 @@ def render_script_tab(package: YouTubeContentPackage):
 
     st.markdown(f"### 📜 {script.title}")
     st.markdown(f"**설명:** {script.description}")
-    st.markdown(f"**총 길이:** {script.total_duration_seconds // 60}분 {script.total_duration_seconds % 60}초")
+    st.markdown(f"**총 길이:** {script.duration_label}")
 
     # 타임스탬프
     if script.key_timestamps:
         st.markdown("#### ⏱️ 타임스탬프")
-        timestamps_text = "\n".join([f"{ts['time']} - {ts['label']}" for ts in script.key_timestamps])
+        timestamps_text = "\n".join(f"{ts.time} - {ts.label}" for ts in script.key_timestamps)
         st.code(timestamps_text)
 
     # 섹션별 스크립트
     st.markdown("#### 📝 섹션별 스크립트")
 
     for i, section in enumerate(script.sections, 1):
-        section_icon = {
-            "hook": "🪝",
-            "intro": "👋",
-            "context": "📋",
-            "main_content": "📺",
-            "debate": "⚔️",
-            "reaction": "😮",
-            "summary": "📊",
-            "cta": "📢",
-            "outro": "👋",
-        }.get(section.section_type, "📝")
+        section_icon = _SECTION_ICON.get(section.section_type, "📝")
 
         with st.expander(f"{section_icon} {section.section_type.upper()} ({section.duration_seconds}초)"):
             st.markdown("**대본:**")
@@ -425,14 +485,9 @@ def render_visual_assets_tab(package: YouTubeContentPackage):
         st.markdown("### ✂️ 하이라이트 클립 (숏폼용)")
 
         for clip in package.highlight_clips:
-            shorts_badge = "📱 Shorts 가능" if clip.get('for_shorts') else ""
-            st.markdown(f"""
-            <div style="padding: 10px; background: #1a1a2e; border-radius: 8px; margin-bottom: 8px;">
-                <strong>{clip.get('title', '')}</strong> {shorts_badge}
-                <br/>
-                <span style="color: #888;">⏱️ {clip.get('start', 0)//60}:{clip.get('start', 0)%60:02d} - {clip.get('end', 0)//60}:{clip.get('end', 0)%60:02d}</span>
-            </div>
-            """, unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown(f"**{clip.title}**{clip.shorts_badge}")
+                st.caption(f"⏱️ {clip.start_mmss} - {clip.end_mmss}")
 
 
 def render_seo_tab(package: YouTubeContentPackage):
@@ -485,17 +540,23 @@ def render_export_tab(package: YouTubeContentPackage):
     if package.full_script:
         st.markdown("#### 📝 스크립트 (TXT)")
 
-        script_text = f"# {package.full_script.title}\n\n"
-        script_text += f"설명: {package.full_script.description}\n"
-        script_text += f"태그: {', '.join(package.full_script.tags)}\n\n"
-        script_text += "---\n\n"
+        # += 누적은 매번 커진 문자열을 통째로 복사합니다(O(n^2)).
+        # 조각을 모아 한 번에 join하면 섹션 수에 비례하는 복사로 끝납니다.
+        parts = [
+            f"# {package.full_script.title}\n\n",
+            f"설명: {package.full_script.description}\n",
+            f"태그: {', '.join(package.full_script.tags)}\n\n",
+            "---\n\n",
+        ]
 
         for section in package.full_script.sections:
-            script_text += f"## [{section.section_type.upper()}] ({section.duration_seconds}초)\n\n"
-            script_text += f"{section.script_text}\n\n"
+            parts.append(f"## [{section.section_type.upper()}] ({section.duration_seconds}초)\n\n")
+            parts.append(f"{section.script_text}\n\n")
             if section.visual_direction:
-                script_text += f"[연출] {section.visual_direction}\n\n"
-            script_text += "---\n\n"
+                parts.append(f"[연출] {section.visual_direction}\n\n")
+            parts.append("---\n\n")
+
+        script_text = "".join(parts)
 
         st.download_button(
             label="📥 스크립트 다운로드",
@@ -506,10 +567,21 @@ def render_export_tab(package: YouTubeContentPackage):
 
     # 제목 옵션
     st.markdown("#### 🏷️ 제목 옵션 (복사용)")
-    titles_text = "\n".join([f"- {t.get('title', '')}" for t in package.title_options])
+    titles_text = "\n".join(f"- {t.title}" for t in package.title_options)
     st.text_area("제목들", value=titles_text, height=150)
 
 
+# 미리보기 섹션 이름 → 렌더 함수. render_content_package_preview가
+# 활성 섹션 하나만 디스패치할 때 사용합니다.
+_PREVIEW_SECTIONS = {
+    "📝 제목/썸네일": render_title_thumbnail_tab,
+    "📜 스크립트": render_script_tab,
+    "🎨 시각자료": render_visual_assets_tab,
+    "📊 SEO": render_seo_tab,
+    "📤 내보내기": render_export_tab,
+}
+
+
 def render_quick_content_generator():
     """빠른 콘텐츠 생성 (데모용)."""
     st.markdown("### ⚡ 빠른 콘텐츠 생성")
@@ -554,17 +626,13 @@ def create_demo_package(
     content_type: ContentType,
 ) -> YouTubeContentPackage:
     """데모 패키지 생성."""
-    from models.youtube_content import (
-        ThumbnailSpec, ScriptSection, FullScript, VisualAsset
-    )
-
     persona_info = PERSONA_INFO.get(persona, {})
 
     # 제목 옵션
     title_options = [
-        {"title": f"🤖 AI가 분석한 {company_name}, 결과가 충격적입니다", "style": "curiosity", "hook_element": "충격적인 결과"},
-        {"title": f"[긴급] {company_name} AI 투자위원회 판결 공개!", "style": "urgent", "hook_element": "긴급성"},
-        {"title": f"{company_name} {recommendation} vs AI 의견 대결 결과", "style": "contrarian", "hook_element": "대결"},
+        TitleOption(title=f"🤖 AI가 분석한 {company_name}, 결과가 충격적입니다", style="curiosity", hook_element="충격적인 결과"),
+        TitleOption(title=f"[긴급] {company_name} AI 투자위원회 판결 공개!", style="urgent", hook_element="긴급성"),
+        TitleOption(title=f"{company_name} {recommendation} vs AI 의견 대결 결과", style="contrarian", hook_element="대결"),
     ]
 
     # 썸네일
@@ -639,10 +707,10 @@ def create_demo_package(
             ),
         ],
         key_timestamps=[
-            {"time": "0:00", "label": "AI 분석 티저"},
-            {"time": "0:30", "label": "분석 시작"},
-            {"time": "5:30", "label": "AI 토론"},
-            {"time": "10:30", "label": "최종 결론"},
+            KeyTimestamp(time="0:00", label="AI 분석 티저"),
+            KeyTimestamp(time="0:30", label="분석 시작"),
+            KeyTimestamp(time="5:30", label="AI 토론"),
+            KeyTimestamp(time="10:30", label="최종 결론"),
         ],
     )
 
@@ -683,8 +751,8 @@ def create_demo_package(
         full_script=full_script,
         visual_assets=visual_assets,
         highlight_clips=[
-            {"start": 330, "end": 390, "title": "AI 토론 하이라이트", "for_shorts": True},
-            {"start": 630, "end": 690, "title": "최종 결론", "for_shorts": True},
+            HighlightClip(start=330, end=390, title="AI 토론 하이라이트", for_shorts=True),
+            HighlightClip(start=630, end=690, title="최종 결론", for_shorts=True),
         ],
         community_post={
             "text": f"🤖 {company_name} AI 분석 결과 공개!\n\nAI 투자위원회가 내린 결론은?",
@@ -705,14 +773,18 @@ def render_youtube_studio_main():
         persona = render_persona_selector()
         content_type = render_content_type_selector()
 
-    # 메인 영역
-    tab1, tab2 = st.tabs(["🎬 콘텐츠 생성", "📦 생성된 패키지"])
+    # 메인 영역: 위와 같은 이유로 탭 대신 radio로 한쪽만 실행합니다.
+    selected = st.radio(
+        "스튜디오 섹션",
+        options=("🎬 콘텐츠 생성", "📦 생성된 패키지"),
+        horizontal=True,
+        key="yt_studio_tab",
+        label_visibility="collapsed",
+    )
 
-    with tab1:
+    if selected == "🎬 콘텐츠 생성":
         render_quick_content_generator()
-
-    with tab2:
-        if 'generated_package' in st.session_state:
-            render_content_package_preview(st.session_state.generated_package)
-        else:
-            st.info("아직 생성된 콘텐츠가 없습니다. '콘텐츠 생성' 탭에서 시작하세요.")
+    elif 'generated_package' in st.session_state:
+        render_content_package_preview(st.session_state.generated_package)
+    else:
+        st.info("아직 생성된 콘텐츠가 없습니다. '콘텐츠 생성' 탭에서 시작하세요.")
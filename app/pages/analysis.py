@@ -2,7 +2,6 @@
 import asyncio
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 import sys
 from pathlib import Path
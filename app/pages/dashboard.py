@@ -1,7 +1,6 @@
 """Dashboard page for Fundamental Analysis app."""
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
 import sys
 from pathlib import Path
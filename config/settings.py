@@ -36,6 +36,7 @@ class Settings(BaseSettings):
     )
 
     # Agent Settings
+    max_concurrency: int = Field(default=5, description="Max concurrent LLM calls")
     debate_rounds: int = Field(default=3, description="Number of debate rounds")
     max_agent_iterations: int = Field(default=10, description="Max iterations per agent")
     agent_timeout_seconds: int = Field(default=300, description="Agent timeout in seconds")
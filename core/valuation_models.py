@@ -2,6 +2,7 @@
 import logging
 from typing import Any, Optional
 
+import cachetools.func
 import yfinance as yf
 import numpy as np
 
@@ -462,9 +463,13 @@ class RelativeValuationModel:
         }
 
 
+@cachetools.func.ttl_cache(maxsize=256, ttl=180)
 def get_comprehensive_valuation(ticker: str) -> dict[str, Any]:
     """Get comprehensive valuation analysis.
 
+    Cached per ticker for 3 minutes so repeated runs within a session
+    (e.g. a debate re-consulting valuation) reuse the fetched data.
+
     Args:
         ticker: Stock ticker symbol
 
@@ -5,6 +5,7 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from agents.base_agent import _sentiment_for_score
 from models.agent_opinion import (
     AgentOpinion,
     AgentType,
@@ -137,18 +138,23 @@ class DebateManager:
         counter_arguments = []
         responses = []
 
-        # Phase 1: Devil's Advocate challenges each opinion
-        for agent_type_str, opinion in current_opinions.items():
-            if agent_type_str == "devils_advocate":
-                continue
-
-            challenge = await self._generate_challenge(
+        # Phase 1: Devil's Advocate challenges each opinion (concurrently)
+        targets = [
+            opinion
+            for agent_type_str, opinion in current_opinions.items()
+            if agent_type_str != "devils_advocate"
+        ]
+        challenges = await asyncio.gather(*(
+            self._generate_challenge(
                 devils_advocate=devils_advocate,
                 target_opinion=opinion,
                 round_num=round_num,
                 stock_context=stock_context,
             )
+            for opinion in targets
+        ))
 
+        for opinion, challenge in zip(targets, challenges):
             if challenge:
                 counter_arguments.append(challenge)
 
@@ -162,19 +168,23 @@ class DebateManager:
                     round_number=round_num,
                 ))
 
-        # Phase 2: Agents defend their positions
-        for counter_arg in counter_arguments:
-            target_agent = self.agents.get(counter_arg.target_agent.value)
-            if not target_agent:
-                continue
-
-            response = await self._generate_defense(
-                agent=target_agent,
+        # Phase 2: Agents defend their positions (concurrently)
+        defendable = [
+            counter_arg
+            for counter_arg in counter_arguments
+            if self.agents.get(counter_arg.target_agent.value)
+        ]
+        defenses = await asyncio.gather(*(
+            self._generate_defense(
+                agent=self.agents[counter_arg.target_agent.value],
                 counter_argument=counter_arg,
                 original_opinion=current_opinions.get(counter_arg.target_agent.value),
                 stock_context=stock_context,
             )
+            for counter_arg in defendable
+        ))
 
+        for counter_arg, response in zip(defendable, defenses):
             if response:
                 responses.append(response)
 
@@ -336,8 +346,11 @@ class DebateManager:
             agent_key = response.agent_type.value
             if agent_key in updated and response.adjusted_score is not None:
                 original = updated[agent_key]
-                # Create updated opinion with adjusted score
-                updated[agent_key] = AgentOpinion(
+                # Create updated opinion with adjusted score. Every field
+                # comes from an already-validated model (AgentOpinion /
+                # DebateResponse with its ge/le bounds), so model_construct
+                # skips a redundant validation pass per agent per round.
+                updated[agent_key] = AgentOpinion.model_construct(
                     agent_type=original.agent_type,
                     ticker=original.ticker,
                     score=response.adjusted_score,
@@ -353,16 +366,7 @@ class DebateManager:
 
     def _adjust_sentiment(self, original: Sentiment, new_score: float) -> Sentiment:
         """Adjust sentiment based on new score."""
-        if new_score >= 8:
-            return Sentiment.VERY_BULLISH
-        elif new_score >= 6.5:
-            return Sentiment.BULLISH
-        elif new_score >= 4.5:
-            return Sentiment.NEUTRAL
-        elif new_score >= 3:
-            return Sentiment.BEARISH
-        else:
-            return Sentiment.VERY_BEARISH
+        return _sentiment_for_score(new_score)
 
     def _check_consensus(self, opinions: dict[str, AgentOpinion]) -> bool:
         """Check if agents have reached consensus."""
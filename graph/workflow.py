@@ -671,3 +671,25 @@ async def analyze_stock(ticker: str, **kwargs) -> dict[str, Any]:
 
     workflow = AnalysisWorkflow(config)
     return await workflow.run(request)
+
+
+def analyze_stock_sync(ticker: str, **kwargs) -> dict[str, Any]:
+    """동기 컨텍스트(CLI, Streamlit)에서 분석을 실행하는 진입점.
+
+    uvloop가 설치되어 있으면 libuv 기반 C 이벤트 루프로 실행합니다.
+    에이전트 팬아웃이 asyncio.gather에 크게 의존하므로, 소켓이 많은
+    구간에서 기본 셀렉터 루프보다 스케줄링 오버헤드가 낮습니다.
+    설치되어 있지 않으면 기본 asyncio 루프로 동작합니다.
+
+    Args:
+        ticker: 종목 티커
+        **kwargs: `analyze_stock`에 전달할 추가 파라미터
+
+    Returns:
+        분석 결과
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(analyze_stock(ticker, **kwargs))
+    return uvloop.run(analyze_stock(ticker, **kwargs))
@@ -14,6 +14,19 @@ class Sentiment(str, Enum):
     BEARISH = "bearish"
     VERY_BEARISH = "very_bearish"
 
+    @classmethod
+    def from_str(cls, value: object) -> "Sentiment":
+        """Map a loosely-typed LLM value to a Sentiment (NEUTRAL on unknown)."""
+        if isinstance(value, cls):
+            return value
+        # Exact match first: LLM outputs are usually already lowercase,
+        # which skips the .lower() allocation on the hot path.
+        if isinstance(value, str):
+            member = cls._value2member_map_.get(value)
+            if member is not None:
+                return member
+        return cls._value2member_map_.get(str(value).lower(), cls.NEUTRAL)
+
 
 class RiskLevel(str, Enum):
     """Risk level enumeration."""
@@ -22,6 +35,17 @@ class RiskLevel(str, Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+    @classmethod
+    def from_str(cls, value: object) -> "RiskLevel":
+        """Map a loosely-typed LLM value to a RiskLevel (MEDIUM on unknown)."""
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            member = cls._value2member_map_.get(value)
+            if member is not None:
+                return member
+        return cls._value2member_map_.get(str(value).lower(), cls.MEDIUM)
+
 
 class MoatStrength(str, Enum):
     """Moat strength enumeration."""
@@ -2,13 +2,16 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from models.agent_opinion import MoatStrength, RiskLevel, Sentiment
 
 
 class MacroAnalysis(BaseModel):
     """Macro environment analysis result."""
+    # Built once per analyze() and immediately dumped; freezing documents
+    # that and lets Pydantic skip mutation bookkeeping
+    model_config = ConfigDict(frozen=True)
     # Overall assessment
     score: float = Field(..., ge=1, le=10, description="Macro environment score")
     sentiment: Sentiment = Field(..., description="Macro sentiment")
@@ -41,6 +44,9 @@ class MacroAnalysis(BaseModel):
 
 class QuantAnalysis(BaseModel):
     """Quantitative financial analysis result."""
+    # Built once per analyze() and immediately dumped; freezing documents
+    # that and lets Pydantic skip mutation bookkeeping
+    model_config = ConfigDict(frozen=True)
     # Overall assessment
     score: float = Field(..., ge=1, le=10, description="Financial health score")
     sentiment: Sentiment = Field(..., description="Financial sentiment")
@@ -196,6 +202,9 @@ class IndustryAnalysis(BaseModel):
 
 class ValuationScenario(BaseModel):
     """Valuation scenario (bear/base/bull)."""
+    # Built once per analyze() and immediately dumped; freezing documents
+    # that and lets Pydantic skip mutation bookkeeping
+    model_config = ConfigDict(frozen=True)
     name: str = Field(..., description="Scenario name")
     probability: float = Field(..., ge=0, le=100, description="Probability (%)")
     target_price: float = Field(..., description="Target price")
@@ -205,6 +214,9 @@ class ValuationScenario(BaseModel):
 
 class ValuationAnalysis(BaseModel):
     """Valuation analysis result."""
+    # Built once per analyze() and immediately dumped; freezing documents
+    # that and lets Pydantic skip mutation bookkeeping
+    model_config = ConfigDict(frozen=True)
     # Overall assessment
     score: float = Field(..., ge=1, le=10, description="Valuation attractiveness score")
     sentiment: Sentiment = Field(..., description="Valuation sentiment")
@@ -4,6 +4,7 @@
 """
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 from uuid import uuid4
 from pydantic import BaseModel, Field
@@ -205,6 +206,52 @@ class ScriptSection(BaseModel):
     )
 
 
+class TitleOption(BaseModel):
+    """제목 옵션 (A/B 테스트용).
+
+    UI가 항목마다 dict 해시 조회를 반복하지 않도록 dict 대신
+    속성 접근이 가능한 레코드로 고정합니다.
+    """
+
+    title: str = Field(..., description="제목")
+    style: str = Field(default="", description="제목 스타일")
+    hook_element: str = Field(default="", description="후킹 포인트")
+
+
+class KeyTimestamp(BaseModel):
+    """영상 주요 타임스탬프."""
+
+    time: str = Field(..., description="시각 (예: 0:00)")
+    label: str = Field(..., description="설명")
+
+
+class HighlightClip(BaseModel):
+    """하이라이트 클립 (숏폼 추출용)."""
+
+    start: int = Field(..., description="시작 시각 (초)")
+    end: int = Field(..., description="종료 시각 (초)")
+    title: str = Field(default="", description="클립 제목")
+    for_shorts: bool = Field(default=False, description="Shorts 적합 여부")
+    section_type: Optional[str] = Field(None, description="원본 섹션 유형")
+
+    # 표시용 파생 값은 클립당 한 번만 계산합니다. UI 루프가 rerun마다
+    # divmod와 조건 분기를 반복할 필요가 없습니다.
+    @cached_property
+    def start_mmss(self) -> str:
+        """시작 시각을 m:ss 문자열로."""
+        return f"{self.start // 60}:{self.start % 60:02d}"
+
+    @cached_property
+    def end_mmss(self) -> str:
+        """종료 시각을 m:ss 문자열로."""
+        return f"{self.end // 60}:{self.end % 60:02d}"
+
+    @cached_property
+    def shorts_badge(self) -> str:
+        """Shorts 적합 클립에 붙는 배지 (아니면 빈 문자열)."""
+        return " 📱 Shorts 가능" if self.for_shorts else ""
+
+
 class FullScript(BaseModel):
     """전체 스크립트."""
 
@@ -219,7 +266,7 @@ class FullScript(BaseModel):
         description="스크립트 섹션들"
     )
 
-    key_timestamps: list[dict] = Field(
+    key_timestamps: list[KeyTimestamp] = Field(
         default_factory=list,
         description="주요 타임스탬프",
         example=[
@@ -234,6 +281,12 @@ class FullScript(BaseModel):
         description="엔드스크린 추천 영상"
     )
 
+    @cached_property
+    def duration_label(self) -> str:
+        """총 길이를 "m분 s초" 문자열로 (한 번만 계산)."""
+        minutes, seconds = divmod(self.total_duration_seconds, 60)
+        return f"{minutes}분 {seconds}초"
+
 
 class VisualAsset(BaseModel):
     """시각 자료."""
@@ -274,7 +327,7 @@ class YouTubeContentPackage(BaseModel):
     company_name: str = Field(..., description="회사명")
 
     # 제목 옵션들
-    title_options: list[dict] = Field(
+    title_options: list[TitleOption] = Field(
         default_factory=list,
         description="제목 옵션들 (A/B 테스트용)",
         example=[
@@ -300,7 +353,7 @@ class YouTubeContentPackage(BaseModel):
     )
 
     # 하이라이트 클립
-    highlight_clips: list[dict] = Field(
+    highlight_clips: list[HighlightClip] = Field(
         default_factory=list,
         description="하이라이트 클립 정보",
         example=[
@@ -3,6 +3,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
+import cachetools.func
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
 
@@ -304,9 +305,14 @@ def get_economic_indicators(
         return {"error": str(e)}
 
 
+@cachetools.func.ttl_cache(maxsize=1, ttl=900)
 def get_macro_environment_summary() -> dict[str, Any]:
     """Get comprehensive macro environment summary (non-tool function).
 
+    Cached for 15 minutes: the macro environment is identical for every
+    ticker, so analyzing a basket reuses one fetch instead of hitting the
+    external APIs per stock.
+
     Returns:
         Dictionary with macro environment assessment
     """
@@ -3,6 +3,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Any, Optional
 
+import cachetools.func
 import yfinance as yf
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
@@ -77,9 +78,13 @@ class StockInfoInput(BaseModel):
 
 
 @tool(args_schema=StockInfoInput)
+@cachetools.func.ttl_cache(maxsize=256, ttl=180)
 def get_stock_info(ticker: str) -> dict[str, Any]:
     """Get comprehensive stock information including price and fundamental data.
 
+    Cached per ticker for 3 minutes: several agents request the same
+    stock info during one analysis run.
+
     Args:
         ticker: Stock ticker symbol
 